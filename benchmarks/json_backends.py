@@ -0,0 +1,111 @@
+"""
+Compares decode throughput and peak memory of available JSON backends
+
+Usage: python benchmarks/json_backends.py [number of items]
+
+Synthetic COUNTER 5 and COUNTER 5.1 title reports are generated in the memory.
+Report_Items are decoded by the backends alone and by JsonCounter5SheetReader,
+which also validates the report using nigiri and stores decoded items in a spill file.
+"""
+
+import io
+import json
+import sys
+import time
+import tracemalloc
+
+import ijson
+
+from celus_nibbler.reader import JSON_BACKENDS, JsonCounter5SheetReader, default_json_backend
+
+MONTHS = [f"2020-{month:02d}" for month in range(1, 13)]
+METRICS = ["Total_Item_Requests", "Unique_Item_Requests", "Unique_Title_Requests"]
+
+
+def c5_item(idx: int) -> dict:
+    return {
+        "Title": f"Title {idx}",
+        "Item_ID": [{"Type": "DOI", "Value": f"10.1000/{idx}"}],
+        "Platform": "Platform",
+        "Publisher": "Publisher",
+        "Data_Type": "Journal",
+        "Access_Type": "Controlled",
+        "Access_Method": "Regular",
+        "Performance": [
+            {
+                "Period": {"Begin_Date": f"{month}-01", "End_Date": f"{month}-28"},
+                "Instance": [{"Metric_Type": metric, "Count": idx % 97} for metric in METRICS],
+            }
+            for month in MONTHS
+        ],
+    }
+
+
+def c51_item(idx: int) -> dict:
+    return {
+        "Title": f"Title {idx}",
+        "Item_ID": {"DOI": f"10.1000/{idx}"},
+        "Platform": "Platform",
+        "Publisher": "Publisher",
+        "Attribute_Performance": [
+            {
+                "Data_Type": "Journal",
+                "Access_Type": "Controlled",
+                "Access_Method": "Regular",
+                "Performance": {
+                    metric: {month: idx % 97 for month in MONTHS} for metric in METRICS
+                },
+            }
+        ],
+    }
+
+
+def report(release: str, item_count: int) -> bytes:
+    item = c51_item if release == "5.1" else c5_item
+    header = {"Release": release, "Report_ID": "TR", "Report_Name": "Title Report"}
+    items = [item(idx) for idx in range(item_count)]
+    return json.dumps({"Report_Header": header, "Report_Items": items}).encode()
+
+
+def decode(backend: str, data: bytes) -> int:
+    return sum(1 for _ in JSON_BACKENDS[backend](io.BytesIO(data)))
+
+
+def read(backend: str, data: bytes) -> int:
+    reader = JsonCounter5SheetReader(io.BytesIO(data), json_backend=backend)
+    count = len(reader)
+    reader.close()
+    return count
+
+
+def measure(func, backend: str, data: bytes):
+    start = time.perf_counter()
+    count = func(backend, data)
+    duration = time.perf_counter() - start
+
+    # tracing slows down the decoding, so the memory is measured separately
+    tracemalloc.start()
+    func(backend, data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, duration, peak
+
+
+def main():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"ijson backend: {ijson.backend}, default: {default_json_backend()}")
+    print("\t".join(["release", "backend", "method", "items", "MB/s", "peak MB"]))
+    for release in ["5", "5.1"]:
+        data = report(release, item_count)
+        for backend in JSON_BACKENDS:
+            for func in [decode, read]:
+                count, duration, peak = measure(func, backend, data)
+                throughput = len(data) / duration / 2**20
+                print(
+                    f"{release}\t{backend}\t{func.__name__}\t{count}"
+                    f"\t{throughput:.1f}\t{peak / 2**20:.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
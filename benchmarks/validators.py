@@ -0,0 +1,108 @@
+"""
+Compares fast validators with validation done by pydantic models
+
+Usage: python benchmarks/validators.py [max rows per sheet]
+
+Cells of all files from `tests/data` are validated by every validator both ways.
+Outputs have to be the same, the script fails when any of them differs.
+Durations are measured only for valid cells, invalid ones are validated by the models anyway.
+"""
+
+import pathlib
+import sys
+import time
+
+from celus_nibbler import validators
+from celus_nibbler.eat_and_poop import read_file
+
+VALIDATORS = [
+    *(e for e in validators.validators if e is not validators.BaseValueModel),
+    validators.gen_default_validator(validators.Value, 0, ("", "-")),
+    validators.gen_date_format_validator("%b %Y"),
+]
+
+
+def json_values(data):
+    if isinstance(data, dict):
+        for value in data.values():
+            yield from json_values(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from json_values(value)
+    else:
+        yield data
+
+
+def cells(path: pathlib.Path, max_rows: int) -> list:
+    res = []
+    try:
+        reader = read_file(path, typed_cells=True)
+        for sheet in reader:
+            for idx, row in enumerate(sheet):
+                if idx >= max_rows:
+                    break
+                res.extend(json_values(row) if isinstance(row, dict) else row)
+    except Exception:
+        # unsupported and broken files are part of the test data
+        pass
+    return res
+
+
+def model_outcome(validator, value):
+    try:
+        res = validator(value=value).value
+        return "ok", res, type(res)
+    except Exception as e:
+        return "error", type(e)
+
+
+def fast_outcome(validator, value):
+    try:
+        res = validators.validate(validator, value)
+        return "ok", res, type(res)
+    except Exception as e:
+        return "error", type(e)
+
+
+def measure(outcome, validator, values: list) -> float:
+    start = time.perf_counter()
+    for value in values:
+        outcome(validator, value)
+    return time.perf_counter() - start
+
+
+def main():
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    paths = sorted((pathlib.Path(__file__).parent.parent / "tests" / "data").glob("**/*.*"))
+    values = [cell for path in paths for cell in cells(path, max_rows)]
+    print(f"files: {len(paths)}, cells: {len(values)}")
+
+    differences = 0
+    print("\t".join(["validator", "valid", "differences", "model s", "fast s", "speedup"]))
+    for validator in VALIDATORS:
+        different, valid = [], []
+        for value in values:
+            outcome = model_outcome(validator, value)
+            if outcome != fast_outcome(validator, value):
+                different.append(value)
+            elif outcome[0] == "ok":
+                valid.append(value)
+        differences += len(different)
+
+        model = measure(model_outcome, validator, valid)
+        fast = measure(fast_outcome, validator, valid)
+        speedup = model / fast if fast else 0
+        print(
+            f"{validator.name}\t{len(valid)}\t{len(different)}"
+            f"\t{model:.3f}\t{fast:.3f}\t{speedup:.1f}"
+        )
+        for value in different[:5]:
+            model, fast = model_outcome(validator, value), fast_outcome(validator, value)
+            print(f"\t{value!r}: {model} != {fast}")
+
+    if differences:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
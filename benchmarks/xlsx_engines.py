@@ -0,0 +1,41 @@
+"""
+Compares time needed to convert xlsx files by available xlsx engines
+
+Usage: python benchmarks/xlsx_engines.py [file.xlsx ...]
+
+When no file is passed, xlsx files from `tests/data` are used.
+"""
+
+import pathlib
+import sys
+import time
+
+from celus_nibbler.eat_and_poop import XLSX_ENGINES
+
+
+def convert(engine: str, path: pathlib.Path) -> float:
+    start = time.perf_counter()
+    reader = XLSX_ENGINES[engine](path)
+    for sheet in reader:
+        sheet.close()
+    return time.perf_counter() - start
+
+
+def main():
+    paths = [pathlib.Path(e) for e in sys.argv[1:]] or sorted(
+        (pathlib.Path(__file__).parent.parent / "tests" / "data").glob("**/*.xlsx")
+    )
+
+    totals = {engine: 0.0 for engine in XLSX_ENGINES}
+    print("\t".join(["file", *XLSX_ENGINES]))
+    for path in paths:
+        durations = [convert(engine, path) for engine in XLSX_ENGINES]
+        for engine, duration in zip(XLSX_ENGINES, durations):
+            totals[engine] += duration
+        print("\t".join([path.name, *(f"{e:.3f}" for e in durations)]))
+
+    print("\t".join(["total", *(f"{e:.3f}" for e in totals.values())]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
-from .eat_and_poop import Poop, PoopOrganizationStats, PoopStats, eat
+from .eat_and_poop import Poop, PoopOrganizationStats, PoopStats, eat, eat_archive, eat_data
 from .errors import (
+    ArchiveMemberError,
     MultipleParsersFound,
     NibblerError,
     NoParserForPlatformFound,
@@ -13,10 +14,13 @@ from .parsers import get_supported_platforms
 
 __all__ = [
     "eat",
+    "eat_archive",
+    "eat_data",
     "get_supported_platforms",
     "Poop",
     "PoopStats",
     "PoopOrganizationStats",
+    "ArchiveMemberError",
     "MultipleParsersFound",
     "NibblerError",
     "NoParserFound",
@@ -14,11 +14,13 @@ from importlib.metadata import distribution
 from celus_nigiri import CounterRecord
 from unidecode import unidecode
 
-from celus_nibbler import Poop, eat
+from celus_nibbler import Poop, eat, eat_data
 from celus_nibbler.aggregator import CounterOrdering
 from celus_nibbler.definitions import Definition
+from celus_nibbler.eat_and_poop import FILE_FORMATS, XLSX_ENGINES
 from celus_nibbler.parsers import available_parsers
 from celus_nibbler.parsers.dynamic import gen_parser
+from celus_nibbler.reader import JSON_BACKENDS
 from celus_nibbler.utils import profile
 
 
@@ -119,7 +121,33 @@ def gen_argument_parser(parsers: typing.List[str]) -> argparse.ArgumentParser:
         default=False,
         help="Parses the entire file without producing any data output (useful for benchmarks)",
     )
-    parser.add_argument("file", nargs="*")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes used to convert sheets of xlsx/xls files and COUNTER JSON items",
+    )
+    parser.add_argument(
+        "--xlsx-engine",
+        choices=list(XLSX_ENGINES),
+        default="openpyxl",
+        help="Reader used for xlsx files",
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=list(JSON_BACKENDS),
+        default=None,
+        help="Backend used to decode COUNTER JSON files (the fastest one by default)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(set(FILE_FORMATS.values())),
+        default=None,
+        help="Format of data read from the standard input (detected from the data by default)",
+    )
+    parser.add_argument("file", nargs="*", help="files to be parsed, '-' reads the standard input")
     parser.add_argument("--profile", dest="profile", action="store_true", default=False)
 
     return parser
@@ -127,14 +155,24 @@ def gen_argument_parser(parsers: typing.List[str]) -> argparse.ArgumentParser:
 
 def parse(options, platform, dynamic_parsers):
     for file in options.file:
-        if poops := eat(
-            pathlib.Path(file),
-            platform or "void",
+        kwargs = dict(
             parsers=options.parser or None,
             check_platform=bool(platform),
             use_heuristics=not options.skip_heuristics,
             dynamic_parsers=dynamic_parsers,
-        ):
+            workers=options.workers,
+            xlsx_engine=options.xlsx_engine,
+            json_backend=options.json_backend,
+        )
+        if file == "-":
+            # data are parsed as they arrive
+            poops = eat_data(
+                sys.stdin.buffer, platform or "void", file_format=options.format, **kwargs
+            )
+        else:
+            poops = eat(pathlib.Path(file), platform or "void", **kwargs)
+
+        if poops:
             for idx, poop in enumerate(poops):
                 if not isinstance(poop, Poop):
                     print(f"Failed to pick parser for sheet {idx}", file=sys.stderr)
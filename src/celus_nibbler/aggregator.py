@@ -1,5 +1,6 @@
 import abc
 import copy
+import itertools
 import tempfile
 import typing
 from collections import deque
@@ -16,6 +17,7 @@ from celus_nibbler.errors import (
     NegativeValueInOutput,
     SameRecordsInOutput,
 )
+from celus_nibbler.utils import BATCH_SIZE
 
 
 class BaseAggregator(metaclass=abc.ABCMeta):
@@ -25,6 +27,13 @@ class BaseAggregator(metaclass=abc.ABCMeta):
     ) -> typing.Generator[CounterRecord, None, None]:
         pass
 
+    def aggregate_batches(
+        self, batches: typing.Iterable[typing.List[CounterRecord]]
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
+        """Same as `aggregate`, but records are passed in lists"""
+        records = self.aggregate(itertools.chain.from_iterable(batches))
+        return map(list, itertools.batched(records, BATCH_SIZE))
+
     def __or__(self, other):
         return PippedAggregator(self, other)
 
@@ -37,6 +46,43 @@ class NoAggregator(BaseAggregator):
     ) -> typing.Generator[CounterRecord, None, None]:
         yield from records
 
+    def aggregate_batches(
+        self, batches: typing.Iterable[typing.List[CounterRecord]]
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
+        yield from batches
+
+
+class CheckAggregator(BaseAggregator):
+    """Passes records which pass the check, an error is raised for the first one which doesn't"""
+
+    @abc.abstractmethod
+    def check(self, idx: int, record: CounterRecord):
+        """Raises an error when the record with given index doesn't pass the check"""
+        pass
+
+    def aggregate(
+        self, records: typing.Generator[CounterRecord, None, None]
+    ) -> typing.Generator[CounterRecord, None, None]:
+        for idx, record in enumerate(records):
+            self.check(idx, record)
+            yield record
+
+    def aggregate_batches(
+        self, batches: typing.Iterable[typing.List[CounterRecord]]
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
+        """Same as `aggregate`, records preceding the failing one are yielded before the error"""
+        idx = 0
+        for batch in batches:
+            for position, record in enumerate(batch):
+                try:
+                    self.check(idx + position, record)
+                except Exception:
+                    if position:
+                        yield batch[:position]
+                    raise
+            idx += len(batch)
+            yield batch
+
 
 class SameAggregator(BaseAggregator):
     """Aggregates the same records - sums values"""
@@ -64,7 +110,7 @@ class SameAggregator(BaseAggregator):
                     yield db[key]
 
 
-class CheckConflictingRecordsAggregator(BaseAggregator):
+class CheckConflictingRecordsAggregator(CheckAggregator):
     """
     Checks whether last n records doesn't contain same conflicting records e.g.
 
@@ -83,18 +129,12 @@ class CheckConflictingRecordsAggregator(BaseAggregator):
     def make_record_hash(record: CounterRecord):
         return hash(tuple(e for e in record.as_csv()[:-1]))  # skip value (last in csv)
 
-    def aggregate(
-        self, records: typing.Generator[CounterRecord, None, None]
-    ) -> typing.Generator[CounterRecord, None, None]:
-        idx = 0
-        for record in records:
-            hsh = self.make_record_hash(record)
-            for e in self.hash_buffer:
-                if e[0] == hsh:
-                    raise SameRecordsInOutput(e[1], idx, record)
-            self.hash_buffer.append((hsh, idx))
-            yield record
-            idx += 1
+    def check(self, idx: int, record: CounterRecord):
+        hsh = self.make_record_hash(record)
+        for e in self.hash_buffer:
+            if e[0] == hsh:
+                raise SameRecordsInOutput(e[1], idx, record)
+        self.hash_buffer.append((hsh, idx))
 
 
 class CounterOrdering(BaseAggregator):
@@ -142,18 +182,12 @@ class CounterOrdering(BaseAggregator):
                     yield from [record_dict[key] for key in sorted(record_dict.keys())]
 
 
-class CheckNonNegativeValues(BaseAggregator):
+class CheckNonNegativeValues(CheckAggregator):
     """Checks whether outout contains negative values and raises and error if so"""
 
-    def aggregate(
-        self, records: typing.Generator[CounterRecord, None, None]
-    ) -> typing.Generator[CounterRecord, None, None]:
-        idx = 0
-        for record in records:
-            if record.value < 0:
-                raise NegativeValueInOutput(idx, record)
-            yield record
-            idx += 1
+    def check(self, idx: int, record: CounterRecord):
+        if record.value < 0:
+            raise NegativeValueInOutput(idx, record)
 
 
 class PippedAggregator(BaseAggregator):
@@ -168,38 +202,33 @@ class PippedAggregator(BaseAggregator):
     ) -> typing.Generator[CounterRecord, None, None]:
         return self.a2.aggregate(self.a1.aggregate(records))
 
+    def aggregate_batches(
+        self, batches: typing.Iterable[typing.List[CounterRecord]]
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
+        return self.a2.aggregate_batches(self.a1.aggregate_batches(batches))
+
 
-class TitleCheckAggregator(BaseAggregator):
+class TitleCheckAggregator(CheckAggregator):
     def __init__(self, required: bool):
         self.required = required
 
-    def aggregate(
-        self, records: typing.Generator[CounterRecord, None, None]
-    ) -> typing.Generator[CounterRecord, None, None]:
-        for idx, record in enumerate(records):
-            if self.required:
-                if not record.title:
-                    raise MissingTitleInOutput(idx, record)
-            else:
-                if record.title:
-                    raise ExtraTitleInOutput(idx, record)
-
-            yield record
+    def check(self, idx: int, record: CounterRecord):
+        if self.required:
+            if not record.title:
+                raise MissingTitleInOutput(idx, record)
+        else:
+            if record.title:
+                raise ExtraTitleInOutput(idx, record)
 
 
-class ItemCheckAggregator(BaseAggregator):
+class ItemCheckAggregator(CheckAggregator):
     def __init__(self, required: bool):
         self.required = required
 
-    def aggregate(
-        self, records: typing.Generator[CounterRecord, None, None]
-    ) -> typing.Generator[CounterRecord, None, None]:
-        for idx, record in enumerate(records):
-            if self.required:
-                if not record.item:
-                    raise MissingItemInOutput(idx, record)
-            else:
-                if record.item:
-                    raise ExtraItemInOutput(idx, record)
-
-            yield record
+    def check(self, idx: int, record: CounterRecord):
+        if self.required:
+            if not record.item:
+                raise MissingItemInOutput(idx, record)
+        else:
+            if record.item:
+                raise ExtraItemInOutput(idx, record)
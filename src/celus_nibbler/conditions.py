@@ -10,7 +10,7 @@ from unidecode import unidecode
 from . import validators
 from .coordinates import Coord, CoordRange
 from .errors import TableException
-from .reader import SheetReader
+from .reader import SheetInfo, SheetReader
 from .utils import JsonEncorder, PydanticConfig
 
 stemmer = stem.PorterStemmer()
@@ -26,6 +26,13 @@ class BaseCondition(metaclass=ABCMeta):
     ) -> bool:
         pass
 
+    def check_sheet_info(self, sheet: SheetInfo) -> typing.Optional[bool]:
+        """Checks the condition only using sheet index, name and extra
+
+        :returns: `None` if the content of the sheet is required to decide
+        """
+        return None
+
 
 class ArithmeticsMixin:
     def __invert__(self):
@@ -52,6 +59,10 @@ class NegCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
     ) -> bool:
         return not self.cond.check(sheet, parser_row_offset, area_row_offset)
 
+    def check_sheet_info(self, sheet: SheetInfo) -> typing.Optional[bool]:
+        res = self.cond.check_sheet_info(sheet)
+        return None if res is None else not res
+
 
 @dataclass(config=PydanticConfig)
 class AndCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
@@ -67,6 +78,12 @@ class AndCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
     ) -> bool:
         return all(e.check(sheet, parser_row_offset, area_row_offset) for e in self.conds)
 
+    def check_sheet_info(self, sheet: SheetInfo) -> typing.Optional[bool]:
+        results = [e.check_sheet_info(sheet) for e in self.conds]
+        if False in results:
+            return False
+        return None if None in results else True
+
 
 @dataclass(config=PydanticConfig)
 class OrCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
@@ -82,6 +99,12 @@ class OrCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
     ) -> bool:
         return any(e.check(sheet, parser_row_offset, area_row_offset) for e in self.conds)
 
+    def check_sheet_info(self, sheet: SheetInfo) -> typing.Optional[bool]:
+        results = [e.check_sheet_info(sheet) for e in self.conds]
+        if True in results:
+            return True
+        return None if None in results else False
+
 
 @dataclass(config=PydanticConfig)
 class RegexCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
@@ -142,7 +165,7 @@ class IsDateCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
                 try:
                     content = c.content(sheet, parser_row_offset, area_row_offset)
                     content = content and content.strip()
-                    self.validator_class(value=content)
+                    validators.validate(self.validator_class, content)
                 except ValidationError:
                     continue
                 except (TableException, IndexError):
@@ -154,7 +177,7 @@ class IsDateCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
         try:
             content = coord.content(sheet, parser_row_offset, area_row_offset)
             content = content and content.strip()
-            self.validator_class(value=content)
+            validators.validate(self.validator_class, content)
         except (TableException, ValidationError, IndexError):
             return False
 
@@ -211,6 +234,9 @@ class SheetNameRegexCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
         parser_row_offset: typing.Optional[int] = None,
         area_row_offset: typing.Optional[int] = None,
     ) -> bool:
+        return self.check_sheet_info(sheet)
+
+    def check_sheet_info(self, sheet: typing.Union[SheetInfo, SheetReader]) -> bool:
         if sheet.name is not None:
             return bool(self.pattern.match(sheet.name))
         else:
@@ -232,6 +258,9 @@ class SheetIdxCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
         parser_row_offset: typing.Optional[int] = None,
         area_row_offset: typing.Optional[int] = None,
     ) -> bool:
+        return self.check_sheet_info(sheet)
+
+    def check_sheet_info(self, sheet: typing.Union[SheetInfo, SheetReader]) -> bool:
         if self.min is not None and sheet.sheet_idx < self.min:
             return False
 
@@ -256,6 +285,9 @@ class SheetExtraCondition(ArithmeticsMixin, BaseCondition, JsonEncorder):
         parser_row_offset: typing.Optional[int] = None,
         area_row_offset: typing.Optional[int] = None,
     ) -> bool:
+        return self.check_sheet_info(sheet)
+
+    def check_sheet_info(self, sheet: typing.Union[SheetInfo, SheetReader]) -> bool:
         if sheet.extra is None:
             return False
         if self.field_name in sheet.extra:
@@ -1,10 +1,16 @@
+import bz2
 import functools
+import gzip
 import itertools
 import logging
+import lzma
 import pathlib
 import typing
+import zipfile
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from io import BufferedReader, BytesIO
 
 from celus_nigiri import CounterRecord
 from pydantic import Field
@@ -14,6 +20,7 @@ from typing_extensions import Annotated
 from celus_nibbler.aggregator import CheckConflictingRecordsAggregator, CheckNonNegativeValues
 from celus_nibbler.data_headers import DataFormatDefinition
 from celus_nibbler.errors import (
+    ArchiveMemberError,
     MultipleParsersFound,
     NibblerError,
     NoParserForFileTypeFound,
@@ -24,12 +31,21 @@ from celus_nibbler.errors import (
 )
 from celus_nibbler.parsers import BaseParser, get_parsers
 from celus_nibbler.reader import (
+    FORMAT_DETECTION_SIZE,
+    MEMORY_MAP_SIZE,
+    BufferStream,
     CsvReader,
+    DetectionCache,
     JsonCounter5Reader,
+    JsonLinesCounter5Reader,
+    SheetInfo,
     SheetReader,
+    SpooledStream,
     TableReader,
     XlsReader,
     XlsxReader,
+    XlsxStreamReader,
+    detect_file_format,
 )
 from celus_nibbler.utils import JsonEncorder, PydanticConfig
 from celus_nibbler.validators import Platform
@@ -215,6 +231,7 @@ class Poop:
     def __init__(self, parser: BaseParser):
         self.parser = parser
         self.current_stats = PoopStats()
+        self.complete_stats: typing.Optional[PoopStats] = None  # stats of all records
         self.area_counter: Counter[int] = Counter()
         self.extras = parser.get_extras()
 
@@ -239,35 +256,76 @@ class Poop:
 
         return None
 
+    def batches_basic(
+        self,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Generator[typing.Tuple[int, typing.List[CounterRecord]], None, None]:
+        """Same as `records_basic`, but records of areas are yielded in lists"""
+        remaining = limit
+        if remaining is not None and remaining <= 0:
+            return
+
+        for idx, batch in self.parser.parse_batches():
+            if offset:
+                skipped = min(offset, len(batch))
+                batch = batch[skipped:]
+                offset -= skipped
+            if remaining is not None:
+                batch = batch[:remaining]
+                remaining -= len(batch)
+            if batch:
+                yield idx, batch
+            if remaining is not None and remaining <= 0:
+                return
+
+    def batches_with_counter(
+        self,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
+        self.area_counter = Counter()
+        for idx, batch in self.batches_basic(offset, limit):
+            self.area_counter[idx] += len(batch)
+            yield batch
+
     def records_with_counter(
         self,
         offset: int = 0,
         limit: typing.Optional[int] = None,
         same_check_size: int = 0,
     ) -> typing.Optional[typing.Generator[CounterRecord, None, None]]:
-        self.area_counter = Counter()
-        if counter_records := self.records_basic(offset, limit, same_check_size):
-            for idx, record in counter_records:
-                self.area_counter[idx] += 1
-                yield record
+        for batch in self.batches_with_counter(offset, limit):
+            yield from batch
         return None
 
-    def records(
+    def record_batches(
         self,
         offset: int = 0,
         limit: typing.Optional[int] = None,
         same_check_size: int = 0,
-    ) -> typing.Optional[typing.Generator[CounterRecord, None, None]]:
-        if counter_records := self.records_with_counter(offset, limit, same_check_size):
+    ) -> typing.Optional[typing.Generator[typing.List[CounterRecord], None, None]]:
+        """Same as `records`, but records are yielded in lists"""
+        if batches := self.batches_with_counter(offset, limit):
             aggregator = CheckNonNegativeValues()
             if same_check_size:
                 aggregator = aggregator | CheckConflictingRecordsAggregator(same_check_size)
 
-            return aggregator.aggregate(counter_records)
+            return aggregator.aggregate_batches(batches)
         else:
             logger.warning("sheet %s has not been parsed", self.parser.sheet.sheet_idx + 1)
             return None
 
+    def records(
+        self,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+        same_check_size: int = 0,
+    ) -> typing.Optional[typing.Generator[CounterRecord, None, None]]:
+        if batches := self.record_batches(offset, limit, same_check_size):
+            return itertools.chain.from_iterable(batches)
+        return None
+
     def records_with_stats(
         self,
         offset: int = 0,
@@ -275,10 +333,15 @@ class Poop:
         same_check_size: int = 0,
     ) -> typing.Optional[typing.Generator[CounterRecord, None, None]]:
         self.current_stats = PoopStats()
-        if records := self.records(offset, limit, same_check_size):
-            for record in records:
-                self.current_stats.process_record(record)
-                yield record
+        if batches := self.record_batches(offset, limit, same_check_size):
+            for batch in batches:
+                for record in batch:
+                    self.current_stats.process_record(record)
+                    yield record
+
+            if offset == 0 and limit is None:
+                # all records were processed => no need to go through them again
+                self.complete_stats = self.current_stats
 
         return None
 
@@ -305,6 +368,9 @@ class Poop:
     @functools.lru_cache
     def get_stats(self) -> PoopStats:
         """Goes through all records and caluculates stats based on output records"""
+        if self.complete_stats is not None:
+            return self.complete_stats
+
         res = PoopStats()
         if records := self.records():
             for record in records:
@@ -372,17 +438,236 @@ def findparser(
     return parser
 
 
-def read_file(file_path: pathlib.Path) -> TableReader:
-    if file_path.suffix.lower() in [".csv", ".tsv"]:
-        return CsvReader(file_path)
-    elif file_path.suffix.lower() == ".xlsx":
-        return XlsxReader(file_path)
-    elif XlsReader and file_path.suffix.lower() in [".xls", ".xlsb"]:
-        return XlsReader(file_path)
-    elif file_path.suffix.lower() == ".json":
-        return JsonCounter5Reader(file_path)
+def sheet_info_parsers(
+    sheet_info: SheetInfo,
+    platform: str,
+    parsers: typing.Optional[typing.List[str]] = None,
+    check_platform: bool = True,
+    dynamic_parsers: typing.List[typing.Type[BaseParser]] = [],
+) -> typing.List[typing.Tuple[str, typing.Type[BaseParser]]]:
+    """Parsers which could be picked by `findparser` for the sheet"""
+    return [
+        (name, parser)
+        for name, parser in get_parsers(parsers, dynamic_parsers)
+        if (not check_platform or parser.check_platform(platform))
+        and sheet_info.reader_class in parser.sheet_reader_classes()
+    ]
+
+
+def may_match(
+    sheet_info: SheetInfo,
+    platform: str,
+    parsers: typing.Optional[typing.List[str]] = None,
+    check_platform: bool = True,
+    dynamic_parsers: typing.List[typing.Type[BaseParser]] = [],
+) -> bool:
+    """Cheap pre-filter which checks heuristics of parsers only against sheet name, index and extra
+
+    Returns `False` only when every parser which could be picked by `findparser`
+    rules the sheet out, so the content of the sheet doesn't need to be read at all.
+    """
+    parser_classes = sheet_info_parsers(
+        sheet_info, platform, parsers, check_platform, dynamic_parsers
+    )
+    if not parser_classes:
+        # let findparser to raise the proper error
+        return True
+
+    return any(parser.check_sheet_info(sheet_info) for _, parser in parser_classes)
+
+
+XLSX_ENGINES: typing.Dict[str, typing.Type[XlsxReader]] = {
+    "openpyxl": XlsxReader,
+    "stream": XlsxStreamReader,
+}
+
+
+FILE_FORMATS: typing.Dict[str, str] = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".xlsx": "xlsx",
+    ".xls": "xls",
+    ".xlsb": "xls",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+COMPRESSIONS: typing.Dict[str, typing.Callable[..., typing.IO[bytes]]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+def open_reader(
+    source: typing.Union[pathlib.Path, typing.IO[bytes]],
+    file_format: str,
+    workers: typing.Optional[int] = None,
+    xlsx_engine: str = "openpyxl",
+    typed_cells: bool = False,
+    json_backend: typing.Optional[str] = None,
+    detection_cache: typing.Optional[DetectionCache] = None,
+) -> typing.Optional[TableReader]:
+    """Opens reader of the given format, None is returned for unsupported formats
+
+    Encoding of CSV data is detected only from its beginning.
+
+    :param file_format: one of the values of `FILE_FORMATS`
+    :param detection_cache: encodings and dialects of CSV files (see `CsvReader`)
+    """
+    if xlsx_engine not in XLSX_ENGINES:
+        raise ValueError(f"Unknown xlsx engine '{xlsx_engine}'")
+
+    if file_format == "csv":
+        if isinstance(source, pathlib.Path):
+            return CsvReader(
+                source,
+                detection_cache=detection_cache,
+                memory_map=source.stat().st_size >= MEMORY_MAP_SIZE,
+            )
+        return CsvReader(source, detection_cache=detection_cache)
+    elif file_format == "xlsx":
+        return XLSX_ENGINES[xlsx_engine](source, workers=workers, typed_cells=typed_cells)
+    elif XlsReader and file_format == "xls":
+        return XlsReader(source, workers=workers, typed_cells=typed_cells)
+    elif file_format == "json":
+        return JsonCounter5Reader(source, json_backend=json_backend, workers=workers)
+    elif file_format == "jsonl":
+        return JsonLinesCounter5Reader(source, json_backend=json_backend, workers=workers)
+
+    return None
+
+
+def read_file(
+    file_path: pathlib.Path,
+    workers: typing.Optional[int] = None,
+    xlsx_engine: str = "openpyxl",
+    typed_cells: bool = False,
+    json_backend: typing.Optional[str] = None,
+    detection_cache: typing.Optional[DetectionCache] = None,
+) -> TableReader:
+    """Opens reader based on the file suffix
+
+    :param workers: number of processes used to convert sheets of spreadsheets
+        and items of COUNTER JSON
+    :param xlsx_engine: reader used for xlsx files (see `XLSX_ENGINES`)
+    :param typed_cells: keep native dates and numbers of spreadsheet cells
+    :param json_backend: backend used to decode COUNTER JSON (see `JSON_BACKENDS`)
+    :param detection_cache: mapping where detected encodings and dialects of CSV files
+        are kept, so that they are not detected again when the same file is read
+
+    Compressed files (see `COMPRESSIONS`) are decompressed while being read,
+    their format is derived from the inner suffix or detected from the decompressed data.
+    """
+    if open_compressed := COMPRESSIONS.get(file_path.suffix.lower()):
+        inner_suffix = pathlib.PurePath(file_path.stem).suffix.lower()
+        file = open_compressed(file_path, "rb")
+        try:
+            return read_data(
+                file,
+                FILE_FORMATS.get(inner_suffix),
+                workers=workers,
+                xlsx_engine=xlsx_engine,
+                typed_cells=typed_cells,
+                json_backend=json_backend,
+                detection_cache=detection_cache,
+            )
+        except Exception:
+            file.close()
+            raise
 
-    raise WrongFileFormatError(file_path, file_path.suffix)
+    file_format = FILE_FORMATS.get(file_path.suffix.lower(), "")
+    reader = open_reader(
+        file_path, file_format, workers, xlsx_engine, typed_cells, json_backend, detection_cache
+    )
+    if reader is None:
+        raise WrongFileFormatError(file_path, file_path.suffix)
+    return reader
+
+
+def read_data(
+    data: typing.Union[bytes, bytearray, memoryview, typing.IO[bytes]],
+    file_format: typing.Optional[str] = None,
+    workers: typing.Optional[int] = None,
+    xlsx_engine: str = "openpyxl",
+    typed_cells: bool = False,
+    json_backend: typing.Optional[str] = None,
+    detection_cache: typing.Optional[DetectionCache] = None,
+) -> TableReader:
+    """Opens reader for data in the memory or for a binary file object
+
+    Non-seekable file objects (e.g. pipes) are read only as the data are needed.
+    Data in the memory are not copied, so buffers (bytearray, memoryview)
+    must not be modified while they are being read.
+
+    :param file_format: one of the values of `FILE_FORMATS`, detected from data if not set
+    """
+    file: typing.IO[bytes]
+    if isinstance(data, bytes):
+        file = BytesIO(data)  # BytesIO shares the memory with bytes until it is written to
+    elif isinstance(data, (bytearray, memoryview)):
+        file = BufferedReader(BufferStream(data))
+    elif not data.seekable():
+        file = BufferedReader(SpooledStream(data))
+    else:
+        file = data
+
+    if file_format is None:
+        position = file.tell()
+        file_format = detect_file_format(file.read(FORMAT_DETECTION_SIZE))
+        file.seek(position)
+        logger.debug("Format '%s' was detected", file_format)
+
+    reader = open_reader(
+        file, file_format, workers, xlsx_engine, typed_cells, json_backend, detection_cache
+    )
+    if reader is None:
+        raise WrongFileFormatError("<data>", file_format)
+    return reader
+
+
+def read_member(
+    archive: zipfile.ZipFile,
+    name: str,
+    workers: typing.Optional[int] = None,
+    xlsx_engine: str = "openpyxl",
+    typed_cells: bool = False,
+    json_backend: typing.Optional[str] = None,
+    detection_cache: typing.Optional[DetectionCache] = None,
+) -> TableReader:
+    """Opens reader for a member of zip archive without extracting it
+
+    CSV and JSON members are streamed, spreadsheets are read into the memory,
+    because they need random access. Streamed data are spooled as they are read
+    (see `SpooledStream`), because seeking backward in a member of zip archive
+    would decompress it again from its start.
+    """
+    path = pathlib.PurePosixPath(name)
+    suffix = path.suffix.lower()
+    file: typing.IO[bytes]
+    if open_compressed := COMPRESSIONS.get(suffix):
+        file = BufferedReader(SpooledStream(open_compressed(archive.open(name), "rb")))
+        file_format = FILE_FORMATS.get(pathlib.PurePosixPath(path.stem).suffix.lower())
+    elif suffix in FILE_FORMATS:
+        file_format = FILE_FORMATS[suffix]
+        if file_format in ("xlsx", "xls"):
+            file = BytesIO(archive.read(name))
+        else:
+            file = BufferedReader(SpooledStream(archive.open(name)))
+    else:
+        raise WrongFileFormatError(name, path.suffix)
+
+    return read_data(
+        file,
+        file_format,
+        workers=workers,
+        xlsx_engine=xlsx_engine,
+        typed_cells=typed_cells,
+        json_backend=json_backend,
+        detection_cache=detection_cache,
+    )
 
 
 def eat(
@@ -392,6 +677,11 @@ def eat(
     check_platform: bool = True,
     use_heuristics: bool = True,
     dynamic_parsers: typing.List[typing.Type[BaseParser]] = [],
+    workers: typing.Optional[int] = None,
+    xlsx_engine: str = "openpyxl",
+    typed_cells: bool = False,
+    json_backend: typing.Optional[str] = None,
+    detection_cache: typing.Optional[DetectionCache] = None,
 ) -> typing.List[typing.Union[Poop, NibblerError]]:
     platform = Platform(value=platform).value
 
@@ -400,22 +690,162 @@ def eat(
 
     logger.info('Eating file "%s"', file_path)
 
-    reader = read_file(file_path)
-    poops = []
-    for sheet in reader:
-        logger.info("Digesting sheet %d", sheet.sheet_idx)
+    reader = read_file(
+        file_path,
+        workers=workers,
+        xlsx_engine=xlsx_engine,
+        typed_cells=typed_cells,
+        json_backend=json_backend,
+        detection_cache=detection_cache,
+    )
+    return digest(reader, platform, parsers, check_platform, use_heuristics, dynamic_parsers)
+
+
+def eat_data(
+    data: typing.Union[bytes, bytearray, memoryview, typing.IO[bytes]],
+    platform: str,
+    parsers: typing.Optional[typing.List[str]] = None,
+    check_platform: bool = True,
+    use_heuristics: bool = True,
+    dynamic_parsers: typing.List[typing.Type[BaseParser]] = [],
+    file_format: typing.Optional[str] = None,
+    workers: typing.Optional[int] = None,
+    xlsx_engine: str = "openpyxl",
+    typed_cells: bool = False,
+    json_backend: typing.Optional[str] = None,
+    detection_cache: typing.Optional[DetectionCache] = None,
+) -> typing.List[typing.Union[Poop, NibblerError]]:
+    """Same as `eat`, but data are read from the memory or from a binary file object
+
+    :param file_format: one of the values of `FILE_FORMATS`, detected from data if not set
+    """
+    platform = Platform(value=platform).value
+
+    logger.info("Eating data")
+
+    reader = read_data(
+        data,
+        file_format=file_format,
+        workers=workers,
+        xlsx_engine=xlsx_engine,
+        typed_cells=typed_cells,
+        json_backend=json_backend,
+        detection_cache=detection_cache,
+    )
+    return digest(reader, platform, parsers, check_platform, use_heuristics, dynamic_parsers)
+
+
+def eat_archive(
+    archive_path: typing.Union[pathlib.Path, str, typing.IO[bytes]],
+    platform: str,
+    parsers: typing.Optional[typing.List[str]] = None,
+    check_platform: bool = True,
+    use_heuristics: bool = True,
+    dynamic_parsers: typing.List[typing.Type[BaseParser]] = [],
+    member_workers: typing.Optional[int] = None,
+    workers: typing.Optional[int] = None,
+    xlsx_engine: str = "openpyxl",
+    typed_cells: bool = False,
+    json_backend: typing.Optional[str] = None,
+    detection_cache: typing.Optional[DetectionCache] = None,
+) -> typing.Dict[str, typing.List[typing.Union[Poop, NibblerError]]]:
+    """Eats all files of zip archive
+
+    Members are opened and parsers are picked for them in a pool of `member_workers`
+    threads (Poop instances keep their readers open, so they can't be passed between
+    processes). Threads overlap reading and decompression of members, but they share
+    the GIL, so this is not parallel parsing. Records are parsed lazily once they
+    are read from the returned Poop instances, same as for `eat`.
+
+    Errors of a member don't stop eating of the other members. Unsupported members
+    are mapped to `WrongFileFormatError`, other failures are mapped to `NibblerError`
+    raised for the member or to `ArchiveMemberError` wrapping any other exception.
+
+    :returns: result of `eat` for each member of the archive
+    """
+    platform = Platform(value=platform).value
+
+    logger.info('Eating archive "%s"', archive_path)
+
+    def eat_member(name: str) -> typing.List[typing.Union[Poop, NibblerError]]:
+        logger.info('Eating archive member "%s"', name)
         try:
-            parser = findparser(
-                sheet, platform, parsers, check_platform, use_heuristics, dynamic_parsers
+            reader = read_member(
+                archive,
+                name,
+                workers=workers,
+                xlsx_engine=xlsx_engine,
+                typed_cells=typed_cells,
+                json_backend=json_backend,
+                detection_cache=detection_cache,
             )
-            poops.append(Poop(parser))
-        except (NoParserFound, MultipleParsersFound) as e:
-            logger.warning(
-                "parser has not been chosen for sheet %s, the sheet wont be parsed",
-                sheet.sheet_idx + 1,
+            return digest(
+                reader, platform, parsers, check_platform, use_heuristics, dynamic_parsers
             )
-            poops.append(e)
-            # Make sure that underlying file is closed
-            sheet.close()
+        except NibblerError as e:
+            return [e]
+        except Exception as e:
+            logger.warning('Failed to eat archive member "%s": %s', name, e)
+            return [ArchiveMemberError(name, e)]
+
+    # opened members keep the archive file open after the archive is closed
+    with zipfile.ZipFile(archive_path) as archive:
+        names = [e.filename for e in archive.infolist() if not e.is_dir()]
+        with ThreadPoolExecutor(max_workers=member_workers or 1) as executor:
+            return dict(zip(names, executor.map(eat_member, names)))
+
+
+def digest(
+    reader: TableReader,
+    platform: str,
+    parsers: typing.Optional[typing.List[str]] = None,
+    check_platform: bool = True,
+    use_heuristics: bool = True,
+    dynamic_parsers: typing.List[typing.Type[BaseParser]] = [],
+) -> typing.List[typing.Union[Poop, NibblerError]]:
+    """Picks parsers for sheets of the opened reader"""
+    poops = []
+    try:
+        sheet_infos = reader.sheet_infos()
+        skipped = set()
+        if reader.lazy_sheets and use_heuristics:
+            skipped = {
+                e.sheet_idx
+                for e in sheet_infos
+                if not may_match(e, platform, parsers, check_platform, dynamic_parsers)
+            }
+        reader.prepare(e.sheet_idx for e in sheet_infos if e.sheet_idx not in skipped)
+
+        for sheet_info in sheet_infos:
+            if sheet_info.sheet_idx in skipped:
+                # Sheet is ruled out without reading its content, so parsers are not analyzed
+                logger.info("Skipping sheet %d", sheet_info.sheet_idx)
+                parser_classes = sheet_info_parsers(
+                    sheet_info, platform, parsers, check_platform, dynamic_parsers
+                )
+                poops.append(
+                    NoParserMatchesHeuristics(
+                        sheet_info.sheet_idx, parsers_info={name: [] for name, _ in parser_classes}
+                    )
+                )
+                continue
+
+            sheet = reader[sheet_info.sheet_idx]
+            logger.info("Digesting sheet %d", sheet.sheet_idx)
+            try:
+                parser = findparser(
+                    sheet, platform, parsers, check_platform, use_heuristics, dynamic_parsers
+                )
+                poops.append(Poop(parser))
+            except (NoParserFound, MultipleParsersFound) as e:
+                logger.warning(
+                    "parser has not been chosen for sheet %s, the sheet wont be parsed",
+                    sheet.sheet_idx + 1,
+                )
+                poops.append(e)
+                # Make sure that underlying file is closed
+                sheet.close()
+    finally:
+        reader.close()
 
     return poops
@@ -58,6 +58,23 @@ class WrongFileFormatError(NibblerError):
         )
 
 
+class ArchiveMemberError(NibblerError):
+    """
+    Unexpected error while eating a member of an archive
+    """
+
+    def __init__(self, member: str, exception: Exception):
+        super().__init__()
+        self.member = member
+        self.exception = exception
+
+    def __str__(self):
+        return f'archive member "{self.member}" failed: {self.exception!r}'
+
+    def dict(self) -> dict:
+        return {"name": f"{self.__class__.__name__}", "member": self.member}
+
+
 class XlsError(NibblerError):
     def __init__(self, xls_exception):
         self.xls_exception = xls_exception
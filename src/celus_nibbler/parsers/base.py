@@ -16,11 +16,20 @@ from celus_nibbler.aggregator import (
 from celus_nibbler.conditions import BaseCondition
 from celus_nibbler.data_headers import DataCells, DataFormatDefinition, DataHeaders
 from celus_nibbler.errors import MissingDateInOutput, TableException
-from celus_nibbler.reader import CsvSheetReader, JsonCounter5SheetReader, SheetReader
+from celus_nibbler.reader import (
+    CsvSheetReader,
+    JsonCounter5SheetReader,
+    JsonLinesCounter5SheetReader,
+    MmapCsvSheetReader,
+    SheetInfo,
+    SheetReader,
+)
 from celus_nibbler.sources import (
     AuthorsSource,
     DateSource,
     DimensionSource,
+    ExtractionPlan,
+    Failure,
     ItemIdSource,
     ItemSource,
     MetricSource,
@@ -30,7 +39,7 @@ from celus_nibbler.sources import (
     TitleIdSource,
     TitleSource,
 )
-from celus_nibbler.utils import end_month, start_month
+from celus_nibbler.utils import BATCH_SIZE, end_month, start_month
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +91,28 @@ class BaseArea(metaclass=ABCMeta):
 
 
 class BaseJsonArea(BaseArea):
-    pass
+    def __init__(self, sheet: SheetReader, platform: str, **extras):
+        super().__init__(sheet, platform, **extras)
+        # months of items found during the last complete pass through the sheet
+        self.item_months: typing.Optional[typing.Set[str]] = None
+
+    def months_of_item(self, item: dict) -> typing.Iterable[str]:
+        return []
+
+    def track_months(self, items: typing.Iterable[dict]) -> typing.Generator[dict, None, None]:
+        """Passes items through while collecting their months"""
+        months: typing.Set[str] = set()
+        for item in items:
+            months.update(self.months_of_item(item))
+            yield item
+        self.item_months = months
+
+    def get_item_months(self) -> typing.Set[str]:
+        if self.item_months is None:
+            # not read yet => read all items
+            for _ in self.track_months(self.sheet):
+                pass
+        return self.item_months or set()
 
 
 class BaseTabularArea(BaseArea):
@@ -260,6 +290,13 @@ class BaseParser(metaclass=ABCMeta):
             return False
         return True
 
+    @classmethod
+    def check_sheet_info(cls, sheet: SheetInfo) -> bool:
+        """Checks whether the parser may match the sheet without reading its content"""
+        if cls.heuristics:
+            return cls.heuristics.check_sheet_info(sheet) is not False
+        return True
+
     @property
     @classmethod
     @abstractmethod
@@ -276,15 +313,6 @@ class BaseParser(metaclass=ABCMeta):
             return True
         return False
 
-    def _parse(self) -> typing.Generator[typing.Tuple[int, CounterRecord], None, None]:
-        for idx, area in enumerate(self.get_areas()):
-
-            def gen():
-                for e in self.parse_area(area):
-                    yield idx, e
-
-            yield from gen()
-
     def get_metric_name(self, name: str) -> str:
         return self.metric_aliases.get(name, name)
 
@@ -292,10 +320,29 @@ class BaseParser(metaclass=ABCMeta):
         return self.dimension_aliases.get(name, name)
 
     def parse(self) -> typing.Generator[typing.Tuple[int, CounterRecord], None, None]:
-        for idx, record in self._parse():
-            yield idx, record
+        for idx, batch in self.parse_batches():
+            for record in batch:
+                yield idx, record
+
+    def parse_batches(
+        self, batch_size: int = BATCH_SIZE
+    ) -> typing.Generator[typing.Tuple[int, typing.List[CounterRecord]], None, None]:
+        """Same as `parse`, but records of each area are yielded in lists
+
+        Tabular parsers put records of `batch_size` rows into a list,
+        other parsers yield lists of `batch_size` records.
+        """
+        for idx, area in enumerate(self.get_areas()):
+            for batch in self.parse_area_batches(area, batch_size):
+                yield idx, batch
 
-    def parse_area(self, area) -> typing.Generator[typing.Tuple[int, CounterRecord], None, None]:
+    def parse_area(self, area) -> typing.Generator[CounterRecord, None, None]:
+        for batch in self.parse_area_batches(area):
+            yield from batch
+
+    def parse_area_batches(
+        self, area, batch_size: int = BATCH_SIZE
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
         aggregator = area.aggregator
 
         if self.uses_titles is not None:
@@ -303,7 +350,7 @@ class BaseParser(metaclass=ABCMeta):
         if self.uses_items is not None:
             aggregator = aggregator | ItemCheckAggregator(required=self.uses_items)
 
-        return aggregator.aggregate(self._parse_area(area))
+        return aggregator.aggregate_batches(self._parse_area_batches(area, batch_size))
 
     @abstractmethod
     def _parse_area(
@@ -311,6 +358,11 @@ class BaseParser(metaclass=ABCMeta):
     ) -> typing.Generator[typing.Tuple[int, CounterRecord], None, None]:
         pass
 
+    def _parse_area_batches(
+        self, area: BaseArea, batch_size: int
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
+        return map(list, itertools.batched(self._parse_area(area), batch_size))
+
     def get_months(self) -> typing.List[typing.List[datetime.date]]:
         return [e.get_months() for e in self.get_areas()]
 
@@ -322,18 +374,34 @@ class BaseParser(metaclass=ABCMeta):
 
 
 class BaseJsonParser(BaseParser):
+    def __init__(self, sheet: SheetReader, platform: str):
+        super().__init__(sheet, platform)
+        self.areas_cache: typing.Optional[typing.List[BaseArea]] = None
+
     @classmethod
     def sheet_reader_classes(cls):
-        return [JsonCounter5SheetReader]
+        return [JsonCounter5SheetReader, JsonLinesCounter5SheetReader]
 
-    def parse(self) -> typing.Generator[typing.Tuple[int, CounterRecord], None, None]:
-        for idx, record in super().parse():
-            # process aliases
-            record.metric = self.get_metric_name(record.metric) if record.metric else record.metric
-            record.dimension_data = {
-                self.get_dimension_name(key): value for key, value in record.dimension_data.items()
-            }
-            yield idx, record
+    def get_areas(self) -> typing.List[BaseArea]:
+        # areas are kept to reuse data collected while parsing
+        if self.areas_cache is None:
+            self.areas_cache = super().get_areas()
+        return self.areas_cache
+
+    def parse_batches(
+        self, batch_size: int = BATCH_SIZE
+    ) -> typing.Generator[typing.Tuple[int, typing.List[CounterRecord]], None, None]:
+        for idx, batch in super().parse_batches(batch_size):
+            for record in batch:
+                # process aliases
+                record.metric = (
+                    self.get_metric_name(record.metric) if record.metric else record.metric
+                )
+                record.dimension_data = {
+                    self.get_dimension_name(key): value
+                    for key, value in record.dimension_data.items()
+                }
+            yield idx, batch
 
 
 class BaseTabularParser(BaseParser):
@@ -352,7 +420,7 @@ class BaseTabularParser(BaseParser):
 
     @classmethod
     def sheet_reader_classes(cls):
-        return [CsvSheetReader]
+        return [CsvSheetReader, MmapCsvSheetReader]
 
     def _metric_check(
         self,
@@ -362,25 +430,45 @@ class BaseTabularParser(BaseParser):
         available_metrics: typing.Optional[typing.List[str]],
         on_metric_check_failed: TableException.Action,
     ):
-        def error():
-            raise TableException(
+        if error := self._metric_error(
+            metric, orig_metric, metrics_to_skip, available_metrics, on_metric_check_failed
+        ):
+            raise error
+
+    def _metric_error(
+        self,
+        metric,
+        orig_metric,
+        metrics_to_skip: typing.List[str],
+        available_metrics: typing.Optional[typing.List[str]],
+        on_metric_check_failed: TableException.Action,
+    ) -> typing.Optional[TableException]:
+        """Same as `_metric_check`, but the exception is returned instead of raising"""
+        # ignore case during skip, keep case when processing available metrics
+        if metric.lower() in metrics_to_skip or (
+            available_metrics and metric not in available_metrics
+        ):
+            return TableException(
                 sheet=self.sheet.sheet_idx,
                 value=orig_metric,
                 reason="wrong-metric-found",
                 action=on_metric_check_failed,
             )
-
-        # ignore case during skip
-        if metric.lower() in metrics_to_skip:
-            error()
-
-        # keep case when processing available metrics
-        if available_metrics and metric not in available_metrics:
-            error()
+        return None
 
     def _parse_area(
         self, area: BaseTabularArea
     ) -> typing.Generator[typing.Tuple[int, CounterRecord], None, None]:
+        for batch in self._parse_area_batches(area, BATCH_SIZE):
+            yield from batch
+
+    def _parse_area_batches(
+        self, area: BaseTabularArea, batch_size: int
+    ) -> typing.Generator[typing.List[CounterRecord], None, None]:
+        """Parses records of rows in batches
+
+        Rows of a batch are fetched from the sheet at once (see `ExtractionPlan.fetch_rows`).
+        """
         count = 0
         metrics_to_skip = [e.lower() for e in self.metrics_to_skip]
         try:
@@ -399,184 +487,180 @@ class BaseTabularParser(BaseParser):
             if e.action == TableException.Action.FAIL:
                 raise
 
-        # Area offset should be absolute
-        area_row_offset = area.row_offset
-        parser_row_offset = self.row_offset
-
-        # Store title_ids and dimensions sources
-        # so it can be reused in the for-cycle
-        dimensions_sources = list(area.dimensions_sources.items())
-        title_ids_sources = area.title_ids_sources
-        item_ids_sources = area.item_ids_sources
-        item_authors_source = area.item_authors_source
-        item_publication_date_source = area.item_publication_date_source
-        metrics_to_skip = [e.lower() for e in self.metrics_to_skip]
-        titles_to_skip = [e.lower() for e in self.titles_to_skip]
-        items_to_skip = [e.lower() for e in self.items_to_skip]
-        dimensions_to_skip = {k: [e.lower() for e in v] for k, v in self.dimensions_to_skip.items()}
+        # Positions and validators of sources are resolved only once
+        plan = ExtractionPlan(self.sheet, self.row_offset, area.row_offset)
+        title_extractor = plan.compile(area.title_source) if area.title_source else None
+        item_extractor = plan.compile(area.item_source) if area.item_source else None
+        metric_extractor = plan.compile(area.metric_source) if area.metric_source else None
+        organization_extractor = (
+            plan.compile(area.organization_source) if area.organization_source else None
+        )
+        date_extractor = plan.compile(area.date_source) if area.date_source else None
+        dimension_extractors = [
+            (k, plan.compile(source, self.dimensions_validators.get(k)))
+            for k, source in area.dimensions_sources.items()
+        ]
+        ids_extractors = [
+            (
+                plan.compile(source) if (source := area.title_ids_sources.get(key)) else None,
+                plan.compile(source) if (source := area.item_ids_sources.get(key)) else None,
+            )
+            for key in IDS
+        ]
+        item_authors_extractor = (
+            plan.compile(area.item_authors_source) if area.item_authors_source else None
+        )
+        item_publication_date_extractor = (
+            plan.compile(area.item_publication_date_source)
+            if area.item_publication_date_source
+            else None
+        )
         metric_value_extraction_overrides = self.metric_value_extraction_overrides
-
-        for idx in itertools.count(0):
-            try:
-                skip = False
-
-                # iterates through ranges
-                if area.title_source:
-                    title = area.title_source.extract(
-                        self.sheet,
-                        idx,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
+        # values of data cells without a metric in the header are validated by metrics of rows
+        value_extractors = []
+        for data_cell in data_cells:
+            if data_cell.header_data.metric:
+                extractions = {
+                    metric_value_extraction_overrides.get(
+                        data_cell.header_data.metric, SpecialExtraction.NO
                     )
-                    if title is not None and title.lower() in titles_to_skip:
-                        skip = True
-                else:
-                    title = None
-
-                if area.item_source:
-                    item = area.item_source.extract(
-                        self.sheet,
-                        idx,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
-                    if item is not None and item.lower() in items_to_skip:
-                        skip = True
-                else:
-                    item = None
-
-                if area.metric_source:
-                    orig_metric = area.metric_source.extract(
-                        self.sheet,
-                        idx,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
-                    metric = self.get_metric_name(orig_metric)
-                    try:
-                        self._metric_check(
-                            metric,
-                            orig_metric,
-                            metrics_to_skip,
-                            self.available_metrics,
-                            self.on_metric_check_failed,
-                        )
-                    except TableException as e:
-                        # In case that skip is required
-                        # We need to go through the rest of the fields as well
-                        # StopException can be raised when other fields are iterated
-                        if e.action == TableException.Action.SKIP:
-                            skip = True
-                        else:
-                            raise
-                else:
-                    metric = None
-
-                if area.organization_source:
-                    organization = area.organization_source.extract(
-                        self.sheet,
-                        idx,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
-                else:
-                    organization = None
-
-                if area.date_source:
-                    date = area.date_source.extract(
-                        self.sheet,
-                        idx,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
-                else:
-                    date = None
-
-                dimension_data = {}
-                for k, dimension_source in dimensions_sources:
-                    dimension_text = dimension_source.extract(
-                        self.sheet,
-                        idx,
-                        validator=self.dimensions_validators.get(k),
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
-                    if (
-                        dimension_text is not None
-                        and dimension_text.lower() in dimensions_to_skip.get(k, [])
-                    ):
+                }
+            else:
+                extractions = {SpecialExtraction.NO, *metric_value_extraction_overrides.values()}
+            value_extractors.append(
+                (
+                    data_cell,
+                    {
+                        e.get_validator(): plan.compile(data_cell.value_source, e.get_validator())
+                        for e in extractions
+                    },
+                )
+            )
+        titles_to_skip = {e.lower() for e in self.titles_to_skip}
+        items_to_skip = {e.lower() for e in self.items_to_skip}
+        dimensions_to_skip = {k: {e.lower() for e in v} for k, v in self.dimensions_to_skip.items()}
+
+        records: typing.List[CounterRecord] = []
+
+        def parse_row(idx: int) -> typing.Optional[Failure]:
+            """Appends records of a row to `records`, failure which ends the row is returned"""
+            nonlocal count
+            skip = False
+
+            # iterates through ranges
+            if title_extractor:
+                title = title_extractor.try_extract(idx)
+                if title.__class__ is Failure:
+                    return title
+                if title is not None and title.lower() in titles_to_skip:
+                    skip = True
+            else:
+                title = None
+
+            if item_extractor:
+                item = item_extractor.try_extract(idx)
+                if item.__class__ is Failure:
+                    return item
+                if item is not None and item.lower() in items_to_skip:
+                    skip = True
+            else:
+                item = None
+
+            if metric_extractor:
+                orig_metric = metric_extractor.try_extract(idx)
+                if orig_metric.__class__ is Failure:
+                    return orig_metric
+                metric = self.get_metric_name(orig_metric)
+                if error := self._metric_error(
+                    metric,
+                    orig_metric,
+                    metrics_to_skip,
+                    self.available_metrics,
+                    self.on_metric_check_failed,
+                ):
+                    # In case that skip is required
+                    # We need to go through the rest of the fields as well
+                    # Stop can be returned when other fields are iterated
+                    if error.action == TableException.Action.SKIP:
                         skip = True
-                        break
-                    dimension_data[self.get_dimension_name(k)] = dimension_text
-
-                title_ids = {}
-                item_ids = {}
-                for key in IDS:
-                    if title_source := title_ids_sources.get(key):
-                        value = title_source.extract(
-                            self.sheet,
-                            idx,
-                            parser_row_offset=parser_row_offset,
-                            area_row_offset=area_row_offset,
-                        )
-                        if value:
-                            title_ids[title_source.last_key] = value
-
-                    if item_source := item_ids_sources.get(key):
-                        value = item_source.extract(
-                            self.sheet,
-                            idx,
-                            parser_row_offset=parser_row_offset,
-                            area_row_offset=area_row_offset,
-                        )
-                        if value:
-                            item_ids[item_source.last_key] = value
-
-                if item_publication_date_source:
-                    item_publication_date = item_publication_date_source.extract(
-                        self.sheet,
-                        idx,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
-                else:
-                    item_publication_date = None
-
-                if item_authors_source:
-                    item_authors = item_authors_source.extract(
-                        self.sheet,
-                        idx,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
-                else:
-                    item_authors = None
-
-                if skip:
-                    continue
-
-            except TableException as e:
-                if e.action == TableException.Action.SKIP:
-                    continue
-                if e.action == TableException.Action.STOP:
-                    return
-                else:
-                    raise
+                    else:
+                        return Failure.from_exception(error)
+            else:
+                metric = None
+
+            if organization_extractor:
+                organization = organization_extractor.try_extract(idx)
+                if organization.__class__ is Failure:
+                    return organization
+            else:
+                organization = None
+
+            if date_extractor:
+                date = date_extractor.try_extract(idx)
+                if date.__class__ is Failure:
+                    return date
+            else:
+                date = None
+
+            dimension_data = {}
+            for k, dimension_extractor in dimension_extractors:
+                dimension_text = dimension_extractor.try_extract(idx)
+                if dimension_text.__class__ is Failure:
+                    return dimension_text
+                if dimension_text is not None and dimension_text.lower() in (
+                    dimensions_to_skip.get(k, ())
+                ):
+                    skip = True
+                    break
+                dimension_data[self.get_dimension_name(k)] = dimension_text
+
+            title_ids = {}
+            item_ids = {}
+            for title_id_extractor, item_id_extractor in ids_extractors:
+                if title_id_extractor:
+                    value = title_id_extractor.try_extract(idx)
+                    if value.__class__ is Failure:
+                        return value
+                    if value:
+                        title_ids[title_id_extractor.last_key] = value
+
+                if item_id_extractor:
+                    value = item_id_extractor.try_extract(idx)
+                    if value.__class__ is Failure:
+                        return value
+                    if value:
+                        item_ids[item_id_extractor.last_key] = value
+
+            if item_publication_date_extractor:
+                item_publication_date = item_publication_date_extractor.try_extract(idx)
+                if item_publication_date.__class__ is Failure:
+                    return item_publication_date
+            else:
+                item_publication_date = None
+
+            if item_authors_extractor:
+                item_authors = item_authors_extractor.try_extract(idx)
+                if item_authors.__class__ is Failure:
+                    return item_authors
+            else:
+                item_authors = None
+
+            if skip:
+                return None
+
+            for data_cell, extractors in value_extractors:
+                value_validator = metric_value_extraction_overrides.get(
+                    data_cell.header_data.metric or metric or "",
+                    SpecialExtraction.NO,
+                ).get_validator()
+
+                value = extractors[value_validator].try_extract(idx)
+                if value.__class__ is Failure:
+                    if value.action == TableException.Action.SKIP:
+                        continue
+                    return value
 
-            for data_cell in data_cells:
                 try:
-                    value_validator = metric_value_extraction_overrides.get(
-                        data_cell.header_data.metric or metric or "",
-                        SpecialExtraction.NO,
-                    ).get_validator()
-
-                    value = data_cell.value_source.extract(
-                        self.sheet,
-                        idx,
-                        validator=value_validator,
-                        parser_row_offset=parser_row_offset,
-                        area_row_offset=area_row_offset,
-                    )
                     record = CounterRecord(
                         value=round(value),
                         organization=organization,
@@ -595,13 +679,38 @@ class BaseTabularParser(BaseParser):
                     record = area.prepare_record(record)
                     logger.debug("Parsed %s", record)
                     area.check_record(count, record)
-                    yield record
+                    records.append(record)
                     count += 1
 
                 except TableException as e:
                     if e.action == TableException.Action.SKIP:
                         continue
-                    if e.action == TableException.Action.STOP:
-                        return
-                    else:
-                        raise
+                    return Failure.from_exception(e)
+
+            return None
+
+        def parse_rows(first_idx: int) -> bool:
+            """Appends records of a batch to `records`, returns True once the area ends"""
+            for idx in range(first_idx, first_idx + batch_size):
+                if failure := parse_row(idx):
+                    if failure.action == TableException.Action.SKIP:
+                        continue
+                    if failure.action == TableException.Action.STOP:
+                        return True
+                    raise failure.exception()
+            return False
+
+        for first_idx in itertools.count(0, batch_size):
+            plan.fetch_rows(first_idx, batch_size)
+            try:
+                stop = parse_rows(first_idx)
+            except Exception:
+                # records parsed before the error are passed on
+                if records:
+                    yield records
+                raise
+            if records:
+                yield records
+                records = []
+            if stop:
+                return
@@ -1,6 +1,6 @@
 import logging
 from datetime import date
-from typing import Generator, List, Optional, Set
+from typing import Generator, Iterable, List, Optional, Set
 
 from celus_nigiri import CounterRecord
 from celus_nigiri.counter51 import (
@@ -21,6 +21,7 @@ from celus_nibbler.parsers.base import BaseArea, BaseJsonArea, BaseJsonParser
 from celus_nibbler.reader import JsonCounter5SheetReader
 
 from . import c5 as c5tabular
+from .c5json import read_nigiri_report
 
 logger = logging.getLogger(__name__)
 
@@ -53,16 +54,15 @@ class NigiriBaseArea(BaseJsonArea):
         return None
 
     def get_months(self) -> List[date]:
-        months_str: Set[str] = set()
         if months := self._get_months_from_header():
             return months
 
-        for item_dict in self.sheet:
-            for ap in item_dict.get("Attribute_Performance", []):
-                for dates in ap.get("Performance", {}).values():
-                    months_str.update(dates.keys())
+        return sorted(list(self._convert_months_str_to_months(self.get_item_months())))
 
-        return sorted(list(self._convert_months_str_to_months(months_str)))
+    def months_of_item(self, item: dict) -> Iterable[str]:
+        for ap in item.get("Attribute_Performance", []):
+            for dates in ap.get("Performance", {}).values():
+                yield from dates.keys()
 
     @property
     def dimensions(self) -> List[str]:
@@ -84,18 +84,9 @@ class NigiriTRArea(NigiriBaseArea):
 class NigiriIRArea(NigiriBaseArea):
     nigiri_report_class = Counter51IRReport
 
-    def get_months(self) -> List[date]:
-        months_str: Set[str] = set()
-        if months := self._get_months_from_header():
-            return months
-
-        for items_dict in self.sheet:
-            for item in items_dict.get("Items", []):
-                for ap in item.get("Attribute_Performance", []):
-                    for dates in ap.get("Performance", {}).values():
-                        months_str.update(dates.keys())
-
-        return sorted(list(self._convert_months_str_to_months(months_str)))
+    def months_of_item(self, item: dict) -> Iterable[str]:
+        for nested_item in item.get("Items", []):
+            yield from super().months_of_item(nested_item)
 
 
 class NigiriIR_M1Area(NigiriIRArea):
@@ -113,9 +104,9 @@ class BaseCounter51JsonParser(c5tabular.Counter5ParserAnalyzeMixin, BaseJsonPars
 
     def _parse_area(self, area: BaseArea) -> Generator[CounterRecord, None, None]:
         if isinstance(area, NigiriBaseArea):
-            report = area.nigiri_report_class()
             if isinstance(self.sheet, JsonCounter5SheetReader):
-                return report.read_report(self.sheet.extra, self.sheet)
+                items = area.track_months(self.sheet)
+                return read_nigiri_report(area.nigiri_report_class, self.sheet, items)
             raise TypeError(f"Only JsonCounter5SheetReader is allowed to be used in {type(self)}")
         raise TypeError(f"Only NigiriArea is allowed to be used in {type(self)}")
 
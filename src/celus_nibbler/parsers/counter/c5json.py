@@ -1,6 +1,9 @@
+import itertools
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from typing import Generator, List
+from typing import Generator, Iterable, Iterator, List, Optional, Type
 
 from celus_nigiri import CounterRecord
 from celus_nigiri.counter5 import (
@@ -24,12 +27,53 @@ from . import c5 as c5tabular
 
 logger = logging.getLogger(__name__)
 
+REPORT_CHUNK_SIZE = 1000  # number of items converted at once by a worker
+
+
+def _read_report_chunk(
+    report_class: Type[Counter5ReportBase], header: dict, items: List[dict]
+) -> List[CounterRecord]:
+    return list(report_class().read_report(header, items))
+
+
+def _read_report_concurrently(
+    report_class: Type[Counter5ReportBase], header: dict, items: Iterable[dict], workers: int
+) -> Iterator[CounterRecord]:
+    items = iter(items)
+    chunks = iter(lambda: list(itertools.islice(items, REPORT_CHUNK_SIZE)), [])
+    with ProcessPoolExecutor(workers) as executor:
+        # only limited number of chunks is submitted to keep the memory usage constant
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_read_report_chunk, report_class, header, chunk))
+            if len(pending) > workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def read_nigiri_report(
+    report_class: Type[Counter5ReportBase],
+    sheet: JsonCounter5SheetReader,
+    items: Optional[Iterable[dict]] = None,
+) -> Iterator[CounterRecord]:
+    """Converts items of the sheet to records using nigiri report
+
+    When the sheet has `workers` set, chunks of items are converted in a process pool.
+    The order of records is the same as if they were converted in a single process.
+
+    :param items: items to be used instead of the items of the sheet
+    """
+    items = sheet if items is None else items
+    if sheet.workers and sheet.workers >= 2:
+        return _read_report_concurrently(report_class, sheet.extra, items, sheet.workers)
+    return report_class().read_report(sheet.extra, items)
+
 
 class NigiriBaseArea(BaseJsonArea):
     nigiri_report_class = Counter5ReportBase
 
     def get_months(self) -> List[date]:
-        months_str = set()
         if report_filters := self.sheet.extra.get("Report_Filters"):
             begin = None
             end = None
@@ -48,14 +92,8 @@ class NigiriBaseArea(BaseJsonArea):
                     logger.warn("Wrong date in Report_Filters")
 
         # No Report Filters detected => try to extract data from performance
-        for item_dict in self.sheet:
-            for permformance_item in item_dict.get("Performance", []):
-                if period := permformance_item.get("Period"):
-                    if begin_date := period.get("Begin_Date"):
-                        months_str.add(begin_date)
-
         months = set()
-        for month_str in months_str:
+        for month_str in self.get_item_months():
             try:
                 months.add(validators.Date(value=month_str).value)
             except ValidationError:
@@ -63,6 +101,12 @@ class NigiriBaseArea(BaseJsonArea):
 
         return sorted(list(months))
 
+    def months_of_item(self, item: dict) -> Iterable[str]:
+        for permformance_item in item.get("Performance", []):
+            if period := permformance_item.get("Period"):
+                if begin_date := period.get("Begin_Date"):
+                    yield begin_date
+
     @property
     def dimensions(self) -> List[str]:
         return self.nigiri_report_class.dimensions
@@ -95,9 +139,9 @@ class BaseCounter5JsonParser(c5tabular.Counter5ParserAnalyzeMixin, BaseJsonParse
 
     def _parse_area(self, area: BaseArea) -> Generator[CounterRecord, None, None]:
         if isinstance(area, NigiriBaseArea):
-            report = area.nigiri_report_class()
             if isinstance(self.sheet, JsonCounter5SheetReader):
-                return report.read_report(self.sheet.extra, self.sheet)
+                items = area.track_months(self.sheet)
+                return read_nigiri_report(area.nigiri_report_class, self.sheet, items)
             raise TypeError(f"Only JsonCounter5SheetReader is allowed to be used in {type(self)}")
         raise TypeError(f"Only NigiriArea is allowed to be used in {type(self)}")
 
@@ -1,15 +1,43 @@
+import codecs
 import csv
+import datetime
+import decimal
+import functools
+import hashlib
 import io
 import itertools
+import json
 import logging
+import mmap
+import os
 import pathlib
+import pickle
+import shutil
+import sys
 import tempfile
 from abc import ABCMeta, abstractmethod
-from collections import deque
-from functools import lru_cache
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from collections.abc import Sequence as SequenceABC
+from concurrent.futures import ProcessPoolExecutor
 from io import BufferedIOBase, BytesIO, RawIOBase, StringIO, TextIOBase, TextIOWrapper
-from typing import IO, Any, Dict, List, Optional, Sequence, Union
-
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import ijson
 import openpyxl
 from celus_nigiri.counter5 import Counter5ReportBase
 from celus_nigiri.counter51 import Counter51PRReport
@@ -17,9 +45,257 @@ from celus_nigiri.csv_detect import detect_csv_dialect, detect_file_encoding
 from celus_nigiri.exceptions import SushiException
 
 from .errors import XlsError
+from .xlsx_stream import XlsxArchive
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# detected (encoding, dialect) of CSV data stored under fingerprints of files
+DetectionCache = MutableMapping[str, Tuple[str, str]]
+
+
+FORMAT_DETECTION_SIZE = 64 * 1024  # number of bytes used to detect the file format
+ENCODING_DETECTION_SIZE = 1024 * 1024  # number of bytes used to detect encoding of CSV data
+DIALECT_DETECTION_SIZE = 64 * 1024  # number of characters used to detect CSV dialect
+FINGERPRINT_SIZE = 1024 * 1024  # number of bytes hashed to identify the file
+UTF8_CHECK_CHUNK_SIZE = 64 * 1024
+UTF8_ENCODING = "utf-8-sig"  # BOM is skipped when present
+MEMORY_MAP_SIZE = 64 * 1024 * 1024  # local CSV files at least this large are memory-mapped
+FILE_SIGNATURES = [
+    (b"PK\x03\x04", "xlsx"),  # zip archive
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "xls"),  # OLE2 compound document
+]
+
+
+def detect_file_format(prefix: bytes) -> str:
+    """Guesses format of the data from its beginning
+
+    Zip archives are considered to be xlsx files and OLE2 documents xls files.
+    Text starting with `{` or `[` is JSON (or JSON lines when the first line contains
+    a whole object and another object follows), any other data are considered to be CSV.
+    """
+    for signature, file_format in FILE_SIGNATURES:
+        if prefix.startswith(signature):
+            return file_format
+
+    text = prefix.removeprefix(b"\xef\xbb\xbf").lstrip()
+    if not text.startswith((b"{", b"[")):
+        return "csv"
+
+    first_line, _, rest = text.partition(b"\n")
+    if rest.lstrip().startswith(b"{"):
+        try:
+            json.loads(first_line)
+            return "jsonl"
+        except ValueError:
+            pass
+    return "json"
+
+
+class _LazyReadlines:
+    """Proxy of binary file which doesn't read all lines at once in `readlines()`
+
+    Encoding detector reads lines via `readlines()`, but it usually needs just a few of them.
+    """
+
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def seek(self, *args) -> int:
+        return self.file.seek(*args)
+
+    def readlines(self) -> Iterator[bytes]:
+        return iter(self.file)
+
+
+def _is_utf8(file: IO[bytes], size: Optional[int]) -> bool:
+    """Checks whether the first `size` bytes of the file (all for None) are valid UTF-8"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    remaining = size
+    try:
+        while remaining is None or remaining > 0:
+            chunk_size = UTF8_CHECK_CHUNK_SIZE
+            if remaining is not None:
+                chunk_size = min(chunk_size, remaining)
+            chunk = file.read(chunk_size)
+            if not chunk:
+                decoder.decode(b"", final=True)
+                break
+            decoder.decode(chunk)  # a character cut at the end of the sample is not final
+            if remaining is not None:
+                remaining -= len(chunk)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_encoding(file: IO[bytes], size: Optional[int] = None) -> str:
+    """Detects encoding from the first `size` bytes of the file (the whole file for None)
+
+    Data which are valid UTF-8 are recognized without running the (slow) detector.
+    The sample is cut at the last newline so that no partial character is detected.
+    """
+    position = file.tell()
+    try:
+        file.seek(0)
+        if _is_utf8(file, size):
+            return UTF8_ENCODING
+
+        file.seek(0)
+        if size is None:
+            return detect_file_encoding(_LazyReadlines(file))
+
+        prefix = file.read(size)
+        if len(prefix) == size and (end := prefix.rfind(b"\n")) > 0:
+            prefix = prefix[: end + 1]
+        return detect_file_encoding(BytesIO(prefix))
+    finally:
+        file.seek(position)
+
+
+def detect_dialect(file: IO[str], size: int = DIALECT_DETECTION_SIZE) -> str:
+    """Detects CSV dialect from the complete lines in the first `size` characters"""
+    position = file.tell()
+    file.seek(0)
+    sample = file.read(size)
+    file.seek(position)
+    if len(sample) == size and (end := sample.rfind("\n")) > 0:
+        sample = sample[: end + 1]
+    return detect_csv_dialect(StringIO(sample))
+
+
+def file_fingerprint(file: IO[bytes], size: Optional[int] = FINGERPRINT_SIZE) -> str:
+    """Identifies the file by its size and by the hash of its first `size` bytes
+
+    None means that the whole file is hashed.
+    """
+    position = file.tell()
+    try:
+        file_size = file.seek(0, io.SEEK_END)
+        file.seek(0)
+        digest = hashlib.blake2b(digest_size=16)
+        remaining = file_size if size is None else size
+        while remaining > 0 and (chunk := file.read(min(remaining, FINGERPRINT_SIZE))):
+            digest.update(chunk)
+            remaining -= len(chunk)
+    finally:
+        file.seek(position)
+    return f"{file_size}:{digest.hexdigest()}"
+
+
+class BufferStream(RawIOBase):
+    """Reads data of a buffer (e.g. bytearray or memoryview) without copying them
+
+    BytesIO shares the memory only with bytes, other buffers are copied by it.
+    The buffer must not be modified while it is being read.
+    """
+
+    def __init__(self, buffer: Union[bytearray, memoryview]):
+        self.buffer = memoryview(buffer).cast("B")
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        with self.buffer[self.position : self.position + len(buffer)] as data:
+            read = len(data)
+            with memoryview(buffer) as view:
+                view[:read] = data
+        self.position += read
+        return read
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self.position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self.position
+
+    def close(self):
+        self.buffer.release()
+        super().close()
+
+
+class SpooledStream(RawIOBase):
+    """Makes non-seekable stream (e.g. a pipe) seekable
+
+    Data are read from the stream only when they are needed, so that they can be
+    parsed as they arrive. Everything which was read is kept in a temporary file
+    (in the memory up to `max_size` bytes), because readers need to rewind.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    MAX_SIZE = 16 * 1024 * 1024  # data which are kept in the memory
+
+    def __init__(self, stream: IO[bytes], max_size: int = MAX_SIZE):
+        self.stream = stream
+        self.read_stream = getattr(stream, "read1", stream.read)  # don't wait for full chunks
+        self.spool = tempfile.SpooledTemporaryFile(max_size)
+        self.position = 0
+        self.size = 0  # number of bytes read from the stream
+        self.exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def _fill(self, end: Optional[int]) -> None:
+        """Reads data from the stream until `end` bytes are available (all data for None)"""
+        self.spool.seek(self.size)
+        while not self.exhausted and (end is None or self.size < end):
+            chunk = self.read_stream(self.CHUNK_SIZE)
+            if not chunk:
+                self.exhausted = True
+                break
+            self.spool.write(chunk)
+            self.size += len(chunk)
+
+    def readinto(self, buffer) -> int:
+        if self.position >= self.size:
+            self._fill(self.position + 1)
+        self.spool.seek(self.position)
+        with memoryview(buffer) as view:
+            read = self.spool.readinto(view[: max(self.size - self.position, 0)])
+        self.position += read
+        return read
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            self._fill(None)
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self.position = offset
+        return offset
+
+    def tell(self) -> int:
+        return self.position
+
+    def close(self):
+        self.spool.close()
+        super().close()
+
 
 class _TextIOWrapperNoClose(TextIOWrapper):
     """Wrapper around TextIOWrapper which can't be closed
@@ -35,6 +311,44 @@ class _TextIOWrapperNoClose(TextIOWrapper):
         pass
 
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+SheetInfo = namedtuple("SheetInfo", ["sheet_idx", "name", "extra", "reader_class"])
+
+
+class RowCache:
+    """Bounded LRU cache of rows which belongs to a single sheet reader"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.data: OrderedDict[int, Any] = OrderedDict()
+
+    def get(self, key: int) -> Optional[Any]:
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: int, value: Any):
+        if self.maxsize <= 0:
+            return
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def clear(self):
+        self.data.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+
 class SheetReader(metaclass=ABCMeta):
     @property
     @abstractmethod
@@ -67,16 +381,163 @@ class SheetReader(metaclass=ABCMeta):
     def close(self):
         pass
 
+    def get_rows(self, start: int, count: int) -> List[Any]:
+        """Reads `count` rows from `start`, fewer rows are returned at the end of the sheet"""
+        res = []
+        for row in range(start, start + count):
+            try:
+                res.append(self[row])
+            except IndexError:
+                break
+        return res
+
     def dict_reader(self) -> "DictReader":
         return DictReader(SheetReaderWithLineNum(self))
 
 
+class CompactRows:
+    """Rows of a window stored in a single string buffer
+
+    Cells are concatenated into one string and their boundaries are kept in arrays,
+    so that storing a row doesn't require a list and a string object per cell.
+    """
+
+    __slots__ = ("buffer", "cell_offsets", "row_offsets", "head")
+
+    def __init__(self, rows: Iterable[Sequence[str]]):
+        cells: List[str] = []
+        self.row_offsets = array("I", [0])  # index of the first cell of each row
+        for row in rows:
+            cells.extend(row)
+            self.row_offsets.append(len(cells))
+        self.cell_offsets = array("I", itertools.accumulate(map(len, cells), initial=0))
+        self.buffer = "".join(cells)
+        self.head = 0  # rows before head were dropped
+
+    def drop(self, count: int):
+        """Removes `count` rows from the beginning"""
+        self.head = min(self.head + count, len(self.row_offsets) - 1)
+
+    def cell(self, row: int, col: int) -> str:
+        cell = self.row_offsets[row] + col
+        return self.buffer[self.cell_offsets[cell] : self.cell_offsets[cell + 1]]
+
+    def __len__(self):
+        return len(self.row_offsets) - 1 - self.head
+
+    def __getitem__(self, item: int) -> "RowView":
+        if not 0 <= item < len(self):
+            raise IndexError(f"{item} is out of range")
+        return RowView(self, self.head + item)
+
+
+class TypedCell(str):
+    """Content of a spreadsheet cell which also keeps its native value (date, int or float)"""
+
+    value: Any
+
+    def __new__(cls, text: str, value: Any):
+        res = super().__new__(cls, text)
+        res.value = value
+        return res
+
+    def strip(self, chars: Optional[str] = None) -> str:
+        # keep the native value when there is nothing to strip
+        res = super().strip(chars)
+        return self if len(res) == len(self) else res
+
+    def __reduce__(self):
+        return (TypedCell, (str(self), self.value))
+
+
+# typed cells are stored in CSV files as <mark><type><text>
+TYPED_CELL_MARK = "\x1f"
+TYPED_CELL_DECODERS = {
+    "i": int,
+    "f": float,
+    "d": datetime.datetime.fromisoformat,
+}
+TYPED_CELL_CODES = {
+    int: "i",
+    float: "f",
+    datetime.datetime: "d",
+}
+
+
+def encode_typed_cell(value: Any) -> Any:
+    if code := TYPED_CELL_CODES.get(type(value)):
+        return f"{TYPED_CELL_MARK}{code}{value}"
+    return value
+
+
+def decode_typed_cell(content: str) -> str:
+    if not content.startswith(TYPED_CELL_MARK):
+        return content
+    text = content[2:]
+    try:
+        return TypedCell(text, TYPED_CELL_DECODERS[content[1]](text))
+    except (KeyError, IndexError, ValueError):
+        return text
+
+
+class TypedCompactRows(CompactRows):
+    """CompactRows which decode typed cells"""
+
+    __slots__ = ()
+
+    def cell(self, row: int, col: int) -> str:
+        return decode_typed_cell(super().cell(row, col))
+
+
+class RowView(SequenceABC):
+    """Read-only row backed by CompactRows"""
+
+    __slots__ = ("rows", "idx")
+
+    def __init__(self, rows: CompactRows, idx: int):
+        self.rows = rows
+        self.idx = idx
+
+    def __len__(self):
+        offsets = self.rows.row_offsets
+        return offsets[self.idx + 1] - offsets[self.idx]
+
+    def __getitem__(self, item):
+        length = len(self)
+        if isinstance(item, slice):
+            return [self.rows.cell(self.idx, e) for e in range(*item.indices(length))]
+
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError(f"{item} is out of range")
+        return self.rows.cell(self.idx, item)
+
+    def __iter__(self):
+        return (self.rows.cell(self.idx, e) for e in range(len(self)))
+
+    def __eq__(self, other):
+        if isinstance(other, (RowView, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class CsvSheetReader(SheetReader):
     """
     Class representing a single table
+
+    Offsets of every `row_index_stride`-th row are stored while the file is being read,
+    so that moving backward doesn't need to read the file from the beginning.
     """
 
     WINDOW_SIZE = 1000  # number of lines to be cached
+    CACHE_SIZE = WINDOW_SIZE * 2  # cache lines to avoid rewinding while reading the header
+    ROW_INDEX_STRIDE = 100  # file offset of every n-th row is stored
     sheet_idx = 0
     name = None
     extra = None
@@ -88,79 +549,126 @@ class CsvSheetReader(SheetReader):
         file: IO[str],
         window_size: int = WINDOW_SIZE,
         dialect: Optional[str] = None,
+        row_index_stride: Optional[int] = ROW_INDEX_STRIDE,
+        cache_size: int = CACHE_SIZE,
+        typed_cells: bool = False,
     ):
         self.name = name
         self.sheet_idx = sheet_idx
         self.file = file
+        self.row_cache = RowCache(cache_size)
+        # typed cells are written only by spreadsheet readers
+        self.rows_class = TypedCompactRows if typed_cells else CompactRows
+
+        self.dialect = dialect or detect_dialect(file)
+
+        # row_index[n] contains the offset of row n * row_index_stride
+        self.row_index_stride = row_index_stride if row_index_stride and file.seekable() else None
+        self.row_index: List[int] = []
+        self.next_row = 0  # row which will be returned by csv_reader next
+        self.row_count: Optional[int] = None  # known once the end of the file is reached
 
-        self.dialect = dialect or detect_csv_dialect(file)
-        self.csv_reader = csv.reader(file, self.dialect)
         # Load basic window
         self.window_start = 0
         self.window_size = window_size
-        self.window: Optional[deque[List[str]]] = None
+        self.window: Optional[CompactRows] = None
         self.update_window(0)
 
+    def _read_rows(self, row: int) -> Iterator[List[str]]:
+        """Reads rows starting from the current position of the file
+
+        :param row: the number of row which starts at the current position
+        """
+        # file.readline() is used, because iterating over the file disables file.tell()
+        reader = csv.reader(iter(self.file.readline, ""), self.dialect)
+        stride = self.row_index_stride
+        while True:
+            if stride and row == len(self.row_index) * stride:
+                self.row_index.append(self.file.tell())
+            try:
+                content = next(reader)
+            except StopIteration:
+                self.row_count = row
+                return
+            row += 1
+            self.next_row = row
+            yield content
+
+    def seek_row(self, row: int):
+        """Sets csv_reader so that its next row is `row`"""
+        if self.row_index:
+            checkpoint = min(row // self.row_index_stride, len(self.row_index) - 1)
+            checkpoint_row = checkpoint * self.row_index_stride
+        else:
+            checkpoint, checkpoint_row = 0, 0
+
+        if self.window is None or not checkpoint_row <= self.next_row <= row:
+            # rewind to the closest known offset
+            self.file.seek(self.row_index[checkpoint] if self.row_index else 0)
+            self.next_row = checkpoint_row
+            self.csv_reader = self._read_rows(checkpoint_row)
+
+        # skip remaining rows
+        for _ in itertools.islice(self.csv_reader, row - self.next_row):
+            pass
+
     def update_window(self, window_start: int):
-        if self.window is not None and self.window_start <= window_start:
-            # moving forward
-            if self.window_start <= window_start - self.window_size:
-                # not overlapping
-                start = window_start - self.window_start - self.window_size
-                stop = window_start - self.window_start
-                self.window = deque(
-                    itertools.islice(
-                        self.csv_reader,
-                        start,
-                        stop,
-                    ),
-                    self.window_size,
-                )
-                self.window_start = window_start
-            else:
-                # overlapping
-                while self.window_start < window_start:
-                    self.inc_window()
+        if self.window is not None and self.window_start <= window_start < self.window_start + len(
+            self.window
+        ):
+            # moving forward within the window
+            self.window.drop(window_start - self.window_start)
+            self.window_start = window_start
             return
 
-        # moving backward or at start
-        self.file.seek(0)
-        self.csv_reader = csv.reader(self.file, self.dialect)
+        self.seek_row(window_start)
         self.window_start = window_start
-        self.window = deque(
-            itertools.islice(
-                self.csv_reader, self.window_start, self.window_start + self.window_size
-            ),
-            self.window_size,
-        )
+        self.window = self.rows_class(itertools.islice(self.csv_reader, self.window_size))
 
     def inc_window(self):
-        try:
-            row = next(self.csv_reader)
-            self.window_start += 1
-            self.window.append(row)
-        except StopIteration:
-            if len(self.window):
-                self.window_start += 1
-                self.window.popleft()
+        if len(self.window):
+            self.update_window(self.window_start + 1)
 
-    @lru_cache(WINDOW_SIZE * 2)  # cache lines to avoid rewinding while reading the header
     def __getitem__(self, item) -> Sequence[str]:
         if isinstance(item, slice):
             raise NotImplementedError("Slicing is not supported use itertools and generators")
 
+        if (row := self.row_cache.get(item)) is None:
+            row = self.get_row(item)
+            self.row_cache.put(item, row)
+        return row
+
+    def get_row(self, item: int) -> Sequence[str]:
         # in current window
-        if self.window_start <= item < (self.window_start + self.window_size):
-            if self.window_start + len(self.window) < item:
-                raise IndexError(f"{item} is out of range")
+        if self.window_start <= item < (self.window_start + len(self.window)):
             return self.window[item - self.window_start]
 
+        if self.row_count is not None and item >= self.row_count:
+            raise IndexError(f"{item} is out of range")
+
         # Set window
         self.update_window(item)
         if len(self.window) < 1:
             raise IndexError(f"{item} is out of range")
         return self.window[0]
 
+    def get_rows(self, start: int, count: int) -> List[Sequence[str]]:
+        # rows are taken directly from windows (row cache is not used)
+        res: List[Sequence[str]] = []
+        row, end = start, start + count
+        while row < end:
+            if not self.window_start <= row < self.window_start + len(self.window):
+                if self.row_count is not None and row >= self.row_count:
+                    break
+                self.update_window(row)
+                if len(self.window) < 1:
+                    break
+            window = self.window
+            stop = min(end - self.window_start, len(window))
+            res.extend(window[e] for e in range(row - self.window_start, stop))
+            row = self.window_start + stop
+        return res
+
     def __next__(self):
         if len(self.window) > 0:
             row = self.window[0]
@@ -169,65 +677,340 @@ class CsvSheetReader(SheetReader):
         else:
             raise StopIteration
 
-    @lru_cache
     def __len__(self):
-        res = 0
-        self.update_window(0)
-        while self.window:
-            res += len(self.window)
-            self.update_window(self.window_start + self.window_size)
-        return res
+        if self.row_count is None:
+            self.update_window(0)
+            while self.window:
+                self.update_window(self.window_start + self.window_size)
+        return self.row_count
+
+    def close(self):
+        self.row_cache.clear()
+        self.file.close()
+
+
+ASCII_SEPARATORS = "\n\r\t\"',;| "
+
+
+def _ascii_separators(encoding: str) -> bool:
+    """Checks whether newlines, quotes and delimiters are encoded as single ASCII bytes"""
+    try:
+        return ASCII_SEPARATORS.encode("ascii").decode(encoding) == ASCII_SEPARATORS
+    except UnicodeDecodeError:
+        return False
+
+
+def _lf_line_endings(file: IO[bytes], size: int = DIALECT_DETECTION_SIZE) -> bool:
+    """Checks whether lines in the first `size` bytes end with LF or CRLF (not with CR only)"""
+    position = file.tell()
+    file.seek(0)
+    sample = file.read(size)
+    file.seek(position)
+    if len(sample) == size:
+        sample = sample.rstrip(b"\r")  # CRLF may be cut at the end of the sample
+    return b"\r" not in sample.replace(b"\r\n", b"")
+
+
+class MmapCsvSheetReader(SheetReader):
+    """
+    Reads CSV file mapped into the memory
+
+    Offsets of all rows are stored while the file is scanned, so that any row
+    which was already reached is tokenized directly from the mapped data.
+    Page cache of the OS is used instead of caching decoded rows.
+    The encoding needs to encode separators as ASCII bytes (see `_ascii_separators`)
+    and lines need to end with LF or CRLF.
+    """
+
+    sheet_idx = 0
+    name = None
+    extra = None
+
+    def __init__(
+        self,
+        sheet_idx: int,
+        name: Optional[str],
+        file: IO[bytes],
+        encoding: str,
+        dialect: Optional[str] = None,
+    ):
+        self.name = name
+        self.sheet_idx = sheet_idx
+        self.file = file
+        self.encoding = encoding
+        self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if dialect is None:
+            sample = self.mmap[:DIALECT_DETECTION_SIZE].decode(encoding, errors="ignore")
+            dialect = detect_dialect(StringIO(sample))
+        self.dialect = dialect
+
+        self.row_offsets = array("Q", [0])  # row n is stored in [row_offsets[n], row_offsets[n+1])
+        self.row_count: Optional[int] = None  # known once the end of the file is reached
+        self.next_row = 0  # row which will be returned by __next__
+
+    def _lines(self, first: bytes) -> Iterator[str]:
+        yield first.decode(self.encoding)
+        for line in iter(self.mmap.readline, b""):
+            yield line.decode(self.encoding)
+
+    def scan(self, row: int):
+        """Finds offsets of rows until the end of `row` is known"""
+        if self.row_count is not None or row + 1 < len(self.row_offsets):
+            return
+
+        quotechar = (csv.get_dialect(self.dialect).quotechar or "").encode("ascii")
+        self.mmap.seek(self.row_offsets[-1])
+        while len(self.row_offsets) <= row + 1:
+            line = self.mmap.readline()
+            if not line:
+                self.row_count = len(self.row_offsets) - 1
+                return
+            if quotechar and quotechar in line:
+                # quoted cells may contain newlines, csv reader takes only the lines of the row
+                next(csv.reader(self._lines(line), self.dialect))
+            self.row_offsets.append(self.mmap.tell())
+
+    def __getitem__(self, item) -> Sequence[str]:
+        if isinstance(item, slice):
+            raise NotImplementedError("Slicing is not supported use itertools and generators")
+        if item < 0:
+            raise IndexError(f"{item} is out of range")
+
+        self.scan(item)
+        if item + 1 >= len(self.row_offsets):
+            raise IndexError(f"{item} is out of range")
+
+        text = self.mmap[self.row_offsets[item] : self.row_offsets[item + 1]].decode(self.encoding)
+        if "\r" in text:
+            # newlines in quoted cells are translated the same way as in text files
+            text = text.replace("\r\n", "\n")
+        return next(csv.reader([text], self.dialect))
+
+    def get_rows(self, start: int, count: int) -> List[Sequence[str]]:
+        # the whole block is decoded and tokenized at once
+        self.scan(start + count - 1)
+        end = min(start + count, len(self.row_offsets) - 1)
+        if not 0 <= start < end:
+            return []
+
+        text = self.mmap[self.row_offsets[start] : self.row_offsets[end]].decode(self.encoding)
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        return list(csv.reader(StringIO(text), self.dialect))
+
+    def __next__(self):
+        try:
+            row = self[self.next_row]
+        except IndexError:
+            raise StopIteration
+        self.next_row += 1
+        return row
+
+    def __len__(self):
+        if self.row_count is None:
+            self.scan(sys.maxsize)
+        return self.row_count
 
     def close(self):
+        self.mmap.close()
         self.file.close()
 
 
+RELEASE_PREFIXES = ("Report_Header.Release", "body.Report_Header.Release")
+REPORT_ITEMS_PREFIXES = ("Report_Items", "body.Report_Items")
+
+
+def detect_counter_release(file: IO[bytes]) -> Optional[str]:
+    """Reads `Release` from the header of COUNTER JSON report
+
+    Only the part of the file preceding `Report_Items` is parsed.
+    None is returned when the release can't be found there.
+    """
+    file.seek(0)
+    try:
+        for prefix, event, value in ijson.parse(file):
+            if prefix in RELEASE_PREFIXES:
+                return str(value).strip()
+            elif prefix in REPORT_ITEMS_PREFIXES or (prefix == "" and event == "start_array"):
+                break
+    except ijson.JSONError:
+        pass
+    finally:
+        file.seek(0)
+    return None
+
+
+def _ijson_report_items(file: IO[bytes]) -> Iterator[dict]:
+    """Streams Report_Items (the same way as nigiri does it)"""
+    for prefix in REPORT_ITEMS_PREFIXES:
+        file.seek(0)
+        items = ijson.items(file, f"{prefix}.item")
+        if first := next(items, None):
+            yield first
+            yield from items
+            return
+
+
+def _orjson_report_items(file: IO[bytes]) -> Iterator[dict]:
+    """Decodes the whole document at once, needs to fit into the memory
+
+    Note that non-integer numbers are floats (ijson returns Decimals).
+    The report is still validated by nigiri using ijson before, which decodes
+    the header and the first items (the whole document when the header follows the items).
+    """
+    file.seek(0)
+    document = orjson.loads(file.read())
+    for prefix in REPORT_ITEMS_PREFIXES:
+        items = document
+        for key in prefix.split("."):
+            items = items.get(key) if isinstance(items, dict) else None
+        if isinstance(items, list) and items and items[0]:
+            yield from items
+            return
+
+
+JSON_BACKENDS: Dict[str, Callable[[IO[bytes]], Iterator[dict]]] = {"ijson": _ijson_report_items}
+if orjson:
+    JSON_BACKENDS["orjson"] = _orjson_report_items
+
+
+def default_json_backend() -> str:
+    """Picks the fastest available backend for decoding Report_Items
+
+    ijson backed by a C library is about as fast as orjson, and it doesn't need to keep
+    the whole document in the memory. orjson is used only when ijson falls back
+    to its pure python implementation.
+    """
+    if ijson.backend in ("yajl2_c", "yajl2_cffi") or "orjson" not in JSON_BACKENDS:
+        return "ijson"
+    return "orjson"
+
+
 class JsonCounter5SheetReader(SheetReader):
+    """Reads Report_Items of COUNTER JSON
+
+    Items are parsed only once. Parsed items are pickled into a temporary spill file
+    and offsets of every n-th item are stored, so that moving the window backwards
+    doesn't require parsing the report again.
+    """
+
     WINDOW_SIZE = 1000  # number of lines to be cached
+    CACHE_SIZE = WINDOW_SIZE * 2  # cache lines to avoid rewinding while reading the header
+    ITEM_INDEX_STRIDE = 100  # spill file offset of every n-th item is stored
     sheet_idx = 0
     name = None
     extra = None
 
-    def reset(self):
-        try:
-            # Try to parse counter 5 format first
-            report = Counter5ReportBase()
+    def open_report(self) -> Tuple[dict, Iterator[dict]]:
+        """Returns header and items of the report"""
+        release = detect_counter_release(self.file)
+        if release == "5.1":
+            report_classes = [Counter51PRReport]
+        elif release == "5":
+            report_classes = [Counter5ReportBase]
+        else:
+            # Try to parse counter 5 format first, perhaps it is counter 51
+            report_classes = [Counter5ReportBase, Counter51PRReport]
 
+        for report_class in report_classes:
             self.file.seek(0)
+            report = report_class()
+            if report_class is Counter5ReportBase:
+                # validation of C5 reports stops at the first item with valid dates
+                # only in strict mode, otherwise all items would be decoded one more time
+                report.strict = True
+            try:
+                header, items = report.fd_to_dicts(self.file)
+                break
+            except SushiException:
+                if report_class is report_classes[-1]:
+                    raise
 
-            header, items = report.fd_to_dicts(self.file)
-        except SushiException:
-            # Perhaps it is counter 51
-            report = Counter51PRReport()
+        if report.record_found:
+            # nigiri is used only to validate the report, items are decoded by the backend
+            items = JSON_BACKENDS[self.json_backend](self.file)
 
-            self.file.seek(0)
-            header, items = report.fd_to_dicts(self.file)
+        return header, items
 
-        self.items = items
-        self.extra = header
+    def reset(self):
+        self.extra, self.items = self.open_report()
+
+        self.spill = tempfile.TemporaryFile()
+        self.item_index = array("Q")  # item_index[n] contains the offset of item n * stride
+        self.items_parsed = 0
+        self.items_exhausted = False
 
     def __init__(
         self,
         file: IO[bytes],
         window_size: int = WINDOW_SIZE,
+        cache_size: int = CACHE_SIZE,
+        item_index_stride: int = ITEM_INDEX_STRIDE,
+        json_backend: Optional[str] = None,
+        workers: Optional[int] = None,
     ):
         self.file = file
+        self.workers = workers  # processes used by parsers to convert items to records
+        self.row_cache = RowCache(cache_size)
+        self.item_index_stride = item_index_stride
+        self.json_backend = json_backend or default_json_backend()
+        if self.json_backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown json backend '{self.json_backend}'")
+        self.reset()
 
         self.window_start = 0
         self.window_size = window_size
         self.update_window(0)
 
+    def parse_item(self) -> Optional[dict]:
+        """Parses next item from the report and stores it into the spill file"""
+        if self.items_exhausted:
+            return None
+        try:
+            item_dict = next(self.items)
+        except StopIteration:
+            self.items_exhausted = True
+            return None
+
+        self.spill.seek(0, io.SEEK_END)
+        if self.items_parsed % self.item_index_stride == 0:
+            self.item_index.append(self.spill.tell())
+        pickle.dump(item_dict, self.spill, pickle.HIGHEST_PROTOCOL)
+        self.items_parsed += 1
+        return item_dict
+
+    def iter_items(self, start: int) -> Iterator[dict]:
+        """Iterates over items starting from `start`"""
+        if start >= self.items_parsed:
+            # spill file doesn't need to be read
+            idx, position = self.items_parsed, 0
+        else:
+            checkpoint = start // self.item_index_stride
+            idx = checkpoint * self.item_index_stride
+            position = self.item_index[checkpoint]
+        while True:
+            if idx < self.items_parsed:
+                # already parsed items are read from the spill file
+                self.spill.seek(position)
+                item_dict = pickle.load(self.spill)
+                position = self.spill.tell()
+            elif (item_dict := self.parse_item()) is None:
+                return
+            if idx >= start:
+                yield item_dict
+            idx += 1
+
     def update_window(self, window_start: int):
-        self.reset()
         self.window_start = window_start
         self.window = deque(
-            itertools.islice(self.items, self.window_start, self.window_start + self.window_size),
+            itertools.islice(self.iter_items(window_start), self.window_size),
             self.window_size,
         )
 
     def inc_window(self):
         try:
-            next_dict = next(self.items)
+            next_dict = next(self.iter_items(self.window_start + len(self.window)))
             self.window_start += 1
             self.window.append(next_dict)
         except StopIteration:
@@ -235,11 +1018,16 @@ class JsonCounter5SheetReader(SheetReader):
                 self.window_start += 1
                 self.window.popleft()
 
-    @lru_cache(WINDOW_SIZE * 2)  # cache lines to avoid rewinding while reading the header
-    def __getitem__(self, item) -> Sequence[dict]:
+    def __getitem__(self, item) -> dict:
         if isinstance(item, slice):
             raise NotImplementedError("Slicing is not supported use itertools and generators")
 
+        if (item_dict := self.row_cache.get(item)) is None:
+            item_dict = self.get_row(item)
+            self.row_cache.put(item, item_dict)
+        return item_dict
+
+    def get_row(self, item: int) -> dict:
         # in current window
         if self.window_start <= item < (self.window_start + self.window_size):
             if self.window_start + len(self.window) < item:
@@ -261,24 +1049,52 @@ class JsonCounter5SheetReader(SheetReader):
             raise StopIteration
 
     def __len__(self):
-        res = 0
-        while self.window:
-            res += len(self.window)
-            self.update_window(self.window_start + self.window_size)
-        return res
+        while self.parse_item() is not None:
+            pass
+        return self.items_parsed
 
     def close(self):
+        self.row_cache.clear()
+        self.spill.close()
         self.file.close()
 
     def dict_reader(self):
         raise NotImplementedError()
 
 
+class JsonLinesCounter5SheetReader(JsonCounter5SheetReader):
+    """Reads COUNTER report stored as JSON lines
+
+    The first line contains the header (either directly or under `Report_Header` key)
+    and each following line contains a single item of Report_Items.
+    """
+
+    def open_report(self) -> Tuple[dict, Iterator[dict]]:
+        if self.json_backend == "orjson":
+            loads = orjson.loads
+        else:
+            loads = functools.partial(json.loads, parse_float=decimal.Decimal)
+
+        self.file.seek(0)
+        lines = (line for line in self.file if line.strip())
+        header = loads(next(lines, b"{}"))
+        if not isinstance(header, dict):
+            raise SushiException("Incorrect format", content=header)
+        header = header.get("Report_Header", header)
+        report_class = Counter51PRReport if header.get("Release") == "5.1" else Counter5ReportBase
+        report_class().check_header(header, self.file)
+
+        return header, (loads(line) for line in lines)
+
+
 class TableReader(metaclass=ABCMeta):
     """
     Abstract reader for tabular data - defines the API to be used by parsers when reading input data
     """
 
+    # sheets are read only when accessed (it is worth to skip them if possible)
+    lazy_sheets: bool = False
+
     @abstractmethod
     def __getitem__(self, item) -> SheetReader:
         raise NotImplementedError()
@@ -287,35 +1103,96 @@ class TableReader(metaclass=ABCMeta):
     def __iter__(self):
         raise NotImplementedError()
 
+    def sheet_infos(self) -> List[SheetInfo]:
+        """Describes sheets without reading their content"""
+        return [SheetInfo(sheet.sheet_idx, sheet.name, sheet.extra, type(sheet)) for sheet in self]
+
+    def prepare(self, indices: Iterable[int]):
+        """Hints which sheets are going to be read, so they can be loaded in advance"""
+        pass
+
+    def close(self):
+        """Releases resources needed to read sheets which were not read yet"""
+        pass
+
 
 class CsvReader(TableReader):
     """
     Reads CSV file in stream mode
+
+    :param encoding_detection_size: encoding is detected only from the given number
+        of bytes at the beginning, None means that the whole file is used
+    :param detection_cache: mapping where detected encoding and dialect are stored under
+        the fingerprint of the file (see `file_fingerprint`) and `encoding_detection_size`,
+        so that the detection is skipped when the same file is read again
+    :param memory_map: files given by path are read by `MmapCsvSheetReader`
+        (unless their encoding doesn't allow it)
     """
 
-    def __init__(self, source: Union[IO, bytes, str, pathlib.Path]):
+    def __init__(
+        self,
+        source: Union[IO, bytes, str, pathlib.Path],
+        encoding_detection_size: Optional[int] = ENCODING_DETECTION_SIZE,
+        detection_cache: Optional[DetectionCache] = None,
+        memory_map: bool = False,
+    ):
         file: IO[str]
-        if isinstance(source, bytes):
-            encoding = detect_file_encoding(io.BytesIO(source))
-            logger.debug("Encoding '%s' was found for csv data", encoding)
-            file = StringIO(source.decode(encoding or "utf8"))
-        elif isinstance(source, (str, pathlib.Path)):
-            source = pathlib.Path(source)  # make user that source is Path
-            with source.open("rb") as f:
-                encoding = detect_file_encoding(f)
-            logger.debug("Encoding '%s' was found for csv file", encoding)
-            file = open(source, "r", encoding=encoding)
-        elif isinstance(source, (RawIOBase, BufferedIOBase)):
-            encoding = detect_file_encoding(source)
-            logger.debug("Encoding '%s' was found for csv data", encoding)
-            file = _TextIOWrapperNoClose(source, encoding=encoding)
-        elif isinstance(source, TextIOBase):
+        dialect = None
+        mapped = False
+        if isinstance(source, TextIOBase):
             # Opened as a text file => don't try to detect encoding
             file = source
         else:
-            raise NotImplementedError()
+            raw: IO[bytes]
+            if isinstance(source, bytes):
+                # BytesIO shares the buffer with bytes and the data are decoded incrementally
+                raw = BytesIO(source)
+            elif isinstance(source, (str, pathlib.Path)):
+                raw = pathlib.Path(source).open("rb")
+            elif isinstance(source, (RawIOBase, BufferedIOBase)):
+                raw = source
+            else:
+                raise NotImplementedError()
+
+            fingerprint = None
+            if detection_cache is not None:
+                # all bytes which are used for the detection need to be hashed
+                hashed_size = (
+                    None
+                    if encoding_detection_size is None
+                    else max(encoding_detection_size, FINGERPRINT_SIZE)
+                )
+                fingerprint = f"{file_fingerprint(raw, hashed_size)}:{encoding_detection_size}"
+                encoding, dialect = detection_cache.get(fingerprint, (None, None))
 
-        self.sheets = [CsvSheetReader(0, None, file)]
+            if dialect is None:
+                encoding = detect_encoding(raw, encoding_detection_size)
+            logger.debug("Encoding '%s' was found for csv data", encoding)
+
+            is_path = isinstance(source, (str, pathlib.Path))
+            # empty files can't be mapped, universal newlines are read only by CsvSheetReader
+            mapped = (
+                memory_map
+                and is_path
+                and _ascii_separators(encoding)
+                and os.fstat(raw.fileno()).st_size > 0
+                and _lf_line_endings(raw)
+            )
+            if is_path and not mapped:
+                file = TextIOWrapper(raw, encoding=encoding)
+            else:
+                file = _TextIOWrapperNoClose(raw, encoding=encoding)
+
+            if dialect is None:
+                dialect = detect_dialect(file)
+                if fingerprint is not None:
+                    detection_cache[fingerprint] = (encoding, dialect)
+
+        self.sheets: List[SheetReader]
+        if mapped:
+            self.sheets = [MmapCsvSheetReader(0, None, raw, encoding, dialect=dialect)]
+        else:
+            self.sheets = [CsvSheetReader(0, None, file, dialect=dialect)]
 
     def __getitem__(self, item) -> SheetReader:
         return self.sheets[item]
@@ -324,61 +1201,240 @@ class CsvReader(TableReader):
         return self.sheets.__iter__()
 
 
+def _source_path(source: Union[str, pathlib.Path, IO[bytes]], suffix: str) -> Tuple[str, bool]:
+    """Returns path of the source which can be opened in other processes
+
+    File-like sources are copied to a named temporary file.
+
+    :returns: path and whether the path is a temporary file which needs to be removed
+    """
+    if isinstance(source, (str, pathlib.Path)):
+        return str(source), False
+
+    source.seek(0)
+    with tempfile.NamedTemporaryFile("wb", suffix=suffix, delete=False) as f:
+        shutil.copyfileobj(source, f)
+    return f.name, True
+
+
+def _convert_concurrently(
+    convert, path: str, indices: List[int], workers: int
+) -> Iterator[Tuple[int, str]]:
+    """Runs `convert(path, indices)` in a process pool for subsets of indices
+
+    :returns: sheet indices and paths of converted CSV files
+    """
+    # split sheets in round-robin fashion (neighbouring sheets tend to have similar size)
+    chunks = [indices[i::workers] for i in range(min(workers, len(indices)))]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        for converted in executor.map(convert, itertools.repeat(path), chunks):
+            yield from converted
+
+
+def _open_converted_sheet(
+    idx: int, name: Optional[str], path: str, typed_cells: bool
+) -> CsvSheetReader:
+    f = open(path, "r", encoding="utf-8")
+    # data are available until the file is closed
+    os.unlink(path)
+    return CsvSheetReader(idx, name, f, dialect="unix", typed_cells=typed_cells)
+
+
+class _Lines(list):
+    """Collects lines written by csv.writer"""
+
+    write = list.append
+
+
+def _write_rows(
+    rows: Iterable[Sequence], f: IO[str], typed_cells: bool = False, chunk_size: int = 1000
+):
+    lines = _Lines()
+    # unix dialect escapes all by default
+    writer = csv.writer(lines, dialect=csv.get_dialect("unix"))
+    row_length = 0
+    last_row, last_line = None, ""
+    for row in rows:
+        if row is last_row:
+            # the same row object (e.g. an empty row) is serialized only once
+            lines.append(last_line)
+        else:
+            # Make sure that length of the row is extending
+            current_length = len(row)
+            row_length = max(row_length, current_length)
+            extra_cells = [""] * (row_length - current_length)
+
+            if typed_cells:
+                writer.writerow([*map(encode_typed_cell, row), *extra_cells])
+            else:
+                writer.writerow([*row, *extra_cells])
+            last_row, last_line = row, lines[-1]
+
+        if len(lines) >= chunk_size:
+            f.write("".join(lines))
+            lines.clear()
+    f.write("".join(lines))
+
+
+def _convert_xlsx_sheets(
+    reader_class, typed_cells: bool, path: str, indices: List[int]
+) -> List[Tuple[int, str]]:
+    """Converts sheets of XLSX file to named temporary CSV files (runs in a worker process)"""
+    workbook = reader_class.open_workbook(path)
+    try:
+        res = []
+        for idx in indices:
+            with tempfile.NamedTemporaryFile(
+                "w", suffix=".csv", encoding="utf-8", delete=False
+            ) as f:
+                _write_rows(reader_class.sheet_rows(workbook, idx), f, typed_cells)
+            res.append((idx, f.name))
+        return res
+    finally:
+        workbook.close()
+
+
 class XlsxReader(TableReader):
     """
-    Reads XLSX file in stream mode (TODO verify this)
+    Reads XLSX file in stream mode
+
+    Sheets are converted to temporary CSV files when they are accessed for the first time.
+    When `workers` is set, sheets are converted by a pool of processes in `prepare`.
+    When `typed_cells` is set, dates and numbers are returned as `TypedCell`.
     """
 
-    def __init__(self, source: Union[str, pathlib.Path, RawIOBase, BufferedIOBase]):
-        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False)
-        self.sheets = []
-
-        # Store each sheet as temporary CSV file
-        for idx, sheet in enumerate(workbook.worksheets):
-            # For some reason in it necessary to reset dimension for some files
-            # which display that only a single cell is present in the data
-            if sheet.calculate_dimension(force=True) == "A1:A1":
-                sheet.reset_dimensions()
-
-            # write data to csv
-            f = tempfile.TemporaryFile("w+")
-            # unix dialect escapes all by default
-            dialect = csv.get_dialect("unix")
-            writer = csv.writer(f, dialect=dialect)
-            row_length = 0
-            for row in sheet.rows:
-                # Make sure that length of the row is extending
-                current_length = len(row)
-                row_length = max(row_length, current_length)
-                extra_cells = [""] * (row_length - current_length)
-
-                writer.writerow([cell.value for cell in row] + extra_cells)
-            f.seek(0)
-            self.sheets.append(CsvSheetReader(idx, workbook.sheetnames[idx], f, dialect="unix"))
+    lazy_sheets = True
 
-        workbook.close()
+    def __init__(
+        self,
+        source: Union[str, pathlib.Path, RawIOBase, BufferedIOBase],
+        workers: Optional[int] = None,
+        typed_cells: bool = False,
+    ):
+        self.source = source
+        self.workers = workers
+        self.typed_cells = typed_cells
+        self.workbook = self.open_workbook(source)
+        self.sheet_names = self.workbook.sheetnames
+        self.sheets: List[Optional[CsvSheetReader]] = [None] * len(self.sheet_names)
+
+    @staticmethod
+    def open_workbook(source):
+        return openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False)
+
+    @staticmethod
+    def sheet_rows(workbook, idx: int) -> Iterable[Sequence]:
+        sheet = workbook.worksheets[idx]
+        # For some reason in it necessary to reset dimension for some files
+        # which display that only a single cell is present in the data
+        if sheet.calculate_dimension(force=True) == "A1:A1":
+            sheet.reset_dimensions()
+
+        return ([cell.value for cell in row] for row in sheet.rows)
+
+    def sheet_infos(self) -> List[SheetInfo]:
+        return [
+            SheetInfo(idx, name, None, CsvSheetReader) for idx, name in enumerate(self.sheet_names)
+        ]
+
+    def _convert_sheet(self, idx: int) -> CsvSheetReader:
+        if self.workbook is None:
+            raise RuntimeError("XlsxReader is already closed")
+
+        # write data to csv
+        f = tempfile.TemporaryFile("w+")
+        _write_rows(self.sheet_rows(self.workbook, idx), f, self.typed_cells)
+        f.seek(0)
+        return CsvSheetReader(
+            idx, self.sheet_names[idx], f, dialect="unix", typed_cells=self.typed_cells
+        )
+
+    def _set_sheet(self, idx: int, sheet: CsvSheetReader):
+        self.sheets[idx] = sheet
+        if all(e is not None for e in self.sheets):
+            # everything is converted, workbook is no longer needed
+            self.close()
+
+    def prepare(self, indices: Iterable[int]):
+        indices = [idx for idx in indices if self.sheets[idx] is None]
+        if not self.workers or self.workers < 2 or len(indices) < 2 or self.workbook is None:
+            return
+
+        path, is_temporary = _source_path(self.source, ".xlsx")
+        try:
+            convert = functools.partial(_convert_xlsx_sheets, type(self), self.typed_cells)
+            for idx, csv_path in _convert_concurrently(convert, path, indices, self.workers):
+                self._set_sheet(
+                    idx,
+                    _open_converted_sheet(idx, self.sheet_names[idx], csv_path, self.typed_cells),
+                )
+        finally:
+            if is_temporary:
+                os.unlink(path)
 
     def __getitem__(self, item) -> SheetReader:
-        return self.sheets[item]
+        idx = range(len(self.sheets))[item]
+        sheet = self.sheets[idx]
+        if sheet is None:
+            sheet = self._convert_sheet(idx)
+            self._set_sheet(idx, sheet)
+        return sheet
 
     def __iter__(self):
-        return self.sheets.__iter__()
+        self.prepare(range(len(self.sheets)))
+        for idx in range(len(self.sheets)):
+            yield self[idx]
+
+    def close(self):
+        if self.workbook is not None:
+            self.workbook.close()
+            self.workbook = None
+
+
+class XlsxStreamReader(XlsxReader):
+    """
+    Reads XLSX file by parsing XML of its worksheets directly
+
+    Produces the same sheets as `XlsxReader`, but it doesn't create openpyxl cell objects.
+    """
+
+    @staticmethod
+    def open_workbook(source):
+        return XlsxArchive(source)
+
+    @staticmethod
+    def sheet_rows(workbook, idx: int) -> Iterable[Sequence]:
+        return workbook.rows(idx)
 
 
 class JsonCounter5Reader(TableReader):
-    """Reads JSON file (in Counter 5 format) in stream mode"""
+    """Reads JSON file (in Counter 5 format) in stream mode
 
-    def __init__(self, source: Union[str, pathlib.Path, bytes]):
+    :param json_backend: backend used to decode Report_Items (see `JSON_BACKENDS`),
+        the fastest available one is used by default
+    :param workers: number of processes used to convert Report_Items to records
+    """
+
+    sheet_reader_class: Type[JsonCounter5SheetReader] = JsonCounter5SheetReader
+
+    def __init__(
+        self,
+        source: Union[str, pathlib.Path, bytes, RawIOBase, BufferedIOBase],
+        json_backend: Optional[str] = None,
+        workers: Optional[int] = None,
+    ):
         file: IO[bytes]
         if isinstance(source, bytes):
             file = BytesIO(source)
         elif isinstance(source, (str, pathlib.Path)):
             source = pathlib.Path(source)  # make user that source is Path
             file = open(source, "rb")
+        elif isinstance(source, (RawIOBase, BufferedIOBase)):
+            file = source
         else:
             raise ValueError("source")
 
-        self.sheets = [JsonCounter5SheetReader(file)]
+        self.sheets = [self.sheet_reader_class(file, json_backend=json_backend, workers=workers)]
 
     def __getitem__(self, item) -> SheetReader:
         return self.sheets[item]
@@ -387,19 +1443,77 @@ class JsonCounter5Reader(TableReader):
         return self.sheets.__iter__()
 
 
+class JsonLinesCounter5Reader(JsonCounter5Reader):
+    """Reads JSON lines file (in Counter 5 format) in stream mode"""
+
+    sheet_reader_class = JsonLinesCounter5SheetReader
+
+
 try:
     import xlrd
 except ImportError:
     XlsReader = None
 else:
 
+    def _xls_cell_value(cell: xlrd.sheet.Cell) -> Any:
+        if cell.ctype in [xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR]:
+            return ""
+
+        elif cell.ctype == xlrd.XL_CELL_TEXT:
+            return cell.value
+        elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+            return str(bool(cell.value))
+        elif cell.ctype == xlrd.XL_CELL_NUMBER:
+            # value is float
+            return cell.value
+        elif cell.ctype == xlrd.XL_CELL_DATE:
+            # value is float
+            return xlrd.xldate.xldate_as_datetime(cell.value, 0)
+
+        raise NotImplementedError()
+
+    def _xls_sheet_rows(sheet: xlrd.sheet.Sheet) -> Iterator[List[Any]]:
+        for rx in range(sheet.nrows):
+            yield [_xls_cell_value(cell) for cell in sheet.row(rx)]
+
+    def _convert_xls_sheets(
+        typed_cells: bool, path: str, indices: List[int]
+    ) -> List[Tuple[int, str]]:
+        """Converts sheets of XLS file to named temporary CSV files (runs in a worker process)"""
+        workbook = xlrd.open_workbook(filename=path, on_demand=True)
+        try:
+            res = []
+            for idx in indices:
+                with tempfile.NamedTemporaryFile(
+                    "w", suffix=".csv", encoding="utf-8", delete=False
+                ) as f:
+                    _write_rows(_xls_sheet_rows(workbook.sheet_by_index(idx)), f, typed_cells)
+                workbook.unload_sheet(idx)
+                res.append((idx, f.name))
+            return res
+        finally:
+            workbook.release_resources()
+
     class XlsReader(TableReader):  # noqa
         """
         Reads XLS file it probably loads entire file into memory
+
+        When `workers` is set, sheets are converted by a pool of processes.
+        When `typed_cells` is set, dates and numbers are returned as `TypedCell`.
         """
 
-        def __init__(self, source: Union[str, pathlib.Path, RawIOBase, BufferedIOBase]):
+        def __init__(
+            self,
+            source: Union[str, pathlib.Path, RawIOBase, BufferedIOBase],
+            workers: Optional[int] = None,
+            typed_cells: bool = False,
+        ):
+            self.typed_cells = typed_cells
             try:
+                if workers and workers > 1:
+                    self.sheets = self._convert_concurrently(source, workers)
+                    return
+
                 if isinstance(source, (RawIOBase, BufferedIOBase)):
                     workbook = xlrd.open_workbook(file_contents=source.read())
                 else:
@@ -413,43 +1527,38 @@ else:
 
                     # write data to csv
                     f = tempfile.TemporaryFile("w+")
-                    # unix dialect escapes all by default
-                    dialect = csv.get_dialect("unix")
-                    writer = csv.writer(f, dialect=dialect)
-                    row_length = sheet.ncols
-                    for rx in range(sheet.nrows):
-                        row = sheet.row(rx)
-
-                        # Make sure that length of the row is extending
-                        current_length = len(row)
-                        extra_cells = [""] * (row_length - current_length)
-
-                        writer.writerow([self._cell_to_str(cell) for cell in row] + extra_cells)
+                    _write_rows(_xls_sheet_rows(sheet), f, typed_cells)
                     f.seek(0)
 
-                    self.sheets.append(CsvSheetReader(idx, sheet.name, f, dialect="unix"))
+                    self.sheets.append(
+                        CsvSheetReader(idx, sheet.name, f, dialect="unix", typed_cells=typed_cells)
+                    )
                     workbook.unload_sheet(idx)
 
                 workbook.release_resources()
             except xlrd.compdoc.CompDocError as e:
                 raise XlsError(e) from e
 
-        def _cell_to_str(self, cell: xlrd.sheet.Cell) -> str:
-            if cell.ctype in [xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR]:
-                return ""
-
-            elif cell.ctype == xlrd.XL_CELL_TEXT:
-                return cell.value
-            elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
-                return str(bool(cell.value))
-            elif cell.ctype == xlrd.XL_CELL_NUMBER:
-                # value is float
-                return str(cell.value)
-            elif cell.ctype == xlrd.XL_CELL_DATE:
-                # value is float
-                return xlrd.xldate.xldate_as_datetime(cell.value, 0).isoformat(sep=" ")
-
-            raise NotImplementedError()
+        def _convert_concurrently(
+            self, source: Union[str, pathlib.Path, RawIOBase, BufferedIOBase], workers: int
+        ) -> List[CsvSheetReader]:
+            path, is_temporary = _source_path(source, ".xls")
+            try:
+                # only sheet names are loaded here
+                workbook = xlrd.open_workbook(filename=path, on_demand=True)
+                names = workbook.sheet_names()
+                workbook.release_resources()
+
+                indices = list(range(len(names)))
+                convert = functools.partial(_convert_xls_sheets, self.typed_cells)
+                converted = dict(_convert_concurrently(convert, path, indices, workers))
+                return [
+                    _open_converted_sheet(idx, name, converted[idx], self.typed_cells)
+                    for idx, name in enumerate(names)
+                ]
+            finally:
+                if is_temporary:
+                    os.unlink(path)
 
         def __getitem__(self, item) -> SheetReader:
             return self.sheets[item]
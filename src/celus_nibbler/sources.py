@@ -1,3 +1,4 @@
+import functools
 import typing
 from abc import ABCMeta, abstractmethod
 from dataclasses import field
@@ -9,11 +10,16 @@ from pydantic.dataclasses import dataclass, rebuild_dataclass
 from typing_extensions import Annotated
 
 from celus_nibbler import validators
-from celus_nibbler.coordinates import Coord, CoordRange, SheetAttr, Value
+from celus_nibbler.coordinates import Coord, CoordRange, Direction, SheetAttr, Value
 from celus_nibbler.errors import TableException
 from celus_nibbler.reader import SheetReader
 from celus_nibbler.utils import JsonEncorder, PydanticConfig
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 Source = typing.Union[Coord, CoordRange, SheetAttr, Value]
 
 
@@ -355,7 +361,10 @@ class ContentExtractorMixin:
         parser_row_offset: typing.Optional[int],
         area_row_offset: typing.Optional[int],
     ) -> typing.Any:
-        content = source.content(sheet, parser_row_offset, area_row_offset)
+        return self.transform(source.content(sheet, parser_row_offset, area_row_offset))
+
+    def transform(self, content: typing.Any) -> typing.Any:
+        """Applies regex, prefix and suffix to the content of the cell"""
         if regex := self.extract_params.regex:
             if extracted := regex.search(content):
                 content = extracted.group(1)
@@ -392,9 +401,11 @@ class ContentExtractorMixin:
             else:
                 raise
 
-        # try to apply overrides
-        for override in self.extract_params.value_overrides:
-            value = override.override(value)
+        return self.postprocess(value)
+
+    def postprocess(self, value: typing.Any) -> typing.Any:
+        """Applies overrides and skip condition to the extracted value"""
+        value = self.override(value)
 
         if skip_condition := self.extract_params.skip_condition:
             if skip_condition.check(value):
@@ -404,6 +415,11 @@ class ContentExtractorMixin:
 
         return value
 
+    def override(self, value: typing.Any) -> typing.Any:
+        for override in self.extract_params.value_overrides:
+            value = override.override(value)
+        return value
+
     def get_validator(
         self, validator: typing.Optional[typing.Type[validators.BaseValueModel]]
     ) -> typing.Optional[typing.Type[validators.BaseValueModel]]:
@@ -445,53 +461,18 @@ class ContentExtractorMixin:
 
         try:
             content = self.content(sheet, source, parser_row_offset, area_row_offset)
-            if validator := self.get_validator(validator):
-                if self.extract_params.default is not None:
-                    res = validators.gen_default_validator(
-                        validator,
-                        self.extract_params.default,
-                        self.extract_params.blank_values,
-                    )(value=content).value
-                elif self.extract_params.skip_validation:
-                    res = (content or "").strip()
-                else:
-                    res = validator(value=content).value
-
-            else:
-                res = content
+            res = self.validate(content, self.get_validator(validator))
         except ValidationError as e:
-            if isinstance(self.source, Value):
-                raise TableException(
-                    value=self.source.value,
-                    sheet=sheet.sheet_idx,
-                    reason="wrong-value",
-                    action=self.extract_params.on_validation_error,
-                )
-            elif isinstance(self.source, SheetAttr):
-                raise TableException(
-                    value=self.source.sheet_attr,
-                    sheet=sheet.sheet_idx,
-                    reason="wrong-sheet-attr",
-                    action=self.extract_params.on_validation_error,
-                )
-            else:
-                reason = e.title.lower()
-                # Try to Extract reason from exception args if present
-                if ctx := e.errors()[0].get("ctx"):
-                    if error := ctx.get("error"):
-                        if args := error.args:
-                            reason = ",".join(args)
-                raise TableException(
-                    content,
-                    row=getattr(source, "row_absolute", lambda x, y: None)(
-                        parser_row_offset,
-                        area_row_offset,
-                    ),
-                    col=getattr(source, "col", None),
-                    sheet=sheet.sheet_idx,
-                    reason=reason,
-                    action=self.extract_params.on_validation_error,
-                ) from e
+            raise self.validation_exception(
+                e,
+                content,
+                sheet.sheet_idx,
+                getattr(source, "row_absolute", lambda x, y: None)(
+                    parser_row_offset,
+                    area_row_offset,
+                ),
+                getattr(source, "col", None),
+            ) from e
         except IndexError as e:
             raise TableException(
                 row=getattr(source, "row_absolute", lambda x, y: None)(
@@ -510,6 +491,63 @@ class ContentExtractorMixin:
         self._last_area_row_offset = area_row_offset
         return res
 
+    def validate(
+        self,
+        content: typing.Any,
+        validator: typing.Optional[typing.Type[validators.BaseValueModel]],
+    ) -> typing.Any:
+        if not validator:
+            return content
+
+        if self.extract_params.default is not None:
+            validator = validators.gen_default_validator(
+                validator,
+                self.extract_params.default,
+                self.extract_params.blank_values,
+            )
+        elif self.extract_params.skip_validation:
+            return (content or "").strip()
+
+        return validators.validate(validator, content)
+
+    def validation_exception(
+        self,
+        error: ValidationError,
+        content: typing.Any,
+        sheet_idx: int,
+        row: typing.Optional[int],
+        col: typing.Optional[int],
+    ) -> TableException:
+        if isinstance(self.source, Value):
+            return TableException(
+                value=self.source.value,
+                sheet=sheet_idx,
+                reason="wrong-value",
+                action=self.extract_params.on_validation_error,
+            )
+        elif isinstance(self.source, SheetAttr):
+            return TableException(
+                value=self.source.sheet_attr,
+                sheet=sheet_idx,
+                reason="wrong-sheet-attr",
+                action=self.extract_params.on_validation_error,
+            )
+
+        reason = error.title.lower()
+        # Try to Extract reason from exception args if present
+        if ctx := error.errors()[0].get("ctx"):
+            if ctx_error := ctx.get("error"):
+                if args := ctx_error.args:
+                    reason = ",".join(args)
+        return TableException(
+            content,
+            row=row,
+            col=col,
+            sheet=sheet_idx,
+            reason=reason,
+            action=self.extract_params.on_validation_error,
+        )
+
     @property
     def validator(self) -> typing.Optional[typing.Type[validators.BaseValueModel]]:
         return None
@@ -729,3 +767,408 @@ class PublicationDateSource(JsonEncorder, ContentExtractorMixin):
     fallback: typing.Optional["PublicationDateSource"] = None
     cleanup_during_header_processing: bool = True
     role: typing.Literal[Role.PUBLICATION_DATE] = Role.PUBLICATION_DATE
+
+
+RANGE_STEPS = {
+    Direction.DOWN: (1, 0),
+    Direction.UP: (-1, 0),
+    Direction.RIGHT: (0, 1),
+    Direction.LEFT: (0, -1),
+}
+
+
+# validators which convert a cell containing only ASCII digits to the same integer
+NUMBER_VALIDATORS = (
+    validators.Value,
+    validators.ValueNegative,
+    validators.CommaSeparatedNumberValidator,
+)
+MAX_NUMBER_DIGITS = 18  # fits into int64
+
+
+def convert_numbers(cells: typing.Sequence[typing.Any]) -> typing.List[int]:
+    """Converts cells which contain only ASCII digits at once, -1 is returned for other cells"""
+    try:
+        data = np.array(cells, dtype=np.bytes_)
+    except (UnicodeError, TypeError, ValueError):
+        # non-ASCII content
+        return [-1] * len(cells)
+
+    numbers = np.full(len(cells), -1, dtype=np.int64)
+    if len(cells):
+        digits = np.char.isdigit(data) & (np.char.str_len(data) <= MAX_NUMBER_DIGITS)
+        numbers[digits] = data[digits].astype(np.int64)
+    return numbers.tolist()
+
+
+class Failure:
+    """Result of extraction which didn't produce a value
+
+    Extractors of a plan return it instead of raising `TableException`,
+    the exception is created only when it needs to be raised.
+    """
+
+    __slots__ = ("action", "make_exception")
+
+    def __init__(
+        self, action: TableException.Action, make_exception: typing.Callable[[], TableException]
+    ):
+        self.action = action
+        self.make_exception = make_exception
+
+    @classmethod
+    def from_exception(cls, exception: TableException) -> "Failure":
+        return cls(exception.action, lambda: exception)
+
+    def exception(self) -> TableException:
+        return self.make_exception()
+
+
+MISSING = object()  # content of a cell outside of the sheet
+
+
+class SourceExtractor:
+    """Extracts the source of a plan the usual way (used for sources which can't be compiled)"""
+
+    def __init__(
+        self,
+        plan: "ExtractionPlan",
+        source: ContentExtractorMixin,
+        validator: typing.Optional[typing.Type[validators.BaseValueModel]],
+    ):
+        self.plan = plan
+        self.source = source
+        self.validator = validator
+
+    @property
+    def last_key(self) -> typing.Optional[str]:
+        return getattr(self.source, "last_key", None)
+
+    def extract(self, idx: int) -> typing.Any:
+        plan = self.plan
+        return self.source.extract(
+            plan.sheet, idx, self.validator, plan.parser_row_offset, plan.area_row_offset
+        )
+
+    def try_extract(self, idx: int) -> typing.Any:
+        try:
+            return self.extract(idx)
+        except TableException as e:
+            # the exception is detached from frames (see `CompiledExtractor._invalid`)
+            e.__cause__ = e.__context__ = None
+            return Failure.from_exception(e.with_traceback(None))
+
+
+class CompiledExtractor:
+    """Extracts the source of a plan with its cell position and validator resolved in advance
+
+    Behaves the same way as `ContentExtractorMixin.extract`, but no `Coord` is created
+    and rows are fetched via the plan.
+    """
+
+    def __init__(
+        self,
+        plan: "ExtractionPlan",
+        source: ContentExtractorMixin,
+        validator: typing.Optional[typing.Type[validators.BaseValueModel]],
+    ):
+        self.plan = plan
+        self.source = source
+        self.params = source.extract_params
+        self.validator = source.get_validator(validator)
+        self.fallback = plan.compile(source.fallback, validator) if source.fallback else None
+        self.title_id = isinstance(source, TitleIdSource)
+        self.last_key: typing.Optional[str] = None
+
+        # position of the cell for idx is (row + idx * row_step, col + idx * col_step)
+        self.max_count: typing.Optional[int] = None
+        self.constant = None
+        coord = source.source
+        if isinstance(coord, CoordRange):
+            self.max_count = coord.max_count
+            self.row_step, self.col_step = RANGE_STEPS[coord.direction]
+            coord = coord.coord
+        else:
+            self.row_step, self.col_step = 0, 0
+        if isinstance(coord, Coord):
+            self.row, self.col = coord.row, coord.col
+            row_absolute = coord.row_absolute(plan.parser_row_offset, plan.area_row_offset)
+            self.row_offset = row_absolute - coord.row
+        else:
+            self.constant = coord
+
+        self.last_position: typing.Optional[typing.Tuple[int, int]] = None
+        self.last_extracted = None
+
+        # values of ranges of numbers are converted in blocks (see `ExtractionPlan.convert_numbers`)
+        params = self.params
+        self.vectorized = (
+            np is not None
+            and self.constant is None
+            and (self.row_step, self.col_step) == (1, 0)
+            and self.validator in NUMBER_VALIDATORS
+            and not (params.regex or params.prefix or params.suffix or params.value_overrides)
+            and params.skip_condition is None
+            and not params.last_value_as_default
+            and not params.skip_validation
+            and not (
+                params.default is not None
+                and any(isinstance(e, str) and e.isdigit() for e in params.blank_values)
+            )
+        )
+        self.numbers: typing.List[int] = []  # converted values of indexes from `numbers_start`
+        self.numbers_start = self.numbers_end = 0  # indexes covered by the last conversion
+
+    @classmethod
+    def can_compile(cls, source: ContentExtractorMixin) -> bool:
+        if isinstance(source, DateSource) and source.composed:
+            return False
+        return isinstance(source.source, (Coord, CoordRange, Value, SheetAttr))
+
+    def number_indexes(self, first_idx: int, end_idx: int) -> range:
+        """Indexes which may be converted as numbers (exceeding limits is handled by `_extract`)"""
+        if self.max_count is not None:
+            end_idx = min(end_idx, self.max_count)
+        if self.params.max_idx is not None:
+            end_idx = min(end_idx, self.params.max_idx + 1)
+        return range(first_idx, end_idx)
+
+    def extract(self, idx: int) -> typing.Any:
+        value = self.try_extract(idx)
+        if value.__class__ is Failure:
+            raise value.exception()
+        return value
+
+    def try_extract(self, idx: int) -> typing.Any:
+        """Same as `extract`, but `Failure` is returned instead of raising `TableException`"""
+        if self.vectorized and self.plan.batch_end is not None:
+            if not self.numbers_start <= idx < self.numbers_end:
+                self.plan.convert_numbers(idx)
+            position = idx - self.numbers_start
+            if 0 <= position < len(self.numbers) and (number := self.numbers[position]) >= 0:
+                return number
+
+        self.last_key = None
+        value = self._extract(idx)
+        if value.__class__ is Failure:
+            if value.action == TableException.Action.PASS and self.fallback:
+                value = self.fallback.try_extract(idx)
+                if self.title_id and value.__class__ is not Failure:
+                    self.last_key = self.fallback.last_key or self.source.name
+            return value
+
+        params = self.params
+        if params.last_value_as_default:
+            params.default = value
+
+        if params.value_overrides:
+            value = self.source.override(value)
+        if (skip_condition := params.skip_condition) and skip_condition.check(value):
+            return Failure(
+                TableException.Action.SKIP,
+                functools.partial(
+                    TableException,
+                    value=value,
+                    reason="skip-extracted",
+                    action=TableException.Action.SKIP,
+                ),
+            )
+
+        if self.title_id:
+            self.last_key = self.source.name
+        return value
+
+    def _out_of_bounds(self, row: typing.Optional[int], col: typing.Optional[int]) -> Failure:
+        return Failure(
+            TableException.Action.STOP,
+            functools.partial(
+                TableException,
+                row=row,
+                col=col,
+                sheet=self.plan.sheet.sheet_idx,
+                reason="out-of-bounds",
+                action=TableException.Action.STOP,
+            ),
+        )
+
+    def _invalid(
+        self,
+        error: ValidationError,
+        content: typing.Any,
+        row: typing.Optional[int],
+        col: typing.Optional[int],
+    ) -> Failure:
+        # The error is not kept (not even as a cause), its traceback references frames
+        # of the callers which hold the failure, so it would be freed only by the gc.
+        return Failure.from_exception(
+            self.source.validation_exception(error, content, self.plan.sheet.sheet_idx, row, col)
+        )
+
+    def _extract(self, idx: int) -> typing.Any:
+        plan = self.plan
+        source = self.source
+
+        if self.constant is not None:
+            row = col = None
+            position = None
+        else:
+            if self.max_count is not None and self.max_count <= idx:
+                raise IndexError(f"{idx} is not in range of {source.source}")
+            row = self.row + idx * self.row_step
+            col = self.col + idx * self.col_step
+            # ranges going up or left end at the first row or column
+            if (self.row_step < 0 and row < 0) or (self.col_step < 0 and col < 0):
+                raise IndexError(f"{idx} is not in range of {source.source}")
+            position = (row, col)
+            row += self.row_offset
+
+        if self.params.max_idx is not None and idx > self.params.max_idx:
+            return self._out_of_bounds(row, col)
+
+        if position == self.last_position and self.last_extracted:
+            # Same value will be extracted from the same coord
+            return self.last_extracted
+        self.last_position = position
+
+        if self.constant is None:
+            content = plan.cell(row, col)
+            if content is MISSING:
+                return self._out_of_bounds(row, col)
+        else:
+            try:
+                content = self.constant.content(
+                    plan.sheet, plan.parser_row_offset, plan.area_row_offset
+                )
+            except IndexError:
+                return self._out_of_bounds(row, col)
+
+        content = source.transform(content)
+        try:
+            res = source.validate(content, self.validator)
+        except ValidationError as e:
+            return self._invalid(e, content, row, col)
+
+        self.last_extracted = res
+        return res
+
+
+class ExtractionPlan:
+    """Sources of an area compiled for the sheet and offsets of the parser and the area
+
+    Positions of cells and validators are resolved only once per source
+    and each row of the sheet is fetched only once for every `idx`.
+    """
+
+    def __init__(
+        self,
+        sheet: SheetReader,
+        parser_row_offset: typing.Optional[int],
+        area_row_offset: typing.Optional[int],
+    ):
+        self.sheet = sheet
+        self.parser_row_offset = parser_row_offset
+        self.area_row_offset = area_row_offset
+        self.rows: typing.Dict[int, typing.Any] = {}
+        self.extractors: typing.Dict[typing.Tuple[int, typing.Any], typing.Any] = {}
+        self.batch_end: typing.Optional[int] = None  # end of indexes passed to `fetch_rows`
+
+    def compile(
+        self,
+        source: ContentExtractorMixin,
+        validator: typing.Optional[typing.Type[validators.BaseValueModel]] = None,
+    ) -> typing.Union[CompiledExtractor, SourceExtractor]:
+        key = (id(source), validator)
+        if (extractor := self.extractors.get(key)) is None:
+            if CompiledExtractor.can_compile(source):
+                try:
+                    extractor = CompiledExtractor(self, source, validator)
+                except RuntimeError:
+                    pass  # offset needed by the coordinate is not set
+            if extractor is None:
+                extractor = SourceExtractor(self, source, validator)
+            self.extractors[key] = extractor
+        return extractor
+
+    def next_row(self):
+        """Forgets rows fetched for the previous `idx`"""
+        self.rows.clear()
+
+    def fetch_rows(self, first_idx: int, count: int):
+        """Forgets fetched rows and reads rows of compiled ranges for `count` indexes at once
+
+        Rows are read from the sheet in blocks and kept until the next call,
+        other rows are fetched on demand.
+        """
+        self.rows.clear()
+        self.batch_end = first_idx + count
+        spans = []
+        for extractor in self.extractors.values():
+            if isinstance(extractor, CompiledExtractor) and extractor.row_step:
+                first = extractor.row_offset + extractor.row + first_idx * extractor.row_step
+                last = first + (count - 1) * extractor.row_step
+                start, end = max(min(first, last), 0), max(first, last) + 1
+                if start < end:
+                    spans.append((start, end))
+
+        merged: typing.List[typing.List[int]] = []
+        for start, end in sorted(spans):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        for start, end in merged:
+            rows = self.sheet.get_rows(start, end - start)
+            self.rows.update(zip(range(start, start + len(rows)), rows))
+            if len(rows) < end - start:
+                # the end of the sheet was reached
+                self.rows.update(dict.fromkeys(range(start + len(rows), end)))
+
+    def convert_numbers(self, first_idx: int):
+        """Converts cells of vectorized extractors from `first_idx` to the end of the batch at once
+
+        It is called once the first value is needed, so rows which are skipped
+        before reaching the values are not converted. Cells which are not plain numbers
+        are left to the regular extraction, so that errors are reported the same way.
+        """
+        extractors = [
+            e
+            for e in self.extractors.values()
+            if isinstance(e, CompiledExtractor)
+            and e.vectorized
+            and not e.numbers_start <= first_idx < e.numbers_end
+        ]
+        cells: typing.List[typing.Any] = []
+        blocks = []
+        for extractor in extractors:
+            start = len(cells)
+            row = extractor.row_offset + extractor.row
+            for idx in extractor.number_indexes(first_idx, self.batch_end or first_idx):
+                content = self.cell(row + idx, extractor.col)
+                cells.append("" if content is MISSING else content)
+            blocks.append((extractor, start, len(cells)))
+
+        numbers = convert_numbers(cells)
+        for extractor, start, end in blocks:
+            extractor.numbers = numbers[start:end]
+            extractor.numbers_start = first_idx
+            extractor.numbers_end = self.batch_end or first_idx
+
+    def _fetch_row(self, row: int) -> typing.Optional[typing.Sequence[typing.Any]]:
+        try:
+            res = self.sheet[row]
+        except IndexError:
+            res = None
+        self.rows[row] = res
+        return res
+
+    def cell(self, row: int, col: int) -> typing.Any:
+        """Content of the cell, `MISSING` is returned for cells outside of the sheet"""
+        try:
+            content = self.rows[row]
+        except KeyError:
+            content = self._fetch_row(row)
+
+        if content is None or not -len(content) <= col < len(content):
+            return MISSING
+        return content[col]
@@ -15,6 +15,8 @@ COMMON_DATE_FORMATS = [
     "%y-%b",
 ]
 
+BATCH_SIZE = 1000  # number of records which are passed together
+
 
 @contextlib.contextmanager
 def profile(*args, **kwargs):
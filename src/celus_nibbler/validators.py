@@ -1,5 +1,6 @@
 import datetime
 import inspect
+import math
 import re
 from functools import lru_cache
 from typing import Any, List, Optional, Tuple, Type, Union
@@ -10,10 +11,15 @@ from isbnlib import get_isbnlike, is_isbn10, is_isbn13
 from pydantic import NonNegativeFloat, NonNegativeInt, field_validator
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 
+from .reader import TypedCell
 from .utils import COMMON_DATE_FORMATS, PydanticConfig
 
 issn_matcher = re.compile(r"(\d{4})-?(\d{3}[\dXx])")
 issn_number_matcher = re.compile(r"^\d{0,7}[\dXx]$")
+plain_number_matcher = re.compile(r"-?\d+(\.\d+)?", re.ASCII)
+
+# longer decimal numbers are left to pydantic, which may parse them as exact integers
+MAX_DECIMAL_LENGTH = 15
 
 
 @pydantic_dataclass(config=PydanticConfig)
@@ -23,6 +29,27 @@ class BaseValueModel:
 
     value: Any
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> Any:
+        """Validates the value without creating the model
+
+        It has to return the same value as the model does. `ValueError` is raised
+        when the value can't be handled here, the model is used to validate it then.
+        """
+        raise ValueError("not-compiled")
+
+
+def validate(validator: Type[BaseValueModel], value: Any) -> Any:
+    """Validates the value using the fast validator of the model
+
+    The model itself is used only when the fast validator is not able
+    to handle the value, so invalid values are reported by pydantic.
+    """
+    try:
+        return validator.validate_fast(value)
+    except ValueError:
+        return validator(value=value).value
+
 
 def non_empty(name: str) -> str:
     if not name:
@@ -42,6 +69,13 @@ def not_none(value: Any) -> Any:
     return value
 
 
+def typed_number(value: Any) -> Any:
+    """Uses native number of a typed cell instead of parsing its text"""
+    if isinstance(value, TypedCell) and isinstance(value.value, (int, float)):
+        return value.value
+    return value
+
+
 def issn(issn: str) -> str:
     return issn.strip() or ""
 
@@ -71,17 +105,62 @@ def remove_multiple_spaces(value: Optional[str]) -> str:
     return value and re.sub(r"\s+", " ", value)
 
 
+def plain_str(value: Any) -> str:
+    """Accepts strings the same way as `str` field does"""
+    if not isinstance(value, str):
+        raise ValueError("not-a-string")
+    return str(value)
+
+
+def plain_number(value: Any) -> Union[int, float]:
+    """Accepts numbers the same way as `Union[int, float]` field does
+
+    Only native numbers and plain integers or decimal numbers written in text are handled.
+    """
+    value_type = type(value)
+    if value_type is int:
+        return value
+    elif value_type is float:
+        if not math.isfinite(value):
+            raise ValueError("not-finite")
+        return value
+    elif isinstance(value, str) and plain_number_matcher.fullmatch(value):
+        if "." not in value:
+            return int(value)
+        elif len(value) <= MAX_DECIMAL_LENGTH:
+            return float(value)
+    raise ValueError("not-a-plain-number")
+
+
+def non_negative_number(value: Any) -> Union[int, float]:
+    if (number := plain_number(value)) < 0:
+        raise ValueError("negative-number")
+    return number
+
+
+def date_from_datetime(value: datetime.datetime) -> datetime.date:
+    """Converts datetime the same way as `datetime.date` field does"""
+    if value.tzinfo is not None or value.time() != datetime.time():
+        raise ValueError("date-from-datetime-inexact")
+    return value.date()
+
+
 @pydantic_dataclass(config=PydanticConfig)
 class Value(BaseValueModel):
     name = "value"
     value: Union[NonNegativeInt, NonNegativeFloat]
 
     _stripped_value = field_validator("value", mode="before")(stripped)
+    _typed_value = field_validator("value", mode="before")(typed_number)
 
     @field_validator("value")
     def non_negative(cls, value: Union[NonNegativeInt, NonNegativeFloat]) -> int:
         return round(value)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> int:
+        return round(non_negative_number(stripped(typed_number(value))))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class ValueNegative(BaseValueModel):
@@ -92,6 +171,10 @@ class ValueNegative(BaseValueModel):
     def non_negative(cls, value: Union[int, float]) -> Union[int, float]:
         return round(value)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> int:
+        return round(plain_number(value))
+
 
 @lru_cache
 def gen_default_validator(
@@ -109,6 +192,13 @@ def gen_default_validator(
             else:
                 return orig_validator(value=value).value
 
+        @classmethod
+        def validate_fast(cls, value: Any) -> Any:
+            if value in blank_values:
+                return default_value
+            else:
+                return orig_validator.validate_fast(value)
+
     return Validator
 
 
@@ -121,6 +211,10 @@ class CommaSeparatedNumberValidator(BaseValueModel):
     def comma_separeted_number(cls, value: str) -> str:
         return Value(value=value.replace(",", "")).value
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> int:
+        return Value.validate_fast(plain_str(value).replace(",", ""))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class MinutesToSecondsValidator(BaseValueModel):
@@ -131,6 +225,10 @@ class MinutesToSecondsValidator(BaseValueModel):
     def minutes_to_seconds(cls, value: Union[float, int]) -> int:
         return round(value * 60)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> int:
+        return round(non_negative_number(value) * 60)
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class HoursToSecondsValidator(BaseValueModel):
@@ -141,6 +239,10 @@ class HoursToSecondsValidator(BaseValueModel):
     def hours_to_seconds(cls, value: Union[float, int]) -> int:
         return round(value * 60 * 60)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> int:
+        return round(non_negative_number(value) * 60 * 60)
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class DurationToSecondsValidator(BaseValueModel):
@@ -157,6 +259,10 @@ class DurationToSecondsValidator(BaseValueModel):
         except ValueError:
             raise ValueError("cant-parse-duration")
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> int:
+        return non_negative_number(cls.duration_to_seconds(plain_str(value)))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class Organization(BaseValueModel):
@@ -168,6 +274,10 @@ class Organization(BaseValueModel):
     _non_empty_organization = field_validator("value")(non_empty)
     _remove_multiple_spaces = field_validator("value")(remove_multiple_spaces)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return remove_multiple_spaces(non_empty(stripped(plain_str(value))))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class Platform(BaseValueModel):
@@ -177,6 +287,10 @@ class Platform(BaseValueModel):
     _stripped_platform = field_validator("value")(stripped)
     _non_empty_platform = field_validator("value")(non_empty)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return non_empty(stripped(plain_str(value)))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class Dimension(BaseValueModel):
@@ -186,6 +300,10 @@ class Dimension(BaseValueModel):
     _stripped_dimension = field_validator("value")(stripped)
     _remove_multiple_spaces = field_validator("value")(remove_multiple_spaces)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return remove_multiple_spaces(stripped(plain_str(value)))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class Metric(BaseValueModel):
@@ -203,6 +321,11 @@ class Metric(BaseValueModel):
             raise ValueError("cant-be-digit")
         return metric
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        value = remove_multiple_spaces(non_empty(stripped(plain_str(value))))
+        return cls.not_digit(value)
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class Title(BaseValueModel):
@@ -212,6 +335,12 @@ class Title(BaseValueModel):
     _stripped_title = field_validator("value")(stripped)
     _remove_multiple_spaces = field_validator("value")(remove_multiple_spaces)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return remove_multiple_spaces(stripped(plain_str(value)))
+
 
 parserinfo_us = datetimes_parser.parserinfo(dayfirst=False)  # prefer US variant
 parserinfo_eu = datetimes_parser.parserinfo(dayfirst=True)  # prefer EU variant
@@ -239,6 +368,9 @@ class Date(BaseValueModel):
         if not date:
             raise ValueError("no-date-provided")
 
+        if isinstance(date, TypedCell) and isinstance(date.value, datetime.datetime):
+            return cls.align_date(date.value)
+
         # Check for common formats (faster that dateutil)
         for fmt in COMMON_DATE_FORMATS:
             try:
@@ -252,6 +384,14 @@ class Date(BaseValueModel):
         except datetimes_parser.ParserError:
             raise ValueError("cant-parse-date")
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> datetime.date:
+        if not isinstance(value, str):
+            raise ValueError("not-a-string")
+        # typed cells are needed to parse the date and
+        # the remaining validators don't change parsed dates
+        return date_from_datetime(cls.to_datetime(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class DateEU(Date):
@@ -272,6 +412,10 @@ class DateAligned(Date):
         # Don't perfrom auto aligment
         return input
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> datetime.date:
+        return date_aligned(super().validate_fast(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class DateEUAligned(DateEU):
@@ -283,6 +427,10 @@ class DateEUAligned(DateEU):
         # Don't perfrom auto aligment
         return input
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> datetime.date:
+        return date_aligned(super().validate_fast(value))
+
 
 @lru_cache
 def gen_date_format_validator(pattern: str) -> Type[BaseValueModel]:
@@ -305,6 +453,10 @@ def gen_date_format_validator(pattern: str) -> Type[BaseValueModel]:
             except ValueError:
                 raise ValueError("cant-parse-date")
 
+        @classmethod
+        def validate_fast(cls, value: Any) -> datetime.date:
+            return cls.to_datetime(plain_str(value))
+
     return DateFormat
 
 
@@ -317,6 +469,10 @@ class DOI(BaseValueModel):
     def check_doi(cls, doi: str) -> str:
         return doi.strip() or ""
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return cls.check_doi(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class URI(BaseValueModel):
@@ -327,6 +483,10 @@ class URI(BaseValueModel):
     def check_uri(cls, uri: str) -> str:
         return uri.strip() or ""
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return cls.check_uri(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class ISBN(BaseValueModel):
@@ -337,6 +497,10 @@ class ISBN(BaseValueModel):
     def check_isbn(cls, isbn: str) -> str:
         return isbn.strip() or ""
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return cls.check_isbn(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class StrictISBN(BaseValueModel):
@@ -359,6 +523,10 @@ class StrictISBN(BaseValueModel):
 
         return isbn
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return cls.check_isbn(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class StrictISBN13(BaseValueModel):
@@ -381,6 +549,10 @@ class StrictISBN13(BaseValueModel):
 
         return isbn
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return cls.check_isbn(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class StrictISBN10(BaseValueModel):
@@ -403,6 +575,10 @@ class StrictISBN10(BaseValueModel):
 
         return isbn
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return cls.check_isbn(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class ISSN(BaseValueModel):
@@ -411,6 +587,10 @@ class ISSN(BaseValueModel):
 
     _issn_format = field_validator("value")(issn)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return issn(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class StrictISSN(BaseValueModel):
@@ -419,6 +599,10 @@ class StrictISSN(BaseValueModel):
 
     _issn_format = field_validator("value")(issn_strict)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return issn_strict(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class EISSN(BaseValueModel):
@@ -427,6 +611,10 @@ class EISSN(BaseValueModel):
 
     _issn_format = field_validator("value")(issn)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return issn(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class StrictEISSN(BaseValueModel):
@@ -435,12 +623,20 @@ class StrictEISSN(BaseValueModel):
 
     _issn_format = field_validator("value")(issn_strict)
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return issn_strict(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class ProprietaryID(BaseValueModel):
     name = "proprietary_id"
     value: str
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return plain_str(value)
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class AuthorsValidator(BaseValueModel):
@@ -467,6 +663,10 @@ class AuthorsValidator(BaseValueModel):
 
         return res
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> List[Author]:
+        return cls.authors(plain_str(value))
+
 
 @pydantic_dataclass(config=PydanticConfig)
 class YOPValidator(BaseValueModel):
@@ -482,5 +682,9 @@ class YOPValidator(BaseValueModel):
 
         return yop
 
+    @classmethod
+    def validate_fast(cls, value: Any) -> str:
+        return cls.yop(plain_str(value))
+
 
 validators = [e for e in locals().values() if inspect.isclass(e) and issubclass(e, BaseValueModel)]
@@ -0,0 +1,251 @@
+"""
+Minimal reader of XLSX packages which parses XML of worksheets directly
+
+Values of cells are converted the same way as openpyxl does in read-only mode,
+but no cell objects are created - rows are yielded as plain tuples.
+"""
+
+import pathlib
+import posixpath
+import zipfile
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+from xml.etree.ElementTree import fromstring, iterparse
+
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import coordinate_to_tuple, range_boundaries
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel
+from openpyxl.utils.datetime import from_ISO8601 as from_iso8601
+from openpyxl.xml.constants import PKG_REL_NS, REL_NS, SHEET_MAIN_NS
+
+ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+CELL_TAG = f"{{{SHEET_MAIN_NS}}}c"
+VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
+INLINE_STRING_TAG = f"{{{SHEET_MAIN_NS}}}is"
+TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+RUN_TAG = f"{{{SHEET_MAIN_NS}}}r"
+STRING_ITEM_TAG = f"{{{SHEET_MAIN_NS}}}si"
+DIMENSION_TAG = f"{{{SHEET_MAIN_NS}}}dimension"
+SHEET_DATA_TAG = f"{{{SHEET_MAIN_NS}}}sheetData"
+RELATIONSHIP_TAG = f"{{{PKG_REL_NS}}}Relationship"
+
+Row = Tuple[Any, ...]
+
+
+def _rels_path(part: str) -> str:
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", f"{name}.rels")
+
+
+def _text_content(element) -> str:
+    """Text of shared or inline string (phonetic runs are ignored)"""
+    text = element.findtext(TEXT_TAG) or ""
+    text += "".join(run.findtext(TEXT_TAG) or "" for run in element.iterfind(RUN_TAG))
+    return text.replace("x005F_", "")
+
+
+def _cast_number(value: str) -> Union[int, float]:
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+class XlsxArchive:
+    """Workbook in XLSX file, worksheets are parsed on demand"""
+
+    def __init__(self, source: Union[str, pathlib.Path, IO[bytes]]):
+        self.archive = zipfile.ZipFile(source)
+
+        workbook_part = self._relationships("")["officeDocument"][0]
+        workbook = fromstring(self.archive.read(workbook_part))
+        relationships = self._relationships(workbook_part)
+
+        properties = workbook.find(f"{{{SHEET_MAIN_NS}}}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+        self.epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        worksheet_parts = dict(relationships.get("worksheet_ids", []))
+        self.sheetnames: List[str] = []
+        self.sheet_parts: List[str] = []
+        for sheet in workbook.iterfind(f"{{{SHEET_MAIN_NS}}}sheets/{{{SHEET_MAIN_NS}}}sheet"):
+            part = worksheet_parts.get(sheet.get(f"{{{REL_NS}}}id"))
+            if part:  # chartsheets are not included
+                self.sheetnames.append(sheet.get("name"))
+                self.sheet_parts.append(part)
+
+        self.date_formats, self.timedelta_formats = self._read_styles(
+            relationships.get("styles", [None])[0]
+        )
+        self.shared_strings_part = relationships.get("sharedStrings", [None])[0]
+        self._shared_strings: Optional[List[str]] = None
+
+    def _relationships(self, part: str) -> Dict[str, List]:
+        """Targets of relationships of the part grouped by the type
+
+        For worksheets also (id, target) pairs are stored under `worksheet_ids`.
+        """
+        try:
+            root = fromstring(self.archive.read(_rels_path(part)))
+        except KeyError:
+            return {}
+
+        res: Dict[str, List] = {}
+        folder = posixpath.dirname(part)
+        for rel in root.iter(RELATIONSHIP_TAG):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            kind = rel.get("Type", "").rsplit("/", 1)[-1]
+            res.setdefault(kind, []).append(target)
+            if kind == "worksheet":
+                res.setdefault("worksheet_ids", []).append((rel.get("Id"), target))
+        return res
+
+    def _read_styles(self, part: Optional[str]) -> Tuple[Set[int], Set[int]]:
+        """Indexes of cell styles which contain dates and time deltas"""
+        if not part:
+            return set(), set()
+
+        root = fromstring(self.archive.read(part))
+        custom = {
+            int(e.get("numFmtId")): e.get("formatCode")
+            for e in root.iterfind(f"{{{SHEET_MAIN_NS}}}numFmts/{{{SHEET_MAIN_NS}}}numFmt")
+        }
+        date_formats, timedelta_formats = set(), set()
+        xfs = root.iterfind(f"{{{SHEET_MAIN_NS}}}cellXfs/{{{SHEET_MAIN_NS}}}xf")
+        for idx, xf in enumerate(xfs):
+            fmt_id = int(xf.get("numFmtId", 0))
+            fmt = custom[fmt_id] if fmt_id in custom else builtin_format_code(fmt_id)
+            if is_date_format(fmt):
+                date_formats.add(idx)
+            if is_timedelta_format(fmt):
+                timedelta_formats.add(idx)
+        return date_formats, timedelta_formats
+
+    @property
+    def shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            self._shared_strings = []
+            if self.shared_strings_part:
+                with self.archive.open(self.shared_strings_part) as f:
+                    for _, element in iterparse(f):
+                        if element.tag == STRING_ITEM_TAG:
+                            self._shared_strings.append(_text_content(element))
+                            element.clear()
+        return self._shared_strings
+
+    def dimensions(self, idx: int) -> Optional[Tuple[int, int, int, int]]:
+        """Dimensions (min_col, min_row, max_col, max_row) stored in the worksheet"""
+        with self.archive.open(self.sheet_parts[idx]) as f:
+            for _, element in iterparse(f, events=("start",)):
+                if element.tag == DIMENSION_TAG:
+                    try:
+                        return range_boundaries(element.get("ref"))
+                    except (TypeError, ValueError):
+                        return None
+                elif element.tag == SHEET_DATA_TAG:
+                    break
+        return None
+
+    def _cell_value(self, element) -> Any:
+        data_type = element.get("t", "n")
+        if data_type == "inlineStr":
+            child = element.find(INLINE_STRING_TAG)
+            return None if child is None else _text_content(child)
+
+        value = element.findtext(VALUE_TAG) or None
+        if value is None:
+            return None
+
+        if data_type == "n":
+            number = _cast_number(value)
+            style_id = int(element.get("s", 0))
+            if style_id in self.date_formats:
+                try:
+                    return from_excel(
+                        number, self.epoch, timedelta=style_id in self.timedelta_formats
+                    )
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return number
+        elif data_type == "s":
+            return self.shared_strings[int(value)]
+        elif data_type == "b":
+            return bool(int(value))
+        elif data_type == "d":
+            return from_iso8601(value)
+        return value
+
+    def parsed_rows(self, idx: int) -> Iterator[Tuple[int, List[Tuple[int, Any]]]]:
+        """Rows present in the worksheet as (row number, [(column number, value)])"""
+        row_counter = 0
+        sheet_data = None
+        with self.archive.open(self.sheet_parts[idx]) as f:
+            for event, element in iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if element.tag == SHEET_DATA_TAG:
+                        sheet_data = element
+                    continue
+                elif element.tag != ROW_TAG:
+                    continue
+
+                row_number = element.get("r")
+                row_counter = int(float(row_number)) if row_number else row_counter + 1
+                col_counter = 0
+                cells = []
+                for cell in element.iterfind(CELL_TAG):
+                    coordinate = cell.get("r")
+                    if coordinate:
+                        col_counter = coordinate_to_tuple(coordinate)[1]
+                    else:
+                        col_counter += 1
+                    cells.append((col_counter, self._cell_value(cell)))
+                # processed rows are detached, so that the tree doesn't grow with the sheet
+                if sheet_data is not None:
+                    sheet_data.clear()
+                else:
+                    element.clear()
+                yield row_counter, cells
+
+    def rows(self, idx: int) -> Iterator[Row]:
+        """Rows of the worksheet padded the same way as `ReadOnlyWorksheet.rows` pads them"""
+        dimensions = self.dimensions(idx)
+        if dimensions is None:
+            # dimensions need to be calculated from the data
+            max_col, max_row = 0, None
+            for row_number, cells in self.parsed_rows(idx):
+                if cells:
+                    max_col, max_row = max(max_col, cells[-1][0]), row_number
+            dimensions = (1, 1, max_col or None, max_row)
+
+        _, _, max_col, max_row = dimensions
+        if dimensions == (1, 1, 1, 1) or max_col is None or max_row is None:
+            # Some files display that only a single cell is present in the data
+            max_col = max_row = None
+
+        empty_row: Row = (None,) * max_col if max_col else ()
+        counter = 1
+        for row_number, cells in self.parsed_rows(idx):
+            if max_row is not None and row_number > max_row:
+                break
+
+            # some rows are missing
+            while counter < row_number:
+                counter += 1
+                yield empty_row
+
+            if counter <= row_number:
+                counter += 1
+                if not cells and not max_col:
+                    yield ()
+                    continue
+                width = max_col or cells[-1][0]
+                row = [None] * width
+                for column, value in cells:
+                    if column <= width:
+                        row[column - 1] = value
+                yield tuple(row)
+
+    def close(self):
+        self.archive.close()
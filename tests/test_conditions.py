@@ -2,8 +2,15 @@ import json
 
 import pytest
 
-from celus_nibbler.conditions import IsDateCondition, RegexCondition, StemmerCondition
+from celus_nibbler.conditions import (
+    IsDateCondition,
+    RegexCondition,
+    SheetIdxCondition,
+    SheetNameRegexCondition,
+    StemmerCondition,
+)
 from celus_nibbler.coordinates import Coord, CoordRange, Direction, RelativeTo
+from celus_nibbler.reader import CsvSheetReader, SheetInfo
 
 
 def test_regex(csv_sheet_reader):
@@ -247,3 +254,26 @@ def test_serialization():
             regex_dict,
         ],
     }
+
+
+def test_check_sheet_info():
+    info = SheetInfo(2, "ips_org1", None, CsvSheetReader)
+    name = SheetNameRegexCondition("^ips_")
+    idx = SheetIdxCondition(max=1)
+    regex = RegexCondition("^Name$", Coord(0, 0))
+
+    assert name.check_sheet_info(info) is True
+    assert idx.check_sheet_info(info) is False
+    # content is required
+    assert regex.check_sheet_info(info) is None
+
+    assert (~name).check_sheet_info(info) is False
+    assert (~regex).check_sheet_info(info) is None
+
+    assert (name & regex).check_sheet_info(info) is None
+    assert (idx & regex).check_sheet_info(info) is False
+    assert (name & ~idx).check_sheet_info(info) is True
+
+    assert (name | regex).check_sheet_info(info) is True
+    assert (idx | regex).check_sheet_info(info) is None
+    assert (idx | ~name).check_sheet_info(info) is False
@@ -6,6 +6,8 @@ import pytest
 
 from celus_nibbler import eat
 from celus_nibbler.errors import NoParserMatchesHeuristics, TableException
+from celus_nibbler.parsers.counter import c5json
+from celus_nibbler.reader import JsonCounter5SheetReader
 
 
 @pytest.mark.parametrize(
@@ -802,6 +804,62 @@ def test_success(file, parser, heuristics, success, extras, months):
             assert next(reader) is None, "No more date present in the file"
 
 
+def test_json_months_single_pass(monkeypatch):
+    source_path = pathlib.Path(__file__).parent / "data/counter/5/DR-d.json"
+    poop = eat(source_path, "Platform1", parsers=["static.counter5.DR.Json"], use_heuristics=False)[
+        0
+    ]
+    records = list(poop.records_with_stats())
+    assert len(records) > 0
+
+    # months and stats are collected while reading the records
+    monkeypatch.setattr(
+        JsonCounter5SheetReader, "__getitem__", lambda *args: pytest.fail("sheet read again")
+    )
+    assert poop.get_months() == [[date(2020, 1, 1)]]
+    assert list(poop.months) == ["2020-01"]
+    assert poop.get_stats() == poop.current_stats
+
+
+@pytest.mark.parametrize(
+    "file,json_file,parser",
+    (
+        ("5/TR-sample.jsonl", "5/TR-sample.json", "static.counter5.TR.Json"),
+        ("51/PR_sample_r51.ndjson", "51/PR_sample_r51.json", "static.counter51.PR.Json"),
+    ),
+)
+def test_json_lines(file, json_file, parser):
+    source_path = pathlib.Path(__file__).parent / "data/counter" / file
+    output_path = pathlib.Path(__file__).parent / "data/counter" / f"{json_file}.out"
+
+    poop = eat(source_path, "Platform1", check_platform=False, use_heuristics=True)[0]
+    assert poop.parser.name == parser
+
+    with output_path.open() as f:
+        assert [list(e.as_csv()) for e in poop.records()] == list(csv.reader(f))
+
+
+@pytest.mark.parametrize(
+    "file,parser",
+    (
+        ("5/DR-sample.json", "static.counter5.DR.Json"),
+        ("5/TR-sample.json", "static.counter5.TR.Json"),
+        ("51/IR_sample_r51.json", "static.counter51.IR.Json"),
+        ("51/PR_sample_r51.json", "static.counter51.PR.Json"),
+    ),
+)
+def test_json_workers(file, parser, monkeypatch):
+    monkeypatch.setattr(c5json, "REPORT_CHUNK_SIZE", 2)
+    source_path = pathlib.Path(__file__).parent / "data/counter" / file
+    poop = eat(source_path, "Platform1", parsers=[parser], check_platform=False)[0]
+    expected = [e.as_csv() for e in poop.records()]
+
+    poop = eat(source_path, "Platform1", parsers=[parser], check_platform=False, workers=2)[0]
+    assert poop.parser.sheet.workers == 2
+    assert [e.as_csv() for e in poop.records()] == expected
+    assert len(expected) > 2
+
+
 @pytest.mark.parametrize(
     "file,parser,months",
     (
@@ -462,6 +462,10 @@ from celus_nibbler.parsers.dynamic import gen_parser
     ),
 )
 def test_dynamic(filename, ext, parser, ignore_order):
+    check_dynamic(filename, ext, parser, ignore_order, typed_cells=False)
+
+
+def check_dynamic(filename, ext, parser, ignore_order, typed_cells):
     definition_path = pathlib.Path(__file__).parent / "data/dynamic" / f"{filename}.json"
     input_path = pathlib.Path(__file__).parent / "data/dynamic" / f"{filename}.{ext}"
     output_path = pathlib.Path(__file__).parent / "data/dynamic" / f"{filename}.{ext}.out"
@@ -484,6 +488,7 @@ def test_dynamic(filename, ext, parser, ignore_order):
             check_platform=False,
             parsers=[parser],
             dynamic_parsers=dynamic_parsers,
+            typed_cells=typed_cells,
         )
 
         idx = 0
@@ -510,6 +515,32 @@ def test_dynamic(filename, ext, parser, ignore_order):
             assert next(reader) is None, f"No more date present in the file (read {idx})."
 
 
+@pytest.mark.parametrize(
+    "filename,ext,parser,ignore_order",
+    (
+        ("sheet_attr", "xlsx", "dynamic.non_counter.simple_format.sheet_attr", False),
+        ("sheet_attr", "xls", "dynamic.non_counter.simple_format.sheet_attr", False),
+        ("counter5.TR", "xlsx", "dynamic.counter5.TR.MY_TR_CUSTOM", False),
+        ("counter5.DR_MY_CUSTOM", "xlsx", "dynamic.counter5.MY_DR.DR_MY_CUSTOM", False),
+        (
+            "non_counter/my-date-metric-based",
+            "xlsx",
+            "dynamic.non_counter.simple_format.my-date-metric-based",
+            True,
+        ),
+        (
+            "organization_sheet_name",
+            "xlsx",
+            "dynamic.non_counter.org_sheet_name.org_sheet_name",
+            False,
+        ),
+    ),
+)
+def test_dynamic_typed_cells(filename, ext, parser, ignore_order):
+    # typed cells should not change the output
+    check_dynamic(filename, ext, parser, ignore_order, typed_cells=True)
+
+
 @pytest.mark.parametrize(
     "name,ext,parser,exception",
     (
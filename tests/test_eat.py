@@ -1,14 +1,33 @@
+import bz2
+import gzip
+import io
 import json
+import lzma
+import os
 import pathlib
+import tracemalloc
+import zipfile
 
-from celus_nibbler import Poop, eat
+import pytest
+
+from celus_nibbler import Poop, eat, eat_and_poop, eat_archive, eat_data
+from celus_nibbler import reader as reader_module
 from celus_nibbler.definitions import Definition
+from celus_nibbler.eat_and_poop import FILE_FORMATS, read_data, read_file
 from celus_nibbler.errors import (
+    ArchiveMemberError,
     MultipleParsersFound,
     NoParserForPlatformFound,
     NoParserMatchesHeuristics,
+    WrongFileFormatError,
 )
 from celus_nibbler.parsers.dynamic import gen_parser
+from celus_nibbler.reader import (
+    ENCODING_DETECTION_SIZE,
+    MmapCsvSheetReader,
+    XlsxReader,
+    XlsxStreamReader,
+)
 
 
 def test_eat():
@@ -165,6 +184,63 @@ def test_eat():
     }
 
 
+def test_eat_skips_sheets_by_sheet_info(monkeypatch):
+    data_path = pathlib.Path(__file__).parent / "data/dynamic/non_counter"
+    file_path = data_path / "my-metric-based.xlsx"
+    definition_path = data_path / "my-metric-based.json"
+    with definition_path.open() as f:
+        definition = json.load(f)
+    dynamic_parsers = [gen_parser(Definition.parse(definition))]
+
+    converted = []
+    convert_sheet = XlsxReader._convert_sheet
+
+    def _convert_sheet(self, idx):
+        converted.append(idx)
+        return convert_sheet(self, idx)
+
+    monkeypatch.setattr(XlsxReader, "_convert_sheet", _convert_sheet)
+
+    # "ips_" sheets are ruled out by sheet name and are not converted
+    poops = eat(
+        file_path,
+        "My Platform",
+        parsers=[r"(?!static)"],
+        dynamic_parsers=dynamic_parsers,
+    )
+    assert converted == [0]
+    assert isinstance(poops[0], Poop)
+    assert [e.dict() for e in poops[1:]] == [
+        {
+            "name": "NoParserMatchesHeuristics",
+            "sheet_idx": idx,
+            # parsers which ruled the sheet out are not analyzed
+            "parsers_info": {"dynamic.non_counter.simple_format.my-metric-based": []},
+        }
+        for idx in range(1, 4)
+    ]
+
+    # without heuristics all sheets need to be converted
+    converted.clear()
+    eat(
+        file_path,
+        "My Platform",
+        parsers=[r"(?!static)"],
+        dynamic_parsers=dynamic_parsers,
+        use_heuristics=False,
+    )
+    assert converted == [0, 1, 2, 3]
+
+
+def test_read_file_xlsx_engine():
+    file_path = pathlib.Path(__file__).parent / "data/reader/test-simple.xlsx"
+    assert type(read_file(file_path)) is XlsxReader
+    assert type(read_file(file_path, xlsx_engine="openpyxl")) is XlsxReader
+    assert type(read_file(file_path, xlsx_engine="stream")) is XlsxStreamReader
+    with pytest.raises(ValueError):
+        read_file(file_path, xlsx_engine="unknown")
+
+
 def test_parsers_info_of_c5_json():
     file_path = pathlib.Path(__file__).parent / "data/counter/5/TR_J1-sample.json"
 
@@ -191,3 +267,204 @@ def test_parsers_info_of_c5_json():
             ],
         },
     }
+
+
+@pytest.mark.parametrize(
+    "wrapper",
+    [bytes, memoryview, io.BytesIO, lambda data: io.BufferedReader(io.BytesIO(data))],
+    ids=["bytes", "memoryview", "bytesio", "buffered"],
+)
+@pytest.mark.parametrize(
+    "file", ["5/TR-sample.tsv", "5/TR-sample.json", "5/TR-sample.jsonl", "51/PR_sample_r51.ndjson"]
+)
+def test_eat_data(file, wrapper):
+    file_path = pathlib.Path(__file__).parent / "data/counter" / file
+    expected = [[e.as_csv() for e in poop.records()] for poop in eat(file_path, "Platform1")]
+
+    poops = eat_data(wrapper(file_path.read_bytes()), "Platform1")
+    assert [[e.as_csv() for e in poop.records()] for poop in poops] == expected
+
+
+@pytest.mark.parametrize("wrapper", [bytes, bytearray, memoryview])
+@pytest.mark.parametrize("file", ["reader/test-simple.xlsx", "reader/test-simple.xls"])
+def test_read_data_spreadsheets(file, wrapper):
+    file_path = pathlib.Path(__file__).parent / "data" / file
+    expected = [list(map(list, sheet)) for sheet in read_file(file_path)]
+    reader = read_data(wrapper(file_path.read_bytes()))
+    assert [list(map(list, sheet)) for sheet in reader] == expected
+
+
+@pytest.mark.parametrize("wrapper", [bytes, bytearray, memoryview])
+def test_read_data_not_copied(wrapper):
+    data = wrapper("název,počet\nŽluťoučký kůň,1\n".encode() * 200000)
+    tracemalloc.start()
+    try:
+        sheet = read_data(data, file_format="csv")[0]
+        assert sheet[0] == ["název", "počet"]
+        assert sheet[399999] == ["Žluťoučký kůň", "1"]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < len(data) / 2
+
+
+def test_read_data_format():
+    with pytest.raises(WrongFileFormatError):
+        read_data(b"a,b,c", file_format="unknown")
+    assert set(FILE_FORMATS.values()) == {"csv", "xlsx", "xls", "json", "jsonl"}
+
+
+def test_eat_memory_mapped(monkeypatch):
+    file_path = pathlib.Path(__file__).parent / "data/counter/5/TR-sample.tsv"
+    expected = [[e.as_csv() for e in poop.records()] for poop in eat(file_path, "Platform1")]
+
+    monkeypatch.setattr(eat_and_poop, "MEMORY_MAP_SIZE", 0)
+    assert isinstance(read_file(file_path)[0], MmapCsvSheetReader)
+    poops = eat(file_path, "Platform1")
+    assert [[e.as_csv() for e in poop.records()] for poop in poops] == expected
+
+
+def test_eat_detection_cache(monkeypatch):
+    file_path = pathlib.Path(__file__).parent / "data/counter/5/TR-sample.tsv"
+    cache = {}
+    expected = [[e.as_csv() for e in poop.records()] for poop in eat(file_path, "Platform1")]
+    poops = eat(file_path, "Platform1", detection_cache=cache)
+    assert [[e.as_csv() for e in poop.records()] for poop in poops] == expected
+    assert len(cache) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("detection was not skipped")
+
+    monkeypatch.setattr(reader_module, "detect_encoding", fail)
+    monkeypatch.setattr(reader_module, "detect_csv_dialect", fail)
+    poops = eat(file_path, "Platform1", detection_cache=cache)
+    assert [[e.as_csv() for e in poop.records()] for poop in poops] == expected
+    poops = eat_data(file_path.read_bytes(), "Platform1", detection_cache=cache)
+    assert [[e.as_csv() for e in poop.records()] for poop in poops] == expected
+
+
+def test_read_file_encoding_detection_size(monkeypatch, tmp_path):
+    detected = []
+
+    def detect_file_encoding(file):
+        detected.append(len(file.read()))
+        return "cp1250"
+
+    monkeypatch.setattr(reader_module, "detect_file_encoding", detect_file_encoding)
+    file_path = tmp_path / "data.csv"
+    lines = 2 * ENCODING_DETECTION_SIZE // 20
+    file_path.write_bytes(("název,počet\n" + "Žluťoučký kůň,1\n" * lines).encode("cp1250"))
+
+    sheet = read_file(file_path)[0]
+    assert sheet[0] == ["název", "počet"]
+    assert sheet[lines] == ["Žluťoučký kůň", "1"]
+    # encoding of files is detected only from their beginning
+    assert len(detected) == 1 and detected[0] <= ENCODING_DETECTION_SIZE
+
+
+@pytest.mark.parametrize("newline,mapped", [("\n", True), ("\r\n", True), ("\r", False)])
+def test_read_file_memory_mapped_newlines(newline, mapped, monkeypatch, tmp_path):
+    monkeypatch.setattr(eat_and_poop, "MEMORY_MAP_SIZE", 0)
+    file_path = tmp_path / "data.csv"
+    file_path.write_bytes(newline.join(["Title,Value", "A,1", "B,2", ""]).encode())
+
+    sheet = read_file(file_path)[0]
+    # CR-only lines are read by CsvSheetReader which uses universal newlines
+    assert isinstance(sheet, MmapCsvSheetReader) is mapped
+    assert list(sheet) == [["Title", "Value"], ["A", "1"], ["B", "2"]]
+
+
+@pytest.mark.parametrize(
+    "file,file_format",
+    [
+        ("5/TR-sample.tsv", None),
+        ("5/TR-sample.json", None),
+        ("5/TR-sample.json", "json"),
+        ("5/TR-sample.jsonl", None),
+    ],
+)
+def test_eat_data_stream(file, file_format):
+    file_path = pathlib.Path(__file__).parent / "data/counter" / file
+    expected = [[e.as_csv() for e in poop.records()] for poop in eat(file_path, "Platform1")]
+
+    read_fd, write_fd = os.pipe()
+    with open(write_fd, "wb") as f:
+        f.write(file_path.read_bytes())
+    with open(read_fd, "rb") as pipe:
+        assert not pipe.seekable()
+        poops = eat_data(pipe, "Platform1", file_format=file_format)
+        assert [[e.as_csv() for e in poop.records()] for poop in poops] == expected
+
+
+@pytest.mark.parametrize(
+    "file,name,compress",
+    [
+        ("5/TR-sample.tsv", "TR.tsv.gz", gzip.compress),
+        ("5/TR-sample.json", "TR.json.bz2", bz2.compress),
+        ("5/TR-sample.jsonl", "TR.jsonl.xz", lzma.compress),
+        ("5/TR-sample.tsv", "TR.xz", lzma.compress),
+        ("5/TR-sample.json", "TR.gz", gzip.compress),
+    ],
+)
+def test_eat_compressed(file, name, compress, tmp_path):
+    file_path = pathlib.Path(__file__).parent / "data/counter" / file
+    expected = [[e.as_csv() for e in poop.records()] for poop in eat(file_path, "Platform1")]
+
+    compressed_path = tmp_path / name
+    compressed_path.write_bytes(compress(file_path.read_bytes()))
+    poops = eat(compressed_path, "Platform1")
+    assert [[e.as_csv() for e in poop.records()] for poop in poops] == expected
+
+
+@pytest.mark.parametrize("member_workers", [None, 3])
+def test_eat_archive(member_workers, tmp_path):
+    data_path = pathlib.Path(__file__).parent / "data"
+    members = {
+        "2020/TR.tsv": data_path / "counter/5/TR-sample.tsv",
+        "2020/TR.json": data_path / "counter/5/TR-sample.json",
+        "2021/TR.jsonl.gz": data_path / "counter/5/TR-sample.jsonl",
+        "2021/PR.json": data_path / "counter/51/PR_sample_r51.json",
+        "simple.xlsx": data_path / "reader/test-simple.xlsx",
+    }
+    archive_path = tmp_path / "reports.zip"
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.mkdir("empty")
+        for name, path in members.items():
+            data = path.read_bytes()
+            archive.writestr(name, gzip.compress(data) if name.endswith(".gz") else data)
+        archive.writestr("README.txt", "Monthly reports")
+
+    res = eat_archive(archive_path, "Platform1", member_workers=member_workers)
+    assert list(res) == [*members, "README.txt"]
+    assert res["README.txt"] == [WrongFileFormatError("README.txt", ".txt")]
+
+    def records(poops):
+        return [[e.as_csv() for e in poop.records()] for poop in poops if isinstance(poop, Poop)]
+
+    for name, path in members.items():
+        expected = eat(path, "Platform1")
+        assert [type(e) for e in res[name]] == [type(e) for e in expected]
+        assert records(res[name]) == records(expected)
+
+
+def test_eat_archive_member_errors(tmp_path, monkeypatch):
+    file_path = pathlib.Path(__file__).parent / "data/counter/5/TR-sample.tsv"
+    archive_path = tmp_path / "reports.zip"
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("broken.tsv.gz", b"not gzip data")
+        archive.writestr("TR.tsv", file_path.read_bytes())
+
+    def seek(*args, **kwargs):
+        raise AssertionError("member would be decompressed again")
+
+    # streamed members are spooled, so they are not seeked
+    monkeypatch.setattr(zipfile.ZipExtFile, "seek", seek)
+
+    res = eat_archive(archive_path, "Platform1", member_workers=2)
+    [error] = res["broken.tsv.gz"]
+    assert isinstance(error, ArchiveMemberError)
+    assert error.member == "broken.tsv.gz"
+    assert isinstance(error.exception, gzip.BadGzipFile)
+
+    expected = [[e.as_csv() for e in poop.records()] for poop in eat(file_path, "Platform1")]
+    assert [[e.as_csv() for e in poop.records()] for poop in res["TR.tsv"]] == expected
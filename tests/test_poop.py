@@ -1,8 +1,14 @@
 import pathlib
 from datetime import date
 
+import pytest
+from celus_nigiri import CounterRecord
+
 from celus_nibbler import PoopOrganizationStats, PoopStats, eat
+from celus_nibbler.aggregator import CheckConflictingRecordsAggregator, CheckNonNegativeValues
 from celus_nibbler.eat_and_poop import StatUnit
+from celus_nibbler.errors import NegativeValueInOutput, SameRecordsInOutput
+from celus_nibbler.sources import ExtractionPlan, ValueSource
 
 
 def test_extra_poop_info():
@@ -358,6 +364,77 @@ def test_poop_offset_limit():
     )
 
 
+def test_poop_record_batches():
+    file_path = pathlib.Path(__file__).parent / "data/counter/4/BR1-a.tsv"
+    poops = eat(file_path, "Ovid", parsers=["static.counter4.BR1.Tabular"])
+    assert poops and len(poops) == 1
+
+    poop = poops[0]
+    records = list(poop.records())
+    # batches contain records of rows
+    assert [len(e) for _, e in poop.parser.parse_batches(batch_size=1)] == [12, 12]
+    assert [e for _, batch in poop.parser.parse_batches(batch_size=1) for e in batch] == records
+
+    for offset, limit in [(0, None), (12, None), (0, 10), (18, 10), (5, 0)]:
+        batches = list(poop.record_batches(offset=offset, limit=limit))
+        assert all(batches)
+        assert [e for batch in batches for e in batch] == records[offset:][:limit]
+        assert sum(poop.area_counter.values()) == len(records[offset:][:limit])
+
+
+def test_parse_batches_value_extractors_compiled(monkeypatch):
+    compiled = []
+    fetch_rows = ExtractionPlan.fetch_rows
+
+    def recorded(self, first_idx, count):
+        compiled.append(sum(isinstance(e.source, ValueSource) for e in self.extractors.values()))
+        return fetch_rows(self, first_idx, count)
+
+    monkeypatch.setattr(ExtractionPlan, "fetch_rows", recorded)
+    file_path = pathlib.Path(__file__).parent / "data/counter/4/BR1-a.tsv"
+    poops = eat(file_path, "Ovid", parsers=["static.counter4.BR1.Tabular"])
+    assert poops and len(poops) == 1
+
+    compiled.clear()
+    assert len(list(poops[0].records())) == 24
+    # rows of values are known to the plan before the first rows are fetched
+    assert compiled and compiled == [12] * len(compiled)
+
+
+@pytest.mark.parametrize(
+    "aggregator,values,error",
+    [
+        (CheckNonNegativeValues, [1, 2, 3, -1, 5], NegativeValueInOutput),
+        (CheckConflictingRecordsAggregator, [1, 2, 3, 1, 5], SameRecordsInOutput),
+    ],
+)
+def test_aggregate_batches_yields_valid_records(aggregator, values, error):
+    records = [
+        CounterRecord(
+            start=date(2022, 1, 1),
+            end=date(2022, 1, 31),
+            metric="M1",
+            title=f"T{value}",
+            value=value,
+        )
+        for value in values
+    ]
+
+    expected = []
+    with pytest.raises(error) as expected_error:
+        for record in aggregator().aggregate(iter(records)):
+            expected.append(record)
+    assert expected == records[:3]
+
+    yielded = []
+    with pytest.raises(error) as e:
+        for batch in aggregator().aggregate_batches([records[:2], records[2:]]):
+            yielded.append(batch)
+    # records preceding the failing one are yielded first, same as by `aggregate`
+    assert yielded == [records[:2], records[2:3]]
+    assert e.value == expected_error.value
+
+
 def test_stats():
     assert PoopStats() + PoopStats() == PoopStats(), "empty stats"
 
@@ -1,16 +1,45 @@
-from io import BytesIO, StringIO
+import csv
+import datetime
+import gc
+import io
+import itertools
+import json
+import tracemalloc
+import weakref
+from decimal import Decimal
+from io import BufferedReader, BytesIO, RawIOBase, StringIO
 from pathlib import Path
 
+import ijson
 import pytest
+from celus_nigiri import counter5
+from celus_nigiri.counter5 import Counter5ReportBase
+from celus_nigiri.exceptions import SushiException
 
+from celus_nibbler import reader as reader_module
+from celus_nibbler import xlsx_stream
 from celus_nibbler.errors import XlsError
 from celus_nibbler.reader import (
+    JSON_BACKENDS,
+    BufferStream,
+    CompactRows,
     CsvReader,
     CsvSheetReader,
     JsonCounter5Reader,
     JsonCounter5SheetReader,
+    JsonLinesCounter5Reader,
+    MmapCsvSheetReader,
+    SpooledStream,
+    TypedCell,
+    TypedCompactRows,
     XlsReader,
     XlsxReader,
+    XlsxStreamReader,
+    detect_counter_release,
+    detect_dialect,
+    detect_encoding,
+    detect_file_format,
+    encode_typed_cell,
 )
 
 
@@ -66,6 +95,69 @@ class TestCsvSheetReader:
         reader = CsvSheetReader(0, None, sheet_csv, window_size=window_size)
         assert len(reader) == 5
 
+    @pytest.mark.parametrize("row_index_stride", [None, 1, 3])
+    @pytest.mark.parametrize("window_size", [2, 100])
+    def test_random_access(self, window_size, row_index_stride):
+        data = "".join(
+            f'Row {i},"multi\nline {i}",{i}\n' if i % 4 == 0 else f"Row {i},single,{i}\n"
+            for i in range(20)
+        )
+        expected = list(csv.reader(StringIO(data)))
+        reader = CsvSheetReader(
+            0,
+            None,
+            StringIO(data),
+            window_size=window_size,
+            row_index_stride=row_index_stride,
+        )
+        for idx in [19, 0, 7, 3, 18, 4, 12, 1, 16, 9]:
+            assert reader[idx] == expected[idx]
+        with pytest.raises(IndexError):
+            reader[20]
+        assert len(reader) == 20
+
+    @pytest.mark.parametrize("window_size", [2, 3, 100])
+    def test_get_rows(self, window_size):
+        data = "".join(f'Row {i},"multi\nline {i}"\n' for i in range(10))
+        expected = list(csv.reader(StringIO(data)))
+        reader = CsvSheetReader(0, None, StringIO(data), window_size=window_size)
+        assert reader.get_rows(3, 4) == expected[3:7]
+        assert reader.get_rows(0, 5) == expected[0:5]
+        assert reader.get_rows(8, 5) == expected[8:10]
+        assert reader.get_rows(10, 5) == []
+        assert reader[1] == expected[1]
+
+    def test_row_cache(self, sheet_csv):
+        reader = CsvSheetReader(0, None, sheet_csv, window_size=2, cache_size=2)
+        assert reader[0] == ["Name", "Values"]
+        assert reader[0] == ["Name", "Values"]
+        assert reader[4] == ["Fourth", "4"]
+        assert reader[3] == ["Third", "3"]
+        assert reader[0] == ["Name", "Values"]
+        assert reader.row_cache.info() == (1, 4, 2, 2)
+
+        reader.close()
+        assert reader.row_cache.info().currsize == 0
+
+    def test_reader_released(self, sheet_csv):
+        reader = CsvSheetReader(0, None, sheet_csv)
+        assert reader[1] == ["First", "1"]
+        ref = weakref.ref(reader)
+        del reader
+        gc.collect()
+        assert ref() is None
+
+    def test_row_index(self):
+        data = "".join(f'{i},"quoted\n{i}"\n' for i in range(10))
+        expected = list(csv.reader(StringIO(data)))
+        file = StringIO(data)
+        reader = CsvSheetReader(0, None, file, window_size=2, row_index_stride=3)
+        assert len(reader) == 10
+        assert len(reader.row_index) == 4
+        for checkpoint, offset in enumerate(reader.row_index[:-1]):
+            file.seek(offset)
+            assert next(csv.reader(file)) == expected[checkpoint * 3]
+
     @pytest.mark.parametrize("window_size", [2, 100])
     def test_dict_reader(self, window_size, sheet_csv):
         reader = CsvSheetReader(0, None, sheet_csv, window_size=window_size)
@@ -79,6 +171,43 @@ class TestCsvSheetReader:
         ]
 
 
+class TestCompactRows:
+    rows = [["a", "bb", ""], [], ["Žluťoučký", "kůň"], ["x"]]
+
+    def test_rows(self):
+        compact = CompactRows(self.rows)
+        assert len(compact) == 4
+        assert [list(e) for e in compact] == self.rows
+        assert compact[0] == ["a", "bb", ""]
+        assert compact[2][-1] == "kůň"
+        assert compact[0][1:] == ["bb", ""]
+        assert len(compact[1]) == 0
+        with pytest.raises(IndexError):
+            compact[0][3]
+        with pytest.raises(IndexError):
+            compact[4]
+
+    def test_drop(self):
+        compact = CompactRows(self.rows)
+        row = compact[2]
+        compact.drop(2)
+        assert len(compact) == 2
+        assert compact[0] == ["Žluťoučký", "kůň"]
+        assert row == compact[0]
+        compact.drop(10)
+        assert len(compact) == 0
+
+    def test_typed_cells(self):
+        date = datetime.datetime(2020, 1, 31)
+        row = [str(encode_typed_cell(e)) for e in ["text", 1, 2.5, date, True]]
+        compact = TypedCompactRows([row])
+        assert compact[0] == ["text", "1", "2.5", "2020-01-31 00:00:00", "True"]
+        assert [getattr(e, "value", None) for e in compact[0]] == [None, 1, 2.5, date, None]
+        assert isinstance(compact[0][1], TypedCell)
+        cell = compact[0][1]
+        assert cell.strip() is cell
+
+
 class TestJsonSheetReader:
     @pytest.mark.parametrize("window_size", [2, 100])
     def test_iteration(self, window_size, sheet_json):
@@ -288,6 +417,85 @@ class TestJsonSheetReader:
         reader = JsonCounter5SheetReader(sheet_json, window_size=window_size)
         assert len(reader) == 3
 
+    @pytest.mark.parametrize("json_backend", JSON_BACKENDS)
+    @pytest.mark.parametrize(
+        "path", ["counter/5/TR-sample.json", "counter/5/DR-d.json", "counter/51/PR_sample_r51.json"]
+    )
+    def test_json_backends(self, path, json_backend):
+        path = Path(__file__).parent / "data" / path
+        with path.open("rb") as f:
+            expected = list(JsonCounter5SheetReader(f, json_backend="ijson"))
+        with path.open("rb") as f:
+            reader = JsonCounter5SheetReader(f, json_backend=json_backend)
+            assert list(reader) == expected
+            assert len(expected) > 0
+
+    def test_unknown_json_backend(self, sheet_json):
+        with pytest.raises(ValueError):
+            JsonCounter5SheetReader(sheet_json, json_backend="unknown")
+
+    def test_release_detected(self, monkeypatch):
+        path = Path(__file__).parent / "data/counter/51/PR_sample_r51.json"
+        monkeypatch.setattr(
+            Counter5ReportBase, "fd_to_dicts", lambda *args: pytest.fail("C5 report used")
+        )
+        with path.open("rb") as f:
+            reader = JsonCounter5SheetReader(f)
+            assert reader.extra["Release"] == "5.1"
+            assert len(reader) > 0
+
+    @pytest.mark.parametrize("item_index_stride", [1, 3])
+    @pytest.mark.parametrize("window_size", [2, 100])
+    def test_random_access(self, window_size, item_index_stride, monkeypatch):
+        items = [
+            {
+                "Database": f"db{i}",
+                "Platform": "Platform",
+                "Performance": [
+                    {
+                        "Period": {"Begin_Date": "2020-01-01", "End_Date": "2020-01-31"},
+                        "Instance": [{"Metric_Type": "Searches_Regular", "Count": i + 1}],
+                    }
+                ],
+            }
+            for i in range(20)
+        ]
+        data = json.dumps(
+            {
+                "Report_Header": {"Release": "5", "Report_ID": "DR", "Report_Name": "DR"},
+                "Report_Items": items,
+            }
+        ).encode()
+
+        decoded = []
+
+        def items_counted(items):
+            def wrapper(file, prefix, *args, **kwargs):
+                for item in items(file, prefix, *args, **kwargs):
+                    if prefix.endswith("Report_Items.item"):
+                        decoded.append(item)
+                    yield item
+
+            return wrapper
+
+        # nigiri uses an ijson backend directly
+        for module in {ijson, counter5.ijson}:
+            monkeypatch.setattr(module, "items", items_counted(module.items))
+        reader = JsonCounter5SheetReader(
+            BytesIO(data),
+            window_size=window_size,
+            item_index_stride=item_index_stride,
+            json_backend="ijson",
+        )
+        for idx in [19, 0, 7, 3, 18, 4, 12, 1, 16, 9]:
+            assert reader[idx] == items[idx]
+        with pytest.raises(IndexError):
+            reader[20]
+        assert len(reader) == 20
+        assert [e["Database"] for e in itertools.islice(reader, 3)] == ["db0", "db1", "db2"]
+        # nigiri validates the report using the first item, the rest is decoded only once
+        assert len(decoded) == len(items) + 1
+
     @pytest.mark.parametrize("window_size", [2, 100])
     def test_dict_reader(self, window_size, sheet_json):
         reader = JsonCounter5SheetReader(sheet_json, window_size=window_size)
@@ -299,6 +507,157 @@ def no_io_wrapper(io):
     return io
 
 
+@pytest.mark.parametrize(
+    "data,file_format",
+    [
+        (b"a,b,c\n1,2,3\n", "csv"),
+        (b"\xef\xbb\xbf{\n", "json"),
+        (b'  {"Report_Header": {}, "Report_Items": []}', "json"),
+        (b'[{"Code": 3030}]', "json"),
+        (b'{"Release": "5"}\n{"Title": "x"}\n', "jsonl"),
+        (b'{"Release": "5"\n}\n{"Title": "x"}\n', "json"),
+        (b"PK\x03\x04...", "xlsx"),
+        (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1...", "xls"),
+    ],
+)
+def test_detect_file_format(data, file_format):
+    assert detect_file_format(data) == file_format
+
+
+@pytest.mark.parametrize(
+    "data,release",
+    [
+        (b'{"Report_Header": {"Release": "5"}, "Report_Items": []}', "5"),
+        (b'{"body": {"Report_Header": {"Release": "5.1"}}}', "5.1"),
+        (b'{"Report_Items": [{"Release": "5"}], "Report_Header": {"Release": "5"}}', None),
+        (b'[{"Code": 3030}]', None),
+        (b'{"Report_Header": {"Rele', None),
+    ],
+)
+def test_detect_counter_release(data, release):
+    file = BytesIO(data)
+    assert detect_counter_release(file) == release
+    assert file.tell() == 0
+
+
+class TestMmapCsvSheetReader:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            '\ufeffa,b\r\n"x\r\ny",2\r\n\r\nlast,"q""uote"',
+            'a;b\n\n"multi\nline\n";3\nč;ř\n',
+            "a\tb\n1\t2\n",
+            'ab"c,d\nx,y\n',
+        ],
+    )
+    def test_same_rows(self, data, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text(data, encoding="utf-8")
+        expected = CsvReader(path)[0]
+        reader = CsvReader(path, memory_map=True)[0]
+        assert isinstance(reader, MmapCsvSheetReader)
+        assert reader.dialect == expected.dialect
+        assert len(reader) == len(expected)
+        assert [list(reader[i]) for i in range(len(reader))] == [
+            list(expected[i]) for i in range(len(expected))
+        ]
+        assert reader.get_rows(1, len(reader)) == expected.get_rows(1, len(expected))
+
+    def test_random_access(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("".join(f'{i},"{i}\n{i}"\n' for i in range(1000)))
+        reader = CsvReader(path, memory_map=True)[0]
+
+        assert reader[500] == ["500", "500\n500"]
+        # offsets of rows are known only up to the requested row
+        assert len(reader.row_offsets) == 502
+        assert reader[3] == ["3", "3\n3"]
+        assert next(reader) == ["0", "0\n0"]
+        assert next(reader) == ["1", "1\n1"]
+        assert len(reader) == 1000
+        with pytest.raises(IndexError):
+            reader[1000]
+        reader.close()
+
+    @pytest.mark.parametrize(
+        "data,encoding",
+        [("a,b\nč,ř\n" * 10, "utf-16"), ("", "utf-8")],
+    )
+    def test_not_mapped(self, data, encoding, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text(data, encoding=encoding)
+        reader = CsvReader(path, memory_map=True)[0]
+        assert isinstance(reader, CsvSheetReader)
+
+
+@pytest.mark.parametrize(
+    "data,size,encoding",
+    [
+        ("a,b\nč,ř\n".encode(), None, "utf-8-sig"),
+        ("\ufeffa,b\nč,ř\n".encode(), None, "utf-8-sig"),
+        (b"a,b\n" * 100, None, "utf-8-sig"),
+        # character cut at the end of the sample
+        ("a,b\nč,ř\n".encode(), 5, "utf-8-sig"),
+        ("a,b\nč,ř\n".encode("utf-16"), None, "utf-16"),
+        # only the sample is checked
+        (("a,b\n" * 100).encode() + "č,ř\n".encode("cp1250"), 400, "utf-8-sig"),
+    ],
+)
+def test_detect_encoding(data, size, encoding):
+    file = BytesIO(data)
+    file.seek(2)
+    assert detect_encoding(file, size).lower() == encoding.lower()
+    assert file.tell() == 2
+
+
+def test_detect_dialect():
+    data = "a;b;c\n" * 10 + "a,b,c,d,e\n" * 10
+    assert detect_dialect(StringIO(data)) == "excel"
+    assert detect_dialect(StringIO(data), size=70) == "excel-semicolon"
+
+
+class _Pipe(RawIOBase):
+    """Non-seekable stream which returns at most `chunk_size` bytes at once"""
+
+    def __init__(self, data: bytes, chunk_size: int):
+        self.data = BytesIO(data)
+        self.chunk_size = chunk_size
+        self.requested = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        self.requested += 1
+        return self.data.readinto(memoryview(buffer)[: self.chunk_size])
+
+
+def test_spooled_stream():
+    data = b"".join(f"{i},line\n".encode() for i in range(1000))
+    pipe = _Pipe(data, 100)
+    stream = SpooledStream(pipe, max_size=1000)
+    assert stream.seekable()
+
+    # data are read from the pipe only when needed
+    assert stream.read(10) == data[:10]
+    assert pipe.requested == 1
+    assert stream.read(200) == data[10:100]
+    assert pipe.requested == 1
+    stream.seek(50)
+    assert stream.read(100) == data[50:100]
+    assert pipe.requested == 1
+
+    stream.seek(0)
+    assert stream.readall() == data
+    assert stream.seek(-5, 2) == len(data) - 5
+    assert stream.read() == data[-5:]
+
+    # spooled data can be read by the readers
+    reader = CsvReader(BufferedReader(SpooledStream(_Pipe(data, 100))))
+    assert list(reader[0])[998] == ["998", "line"]
+    assert reader[0][1] == ["1", "line"]
+
+
 class TestCsvReader:
     data_csv = b'a,b,c\n1,3,4\nhi,there,"how are you?"\n'
     text_csv = data_csv.decode()
@@ -332,6 +691,70 @@ class TestCsvReader:
         with pytest.raises(IndexError):
             assert sheets[0][3]
 
+    def test_bytes_not_copied(self):
+        data = "název,počet\nŽluťoučký kůň,1\n".encode() * 50000
+        tracemalloc.start()
+        try:
+            sheets = CsvReader(data)
+            assert sheets[0][99999] == ["Žluťoučký kůň", "1"]
+            assert sheets[0][0] == ["název", "počet"]
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # data are decoded incrementally
+        assert peak < len(data) / 2
+
+    def test_detection_cache(self, monkeypatch):
+        data = ("název;počet\nŽluťoučký kůň;1\n" * 100).encode("utf-16")
+        cache = {}
+        sheets = CsvReader(data, detection_cache=cache)
+        assert sheets[0][1] == ["Žluťoučký kůň", "1"]
+        assert list(cache.values()) == [("UTF-16", "excel-semicolon")]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("detection was not skipped")
+
+        monkeypatch.setattr(reader_module, "detect_file_encoding", fail)
+        monkeypatch.setattr(reader_module, "detect_csv_dialect", fail)
+        sheets = CsvReader(BytesIO(data), detection_cache=cache)
+        assert sheets[0][1] == ["Žluťoučký kůň", "1"]
+
+        # different data are detected again
+        with pytest.raises(AssertionError):
+            CsvReader(data + "x;2\n".encode("utf-16-le"), detection_cache=cache)
+
+    def test_detection_cache_size(self, monkeypatch):
+        monkeypatch.setattr(reader_module, "FINGERPRINT_SIZE", 16)
+        data = ("název;počet\n" + "a;1\n" * 100).encode()
+        other = data[:-2] + b"2\n"  # same size and beginning
+        cache = {}
+        CsvReader(data, encoding_detection_size=32, detection_cache=cache)
+        CsvReader(data, encoding_detection_size=None, detection_cache=cache)
+        # results are stored under the detection size
+        assert len(cache) == 2
+
+        # the whole file is used for the detection, so the whole file is compared
+        CsvReader(other, encoding_detection_size=None, detection_cache=cache)
+        assert len(cache) == 3
+        # bytes after the first ones used for the detection are not compared
+        CsvReader(other, encoding_detection_size=32, detection_cache=cache)
+        assert len(cache) == 3
+
+    def test_encoding_detection_size(self, monkeypatch):
+        detected = []
+
+        def detect_file_encoding(file):
+            detected.append(file.read())
+            return "cp1250"
+
+        monkeypatch.setattr(reader_module, "detect_file_encoding", detect_file_encoding)
+        data = "název,počet\nŽluťoučký kůň,1\n".encode("cp1250") * 100
+        sheets = CsvReader(BytesIO(data), encoding_detection_size=100)
+        assert sheets[0][0] == ["název", "počet"]
+        assert sheets[0][199] == ["Žluťoučký kůň", "1"]
+        # only the complete lines from the beginning are used
+        assert detected == [data[: data.rfind(b"\n", 0, 100) + 1]]
+
     @pytest.mark.parametrize(
         "io_wrapper,data",
         [
@@ -388,6 +811,26 @@ def open_file_binary(path):
     return open(path, "rb")
 
 
+class TestJsonLinesCounter5Reader:
+    data = b"""\
+{"Report_Header": {"Release": "5", "Report_ID": "DR", "Report_Name": "DR"}}
+{"Database": "db0", "Performance": []}
+
+{"Database": "db1", "Performance": [{"Instance": [{"Metric_Type": "Searches", "Count": 1.5}]}]}
+"""
+
+    def test_reader(self):
+        sheet = JsonLinesCounter5Reader(self.data)[0]
+        assert sheet.extra == {"Release": "5", "Report_ID": "DR", "Report_Name": "DR"}
+        assert len(sheet) == 2
+        assert [e["Database"] for e in sheet] == ["db0", "db1"]
+        assert sheet[1]["Performance"][0]["Instance"][0]["Count"] == Decimal("1.5")
+
+    def test_wrong_header(self):
+        with pytest.raises(SushiException):
+            JsonLinesCounter5Reader(b'{"Release": "5"}\n{"Database": "db0"}\n')
+
+
 class TestXlsxReader:
     file_path = Path(__file__).parent / "data/reader/test-simple.xlsx"
     data_list = [
@@ -417,6 +860,50 @@ class TestXlsxReader:
         for i, row in enumerate(sheets[0]):
             assert row == self.data_list[0][i]
 
+    def test_lazy_conversion(self):
+        sheets = XlsxReader(Path(__file__).parent / "data/non_counter/my-metric-based.xlsx")
+        assert [(e.sheet_idx, e.name) for e in sheets.sheet_infos()] == [
+            (0, "MY"),
+            (1, "ips_org1"),
+            (2, "ips_org2"),
+            (3, "ips_org3"),
+        ]
+        assert sheets.sheets == [None, None, None, None]
+
+        assert sheets[-2].name == "ips_org2"
+        assert sheets[2] is sheets[-2]
+        assert [e is not None for e in sheets.sheets] == [False, False, True, False]
+        assert sheets.workbook is not None
+
+        # workbook is closed once all sheets are converted
+        assert [e.name for e in sheets] == ["MY", "ips_org1", "ips_org2", "ips_org3"]
+        assert sheets.workbook is None
+
+    @pytest.mark.parametrize("io_wrapper", [no_io_wrapper, open_file_binary])
+    def test_workers(self, io_wrapper):
+        path = Path(__file__).parent / "data/non_counter/my-date-metric-based.xlsx"
+        expected = [list(e) for e in XlsxReader(path)]
+
+        sheets = XlsxReader(io_wrapper(path), workers=2)
+        sheets.prepare([0, 1])
+        assert all(isinstance(e, CsvSheetReader) for e in sheets.sheets)
+        assert sheets.workbook is None
+        assert [(e.sheet_idx, e.name) for e in sheets] == [(0, "PROD1"), (1, "PROD2")]
+        assert [list(e) for e in sheets] == expected
+
+    def test_workers_typed_cells(self):
+        path = Path(__file__).parent / "data/non_counter/my-date-metric-based.xlsx"
+
+        def typed_rows(sheets):
+            return [[[(e, getattr(e, "value", None)) for e in row] for row in e] for e in sheets]
+
+        expected = typed_rows(XlsxReader(path, typed_cells=True))
+        assert [e.value for e in XlsxReader(path, typed_cells=True)[0][1][2:]] == [1, 2, 3, 4, 5, 0]
+
+        sheets = XlsxReader(path, workers=2, typed_cells=True)
+        sheets.prepare([0, 1])
+        assert typed_rows(sheets) == expected
+
     @pytest.mark.parametrize("io_wrapper", [no_io_wrapper, open_file_binary])
     def test_dict_reader(self, io_wrapper):
         sheets = XlsxReader(io_wrapper(self.file_path))
@@ -430,6 +917,78 @@ class TestXlsxReader:
             {"a": "Extra", "b": "line", "c": "present"},
         ]
 
+    @pytest.mark.parametrize("reader_class", [XlsxReader, XlsxStreamReader])
+    def test_typed_cells(self, reader_class):
+        path = Path(__file__).parent / "data/non_counter/my-date-metric-based.xlsx"
+        expected = [list(e) for e in reader_class(path)]
+
+        sheets = reader_class(path, typed_cells=True)
+        assert [list(e) for e in sheets] == expected
+        row = sheets[0][1]
+        assert not isinstance(row[0], TypedCell)
+        assert [e.value for e in row[2:]] == [1, 2, 3, 4, 5, 0]
+
+
+def test_buffer_stream():
+    data = bytearray(b"0123456789")
+    stream = BufferStream(memoryview(data)[2:])
+    assert stream.read(3) == b"234"
+    assert stream.seek(-2, io.SEEK_END) == 6
+    assert stream.read() == b"89"
+    assert stream.read(1) == b""
+    assert stream.seek(1) == 1
+    assert BufferedReader(stream).read() == b"3456789"
+    with pytest.raises(ValueError):
+        stream.seek(-1)
+
+
+class TestXlsxStreamReader:
+    @pytest.mark.parametrize(
+        "file_path",
+        sorted((Path(__file__).parent / "data").glob("**/*.xlsx")),
+        ids=lambda e: str(e.relative_to(Path(__file__).parent / "data")),
+    )
+    def test_same_as_openpyxl(self, file_path):
+        def sheets(reader):
+            res = []
+            for sheet in reader:
+                sheet.file.seek(0)  # the file was already read by the sheet reader
+                res.append((sheet.sheet_idx, sheet.name, sheet.file.read()))
+            return res
+
+        expected = sheets(XlsxReader(file_path))
+        assert sheets(XlsxStreamReader(file_path)) == expected
+        assert all(content for _, _, content in expected)
+
+    @pytest.mark.parametrize("io_wrapper", [no_io_wrapper, open_file_binary])
+    def test_indexing(self, io_wrapper):
+        sheets = XlsxStreamReader(io_wrapper(TestXlsxReader.file_path))
+        assert [list(e) for e in sheets[0]] == TestXlsxReader.data_list[0]
+
+    def test_workers(self):
+        path = Path(__file__).parent / "data/non_counter/my-date-metric-based.xlsx"
+        expected = [list(e) for e in XlsxReader(path)]
+        assert [list(e) for e in XlsxStreamReader(path, workers=2)] == expected
+
+    def test_rows_not_accumulated(self, monkeypatch):
+        sheet_data = []
+        iterparse = xlsx_stream.iterparse
+
+        def recording_iterparse(*args, **kwargs):
+            for event, element in iterparse(*args, **kwargs):
+                if event == "start" and element.tag == xlsx_stream.SHEET_DATA_TAG:
+                    sheet_data.append(element)
+                yield event, element
+
+        monkeypatch.setattr(xlsx_stream, "iterparse", recording_iterparse)
+        archive = xlsx_stream.XlsxArchive(
+            Path(__file__).parent / "data/non_counter/my-date-metric-based.xlsx"
+        )
+        sizes = [len(sheet_data[-1]) for _ in archive.parsed_rows(0)]
+        assert len(sizes) > 10
+        # processed rows are removed from the tree
+        assert max(sizes) == 0
+
 
 class TestXlsReader:
     file_path = Path(__file__).parent / "data/reader/test-simple.xls"
@@ -443,15 +1002,29 @@ class TestXlsReader:
         ],
     ]
 
+    @pytest.mark.parametrize("workers", [None, 2])
     @pytest.mark.parametrize("io_wrapper", [no_io_wrapper, open_file_binary])
-    def test_indexing(self, io_wrapper):
-        sheets = XlsReader(io_wrapper(self.file_path))
+    def test_indexing(self, io_wrapper, workers):
+        sheets = XlsReader(io_wrapper(self.file_path), workers=workers)
         for sheet_idx, sheet in enumerate(sheets):
             for row_idx in range(len(sheet)):
                 assert sheets[sheet_idx][row_idx] == self.data_list[sheet_idx][row_idx]
         with pytest.raises(IndexError):
             assert sheets[0][row_idx + 1]
 
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_typed_cells(self, workers):
+        path = Path(__file__).parent / "data/reader/test-multi-sheet.xls"
+        sheets = XlsReader(path, workers=workers, typed_cells=True)
+        assert [sheet.name for sheet in sheets] == ["First", "Second"]
+        header, row = list(sheets[1])[:2]
+        assert [e.value for e in header[1:]] == [
+            datetime.datetime(2023, 1, 1),
+            datetime.datetime(2023, 2, 1),
+        ]
+        assert not isinstance(row[0], TypedCell)
+        assert [e.value for e in row[1:]] == [11.0, 11.5]
+
     @pytest.mark.parametrize("io_wrapper", [no_io_wrapper, open_file_binary])
     def test_iteration(self, io_wrapper):
         sheets = XlsReader(io_wrapper(self.file_path))
@@ -0,0 +1,302 @@
+import re
+
+import pytest
+
+from celus_nibbler import sources
+from celus_nibbler.coordinates import Coord, CoordRange, Direction, RelativeTo, SheetAttr, Value
+from celus_nibbler.errors import TableException
+from celus_nibbler.sources import (
+    CompiledExtractor,
+    DateSource,
+    DimensionSource,
+    ExtractionPlan,
+    ExtractParams,
+    Failure,
+    IdValidatorOptsISSN,
+    MatchExact,
+    SourceExtractor,
+    SpecialExtraction,
+    TitleIdKind,
+    TitleIdSource,
+    TitleSource,
+    ValueSource,
+    convert_numbers,
+)
+
+DATA = """\
+Title,ISSN,Value,Date
+First,1234-5678,1,2020-01
+Second,,2,2020-02
+Third,bad,x,2020-03
+,1234-5678,4,
+"""
+
+
+def extract_all(extract, count=7):
+    res = []
+    for idx in range(count):
+        try:
+            res.append(extract(idx))
+        except (TableException, IndexError) as e:
+            res.append((type(e), getattr(e, "action", None), getattr(e, "row", None)))
+    return res
+
+
+@pytest.mark.parametrize(
+    "gen_source",
+    [
+        lambda: TitleSource(CoordRange(Coord(0, 0), Direction.DOWN)),
+        lambda: TitleSource(CoordRange(Coord(0, 0), Direction.DOWN, max_count=3)),
+        lambda: TitleSource(CoordRange(Coord(3, 3), Direction.UP)),
+        lambda: TitleSource(CoordRange(Coord(2, 3), Direction.LEFT)),
+        lambda: TitleSource(CoordRange(Coord(1, 0), Direction.RIGHT)),
+        lambda: TitleSource(Coord(0, 0, RelativeTo.START)),
+        lambda: TitleSource(Value("constant")),
+        lambda: TitleSource(SheetAttr("sheet_idx")),
+        lambda: TitleSource(
+            CoordRange(Coord(0, 0), Direction.DOWN),
+            extract_params=ExtractParams(
+                regex=re.compile(r"^(\w{3})"),
+                prefix="<",
+                suffix=">",
+                max_idx=2,
+                value_overrides=[{"match": MatchExact("<Sec>"), "target": "Sec"}],
+                skip_condition=MatchExact("<Fir>"),
+            ),
+        ),
+        lambda: ValueSource(CoordRange(Coord(0, 2), Direction.DOWN)),
+        lambda: ValueSource(
+            CoordRange(Coord(0, 2), Direction.DOWN),
+            extract_params=ExtractParams(
+                on_validation_error=TableException.Action.SKIP, last_value_as_default=True
+            ),
+        ),
+        lambda: DateSource(CoordRange(Coord(0, 3), Direction.DOWN)),
+        lambda: DimensionSource(
+            "Dim",
+            CoordRange(Coord(0, 0), Direction.DOWN),
+            extract_params=ExtractParams(default="Missing"),
+        ),
+        lambda: TitleIdSource(
+            TitleIdKind.Print_ISSN,
+            CoordRange(Coord(0, 1), Direction.DOWN),
+            extract_params=ExtractParams(on_validation_error=TableException.Action.PASS),
+            validator_opts=IdValidatorOptsISSN(strict=True),
+            fallback=TitleIdSource(
+                TitleIdKind.Proprietary, CoordRange(Coord(0, 1), Direction.DOWN)
+            ),
+        ),
+    ],
+)
+def test_compiled_extractor(gen_source, csv_sheet_generator):
+    sheet = csv_sheet_generator(DATA)
+    source = gen_source()
+    expected = extract_all(
+        lambda idx: (
+            source.extract(sheet, idx, parser_row_offset=0, area_row_offset=1),
+            getattr(source, "last_key", None),
+        )
+    )
+
+    plan = ExtractionPlan(sheet, 0, 1)
+    extractor = plan.compile(gen_source())
+    assert isinstance(extractor, CompiledExtractor)
+    assert plan.compile(extractor.source) is extractor
+
+    def extract(idx):
+        plan.next_row()
+        return extractor.extract(idx), getattr(extractor, "last_key", None)
+
+    assert extract_all(extract) == expected
+
+
+def test_plan_fetches_row_once(csv_sheet_generator):
+    sheet = csv_sheet_generator(DATA)
+    fetched = []
+    get_row = sheet.get_row
+
+    def counted(item):
+        fetched.append(item)
+        return get_row(item)
+
+    sheet.get_row = counted
+    sheet.row_cache.clear()
+
+    plan = ExtractionPlan(sheet, 0, 1)
+    extractors = [
+        plan.compile(TitleSource(CoordRange(Coord(0, 0), Direction.DOWN))),
+        plan.compile(DateSource(CoordRange(Coord(0, 3), Direction.DOWN))),
+        plan.compile(ValueSource(CoordRange(Coord(0, 2), Direction.DOWN))),
+    ]
+    for idx in range(2):
+        plan.next_row()
+        for extractor in extractors:
+            extractor.extract(idx)
+    assert fetched == [1, 2]
+
+
+def test_plan_not_compiled(csv_sheet_generator):
+    sheet = csv_sheet_generator(DATA)
+    plan = ExtractionPlan(sheet, 0, None)
+    # area offset is missing
+    extractor = plan.compile(TitleSource(CoordRange(Coord(0, 0), Direction.DOWN)))
+    assert isinstance(extractor, SourceExtractor)
+    with pytest.raises(RuntimeError):
+        extractor.extract(0)
+
+
+def test_plan_fetches_rows_in_batches(csv_sheet_generator):
+    sheet = csv_sheet_generator(DATA)
+    fetched = []
+    get_rows = sheet.get_rows
+
+    def counted(start, count):
+        fetched.append((start, count))
+        return get_rows(start, count)
+
+    sheet.get_rows = counted
+
+    plan = ExtractionPlan(sheet, 0, 1)
+    title = plan.compile(TitleSource(CoordRange(Coord(0, 0), Direction.DOWN)))
+    shifted = plan.compile(TitleSource(CoordRange(Coord(1, 0), Direction.DOWN)))
+    header = plan.compile(TitleSource(CoordRange(Coord(-1, 1), Direction.RIGHT)))
+
+    plan.fetch_rows(0, 3)
+    # ranges of rows are merged
+    assert fetched == [(1, 4)]
+    assert [title.extract(idx) for idx in range(3)] == ["First", "Second", "Third"]
+    assert [shifted.extract(idx) for idx in range(2)] == ["Second", "Third"]
+    assert [header.extract(idx) for idx in range(3)] == ["ISSN", "Value", "Date"]
+
+    plan.fetch_rows(3, 3)
+    assert fetched == [(1, 4), (4, 4)]
+    with pytest.raises(TableException) as e:
+        title.extract(4)
+    assert e.value.action == TableException.Action.STOP
+
+
+@pytest.mark.skipif(sources.np is None, reason="numpy is not installed")
+def test_convert_numbers():
+    cells = ["12", "007", "", " 1", "1.5", "-3", "1,000", "12345678901234567890", "č", None]
+    assert convert_numbers(cells) == [-1] * len(cells)
+    assert convert_numbers(cells[:-2]) == [12, 7, -1, -1, -1, -1, -1, -1]
+    assert convert_numbers([]) == []
+
+
+VALUES = """\
+Title,Value
+a,1
+b,
+c,-2
+d,3.6
+e, 4
+f,1 000
+g,12345678901234567890
+h,5
+i,1,000
+"""
+
+
+@pytest.mark.skipif(sources.np is None, reason="numpy is not installed")
+@pytest.mark.parametrize(
+    "gen_source",
+    [
+        lambda: ValueSource(CoordRange(Coord(0, 1), Direction.DOWN)),
+        lambda: ValueSource(CoordRange(Coord(0, 1), Direction.DOWN), allow_negative=True),
+        lambda: ValueSource(
+            CoordRange(Coord(0, 1), Direction.DOWN),
+            extract_params=ExtractParams(on_validation_error=TableException.Action.SKIP),
+        ),
+        lambda: ValueSource(
+            CoordRange(Coord(0, 1), Direction.DOWN),
+            extract_params=ExtractParams(default=0, max_idx=6),
+        ),
+        lambda: ValueSource(
+            CoordRange(Coord(0, 1), Direction.DOWN, max_count=5),
+            extract_params=ExtractParams(
+                special_extraction=SpecialExtraction.COMMA_SEPARATED_NUMBER,
+                on_validation_error=TableException.Action.SKIP,
+            ),
+        ),
+        lambda: ValueSource(
+            CoordRange(Coord(0, 1), Direction.DOWN),
+            extract_params=ExtractParams(
+                special_extraction=SpecialExtraction.MINUTES_TO_SECONDS,
+                on_validation_error=TableException.Action.SKIP,
+            ),
+        ),
+    ],
+)
+def test_vectorized_values(gen_source, csv_sheet_generator):
+    sheet = csv_sheet_generator(VALUES)
+    source = gen_source()
+    expected = extract_all(
+        lambda idx: source.extract(sheet, idx, parser_row_offset=0, area_row_offset=1), 11
+    )
+
+    plan = ExtractionPlan(sheet, 0, 1)
+    extractor = plan.compile(gen_source())
+    plan.fetch_rows(0, 4)
+    if extractor.vectorized:
+        # numbers are converted once the first one is needed
+        assert extractor.numbers == []
+        plan.convert_numbers(0)
+        # only plain numbers are converted
+        assert extractor.numbers == [1, -1, -1, -1]
+
+    def extract(idx):
+        if idx == 4:
+            plan.fetch_rows(4, 10)
+        return extractor.extract(idx)
+
+    assert extract_all(extract, 11) == expected
+
+
+def test_not_vectorized(csv_sheet_generator, monkeypatch):
+    sheet = csv_sheet_generator(VALUES)
+    source = ValueSource(CoordRange(Coord(0, 1), Direction.DOWN))
+    assert ExtractionPlan(sheet, 0, 1).compile(source).vectorized is (sources.np is not None)
+
+    monkeypatch.setattr(sources, "np", None)
+    plan = ExtractionPlan(sheet, 0, 1)
+    extractor = plan.compile(source)
+    assert not extractor.vectorized
+    plan.fetch_rows(0, 10)
+    assert extractor.extract(0) == 1
+
+
+def test_try_extract(csv_sheet_generator, monkeypatch):
+    created = []
+    init = TableException.__init__
+
+    def counted_init(self, *args, **kwargs):
+        created.append(kwargs.get("reason"))
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(TableException, "__init__", counted_init)
+
+    sheet = csv_sheet_generator(DATA)
+    plan = ExtractionPlan(sheet, 0, 1)
+    extractor = plan.compile(
+        ValueSource(
+            CoordRange(Coord(0, 2), Direction.DOWN),
+            extract_params=ExtractParams(on_validation_error=TableException.Action.SKIP),
+        )
+    )
+    plan.fetch_rows(0, 6)
+    results = [extractor.try_extract(idx) for idx in range(6)]
+    assert results[0] == 1
+    assert results[1] == 2
+    assert results[3] == 4
+    assert all(isinstance(results[idx], Failure) for idx in (2, 4, 5))
+    assert [results[idx].action for idx in (2, 4, 5)] == [
+        TableException.Action.SKIP,
+        TableException.Action.STOP,
+        TableException.Action.STOP,
+    ]
+    # only the validation error is created, stopping doesn't need any exception
+    assert created == ["value"]
+
+    exception = results[2].exception()
+    assert (exception.row, exception.col, exception.value) == (3, 2, "x")
+    assert created == ["value"]
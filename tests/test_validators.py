@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from celus_nibbler import validators
+from celus_nibbler.reader import TypedCell
+
+VALUES = [
+    None,
+    "",
+    "  ",
+    "12",
+    " 007 ",
+    "-3",
+    "+3",
+    "3.5",
+    "1,000",
+    "1_000",
+    "1e3",
+    "nan",
+    "12345678901234567890",
+    "12345678901234567.5",
+    "٣",
+    "01:02:03",
+    "  Title   with  spaces ",
+    "1234-567x",
+    "978-3-16-148410-0",
+    "Doe (ORCID:0000-0001); Roe",
+    " 2020 ",
+    "2020-01",
+    "2020-01-15",
+    "01/02/2020",
+    "Jan 2020",
+    5,
+    -5,
+    2.5,
+    float("inf"),
+    True,
+    b"bytes",
+    TypedCell("3", 3),
+    TypedCell(" 3.5", 3.5),
+    TypedCell("x", datetime.datetime(2020, 3, 1)),
+    TypedCell("x", datetime.datetime(2020, 3, 4, 5, 6)),
+]
+
+
+def outcome(validate, value):
+    try:
+        res = validate(value)
+        return res, type(res)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        *(e for e in validators.validators if e is not validators.BaseValueModel),
+        validators.gen_default_validator(validators.Value, 0, ("", "-")),
+        validators.gen_date_format_validator("%b %Y"),
+    ],
+)
+def test_validate_fast(validator):
+    for value in VALUES:
+        expected = outcome(lambda value: validator(value=value).value, value)
+        assert outcome(lambda value: validators.validate(validator, value), value) == expected
+
+
+def test_validate_fallback():
+    # values which are not handled by fast validators are validated by pydantic
+    assert validators.validate(validators.Value, "1_000") == 1000
+    with pytest.raises(ValueError):
+        validators.Value.validate_fast("1_000")
+
+    with pytest.raises(ValidationError) as e:
+        validators.validate(validators.Metric, "12")
+    assert "cant-be-digit" in str(e.value)